@@ -1,9 +1,45 @@
 import { NextResponse } from 'next/server'
 import fs from 'fs'
 import path from 'path'
+import zlib from 'zlib'
 
-export async function GET() {
+// 按日期读取历史归档（archive/<YYYY-MM-DD>.jsonl 或 .jsonl.gz）
+function readArchive(date: string) {
+  const archiveDir = path.join(process.cwd(), 'archive')
+  const indexPath = path.join(archiveDir, 'index.json')
+  if (!fs.existsSync(indexPath)) return []
+
+  const index = JSON.parse(fs.readFileSync(indexPath, 'utf8'))
+  const entry = index.partitions?.[date]
+  if (!entry) return []
+
+  const raw = fs.readFileSync(path.join(archiveDir, entry.file))
+  const text = entry.file.endsWith('.gz') ? zlib.gunzipSync(raw).toString('utf8') : raw.toString('utf8')
+  return text
+    .split('\n')
+    .filter(line => line.trim())
+    .map(line => JSON.parse(line))
+    .sort((a, b) => (b.published || '').localeCompare(a.published || ''))
+}
+
+export async function GET(request: Request) {
   try {
+    const params = new URL(request.url).searchParams
+    const date = params.get('date')
+    if (date) {
+      if (!/^\d{4}-\d{2}-\d{2}$/.test(date)) {
+        return NextResponse.json({ error: 'Invalid date' }, { status: 400 })
+      }
+      return NextResponse.json(readArchive(date))
+    }
+
+    // 热门顺序：抓取脚本预先排好的 news-top.json
+    if (params.get('view') === 'top') {
+      const topPath = path.join(process.cwd(), 'public', 'news-top.json')
+      if (!fs.existsSync(topPath)) return NextResponse.json([])
+      return NextResponse.json(JSON.parse(fs.readFileSync(topPath, 'utf8')))
+    }
+
     // 尝试读取 news.json 文件
     const filePath = path.join(process.cwd(), 'public', 'news.json')
     
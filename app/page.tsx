@@ -15,13 +15,16 @@ interface NewsItem {
   tweet_id?: string
   retweet_count?: number
   like_count?: number
+  score?: number
+  rank?: number
+  cluster_size?: number
 }
 
 export default function Home() {
   const [news, setNews] = useState<NewsItem[]>([])
   const [filteredNews, setFilteredNews] = useState<NewsItem[]>([])
   const [loading, setLoading] = useState(true)
-  const [filter, setFilter] = useState<'all' | 'transfer' | 'twitter' | 'rss'>('all')
+  const [filter, setFilter] = useState<'all' | 'top' | 'transfer' | 'twitter' | 'rss'>('all')
   const [searchQuery, setSearchQuery] = useState('')
 
   useEffect(() => {
@@ -65,8 +68,12 @@ export default function Home() {
   useEffect(() => {
     let filtered = news
 
-    // 按类型过滤
-    if (filter === 'transfer') {
+    // 按类型过滤；热门视图直接使用抓取脚本预先计算好的 rank
+    if (filter === 'top') {
+      filtered = filtered
+        .filter(item => item.rank !== undefined)
+        .sort((a, b) => (a.rank ?? 0) - (b.rank ?? 0))
+    } else if (filter === 'transfer') {
       filtered = filtered.filter(item => item.is_transfer === true)
     } else if (filter === 'twitter') {
       filtered = filtered.filter(item => item.source?.includes('Twitter'))
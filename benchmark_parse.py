@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS 解析性能基准
+用本地生成的 Feed 对比单进程解析和进程池解析，观察随核数的扩展情况（不访问网络）
+
+用法: python3 benchmark_parse.py [Feed 数量] [每个 Feed 的条目数]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from fetch_football_news import parse_feed_compact
+
+
+def build_feed(index: int, entries: int) -> bytes:
+    """
+    生成一个模拟的 RSS Feed
+
+    Args:
+        index: Feed 序号
+        entries: 条目数
+
+    Returns:
+        RSS XML 字节
+    """
+    items = []
+    for i in range(entries):
+        items.append(f"""<item>
+<title>Arsenal complete signing of player {index}-{i} after medical</title>
+<link>https://example.com/{index}/{i}</link>
+<pubDate>Mon, 15 Dec 2025 {i % 24:02d}:{i % 60:02d}:00 GMT</pubDate>
+<description><![CDATA[<p>Club {index} confirmed the <b>deal</b> for player {i} &amp; more details.</p>]]></description>
+</item>""")
+    return f"""<?xml version="1.0"?><rss version="2.0"><channel>
+<title>Feed {index}</title>{''.join(items)}</channel></rss>""".encode('utf-8')
+
+
+def run_serial(feeds: List[bytes]) -> int:
+    """单进程依次解析，返回条目总数"""
+    return sum(len(parse_feed_compact(raw, f'Feed {i}', True)) for i, raw in enumerate(feeds))
+
+
+def run_pool(feeds: List[bytes], workers: int) -> int:
+    """进程池并行解析，返回条目总数"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(parse_feed_compact, raw, f'Feed {i}', True)
+                   for i, raw in enumerate(feeds)]
+        return sum(len(future.result()) for future in futures)
+
+
+def main():
+    """主函数"""
+    feed_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    entries = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    feeds = [build_feed(i, entries) for i in range(feed_count)]
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"Feed 数量: {feed_count}, 每个 Feed {entries} 条, CPU 核数: {cpu_count}\n")
+    print(f"{'模式':<12}{'耗时(秒)':>10}{'条目数':>10}{'加速比':>10}")
+
+    start = time.perf_counter()
+    total = run_serial(feeds)
+    baseline = time.perf_counter() - start
+    print(f"{'单进程':<12}{baseline:>10.2f}{total:>10}{1.0:>10.2f}")
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        total = run_pool(feeds, workers)
+        elapsed = time.perf_counter() - start
+        print(f"{f'进程池 x{workers}':<12}{elapsed:>10.2f}{total:>10}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+跨进程 / 跨主机共享的缓存后端
+默认使用本地 SQLite 文件；设置 CACHE_BACKEND_URL=redis://... 时使用 Redis（或兼容服务），
+多台主机和 GitHub Actions 可以共享翻译、Feed 条件请求和推文缓存，避免重复请求付费接口
+
+用法: python3 cache_backend.py            查看各命名空间的条目数
+      python3 cache_backend.py --purge    清理过期条目
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterator, Optional
+
+# 尝试导入 redis（如果可用，用于共享缓存）
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# 缓存后端地址：sqlite:///路径（默认）或 redis://主机:端口/库
+CACHE_BACKEND_URL = os.getenv('CACHE_BACKEND_URL') or 'sqlite:///cache.db'
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+class SQLiteCache:
+    """
+    本地 SQLite 缓存（默认后端）
+
+    同一台机器上的多个进程可以共享同一个文件；值以 JSON 文本保存，
+    过期时间为 Unix 时间戳（NULL 表示永不过期）。
+    """
+
+    def __init__(self, path: str = 'cache.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS cache (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            expires REAL,
+            PRIMARY KEY (namespace, key)
+        )""")
+
+    def get(self, namespace: str, key: str):
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT value FROM cache WHERE namespace = ? AND key = ? AND (expires IS NULL OR expires > ?)',
+                (namespace, key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value, ttl: Optional[float] = None):
+        expires = time.time() + ttl if ttl else None
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)',
+                              (namespace, key, json.dumps(value, ensure_ascii=False), expires))
+
+    def add(self, namespace: str, key: str, value, ttl: Optional[float] = None) -> bool:
+        """键不存在（或已过期）时写入，返回是否写入成功；在单个写事务内完成，多进程间也是原子的"""
+        now = time.time()
+        expires = now + ttl if ttl else None
+        with self.lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                self.conn.execute('DELETE FROM cache WHERE namespace = ? AND key = ? AND expires <= ?',
+                                  (namespace, key, now))
+                cursor = self.conn.execute('INSERT OR IGNORE INTO cache VALUES (?, ?, ?, ?)',
+                                           (namespace, key, json.dumps(value, ensure_ascii=False), expires))
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+        return cursor.rowcount == 1
+
+    def delete(self, namespace: str, key: str):
+        with self.lock:
+            self.conn.execute('DELETE FROM cache WHERE namespace = ? AND key = ?', (namespace, key))
+
+    def count(self, namespace: str) -> int:
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT COUNT(*) FROM cache WHERE namespace = ? AND (expires IS NULL OR expires > ?)',
+                (namespace, time.time())
+            ).fetchone()
+        return row[0]
+
+    def namespaces(self) -> Iterator[str]:
+        with self.lock:
+            rows = self.conn.execute('SELECT DISTINCT namespace FROM cache').fetchall()
+        return iter(sorted(row[0] for row in rows))
+
+    def purge(self) -> int:
+        """删除所有过期条目，返回删除的条数"""
+        with self.lock:
+            cursor = self.conn.execute('DELETE FROM cache WHERE expires <= ?', (time.time(),))
+        return cursor.rowcount
+
+
+class RedisCache:
+    """
+    Redis 缓存（需要 pip install redis，兼容 Valkey / KeyDB 等服务）
+
+    键为 "goalnews:<命名空间>:<键>"，TTL 和 set-if-absent 直接使用 Redis 的 PX / NX。
+    """
+
+    def __init__(self, url: str, prefix: str = 'goalnews'):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("使用 Redis 缓存需要先运行: pip install redis")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str):
+        value = self.client.get(self._key(namespace, key))
+        return json.loads(value) if value is not None else None
+
+    def set(self, namespace: str, key: str, value, ttl: Optional[float] = None):
+        self.client.set(self._key(namespace, key), json.dumps(value, ensure_ascii=False),
+                        px=int(ttl * 1000) if ttl else None)
+
+    def add(self, namespace: str, key: str, value, ttl: Optional[float] = None) -> bool:
+        return bool(self.client.set(self._key(namespace, key), json.dumps(value, ensure_ascii=False),
+                                    px=int(ttl * 1000) if ttl else None, nx=True))
+
+    def delete(self, namespace: str, key: str):
+        self.client.delete(self._key(namespace, key))
+
+    def count(self, namespace: str) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self._key(namespace, '*'), count=1000))
+
+    def namespaces(self) -> Iterator[str]:
+        names = {key.split(':', 2)[1] for key in self.client.scan_iter(match=f"{self.prefix}:*", count=1000)}
+        return iter(sorted(names))
+
+    def purge(self) -> int:
+        # Redis 自动清理过期键
+        return 0
+
+
+class CacheNamespace:
+    """
+    把缓存后端的一个命名空间包装成类似字典的对象
+
+    支持 in / [] / get，写入时使用命名空间的默认 TTL，
+    因此可以直接替代原来的翻译缓存字典传给 process_news_with_translation。
+    """
+
+    def __init__(self, backend, namespace: str, ttl: Optional[float] = None):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def get(self, key: str, default=None):
+        value = self.backend.get(self.namespace, key)
+        return default if value is None else value
+
+    def __contains__(self, key: str) -> bool:
+        return self.backend.get(self.namespace, key) is not None
+
+    def __getitem__(self, key: str):
+        value = self.backend.get(self.namespace, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        self.backend.set(self.namespace, key, value, self.ttl)
+
+    def __len__(self) -> int:
+        return self.backend.count(self.namespace)
+
+    def add(self, key: str, value, ttl: Optional[float] = None) -> bool:
+        """键不存在时写入（原子操作），返回是否写入成功"""
+        return self.backend.add(self.namespace, key, value, ttl or self.ttl)
+
+    def claim(self, key: str, ttl: float = 60) -> bool:
+        """
+        抢占一个键的处理权（例如即将请求付费翻译接口）
+
+        其他进程在 ttl 秒内对同一个键 claim 会失败，应改为等待结果（见 wait_for）。
+        """
+        return self.backend.add(f"{self.namespace}:claim", key, time.time(), ttl)
+
+    def release(self, key: str):
+        """释放 claim（请求失败时调用，让其他进程可以重试）"""
+        self.backend.delete(f"{self.namespace}:claim", key)
+
+    def wait_for(self, key: str, timeout: float = 10, interval: float = 0.5):
+        """等待其他进程写入结果，超时返回 None"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            value = self.backend.get(self.namespace, key)
+            if value is not None:
+                return value
+            time.sleep(interval)
+        return None
+
+
+def create_cache_backend(url: str = CACHE_BACKEND_URL):
+    """
+    根据地址创建缓存后端
+
+    Args:
+        url: sqlite:///路径、redis://... / rediss://...，或直接写 SQLite 文件路径
+
+    Returns:
+        缓存后端实例
+    """
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisCache(url)
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    return SQLiteCache(url)
+
+
+def get_cache_backend():
+    """获取进程内共享的缓存后端（首次调用时按 CACHE_BACKEND_URL 创建）"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_cache_backend(CACHE_BACKEND_URL)
+        return _backend
+
+
+def cache_namespace(namespace: str, ttl: Optional[float] = None) -> CacheNamespace:
+    """
+    获取共享缓存后端中的一个命名空间
+
+    Args:
+        namespace: 命名空间（如 'translation' / 'feed' / 'tweets'）
+        ttl: 默认过期时间（秒），None 表示永不过期
+
+    Returns:
+        CacheNamespace
+    """
+    return CacheNamespace(get_cache_backend(), namespace, ttl)
+
+
+if __name__ == '__main__':
+    backend = get_cache_backend()
+    print(f"缓存后端: {CACHE_BACKEND_URL}")
+    if '--purge' in sys.argv:
+        print(f"已清理 {backend.purge()} 条过期条目")
+    for name in backend.namespaces():
+        print(f"  {name}: {backend.count(name)} 条")
@@ -1,8 +1,8 @@
 'use client'
 
 interface FilterBarProps {
-  filter: 'all' | 'transfer' | 'twitter' | 'rss'
-  onFilterChange: (filter: 'all' | 'transfer' | 'twitter' | 'rss') => void
+  filter: 'all' | 'top' | 'transfer' | 'twitter' | 'rss'
+  onFilterChange: (filter: 'all' | 'top' | 'transfer' | 'twitter' | 'rss') => void
   searchQuery: string
   onSearchChange: (query: string) => void
 }
@@ -10,6 +10,7 @@ interface FilterBarProps {
 export default function FilterBar({ filter, onFilterChange, searchQuery, onSearchChange }: FilterBarProps) {
   const filters = [
     { id: 'all' as const, label: '全部', icon: '📰' },
+    { id: 'top' as const, label: '热门', icon: '🔥' },
     { id: 'transfer' as const, label: '转会', icon: '🚨' },
     { id: 'twitter' as const, label: '推文', icon: '🐦' },
     { id: 'rss' as const, label: 'RSS', icon: '📡' },
@@ -4,12 +4,17 @@ interface NewsItem {
   source: string
   title: string
   title_cn?: string
+  summary?: string
+  summary_cn?: string
   link: string
   published: string
   is_transfer?: boolean
   tweet_id?: string
   retweet_count?: number
   like_count?: number
+  score?: number
+  rank?: number
+  cluster_size?: number
 }
 
 interface NewsCardProps {
@@ -78,6 +83,11 @@ export default function NewsCard({ item }: NewsCardProps) {
                 <span>转会</span>
               </span>
             )}
+            {(item.cluster_size ?? 1) > 1 && (
+              <span className="text-xs text-dark-text-secondary font-medium px-2 py-1 bg-dark-surface/30 rounded-lg">
+                {item.cluster_size} 家报道
+              </span>
+            )}
             <span className="text-xs text-dark-text-muted font-medium px-2 py-1 bg-dark-surface/30 rounded-lg">
               {formatDate(item.published)}
             </span>
@@ -95,6 +105,13 @@ export default function NewsCard({ item }: NewsCardProps) {
             </p>
           )}
 
+          {/* 摘要（摘要模式下才有） */}
+          {(item.summary_cn || item.summary) && (
+            <p className="text-sm text-dark-text-muted mt-2 leading-relaxed line-clamp-3">
+              {item.summary_cn || item.summary}
+            </p>
+          )}
+
           {/* Twitter 互动数据 */}
           {isTwitter && (retweetCount > 0 || likeCount > 0) && (
             <div className="flex items-center gap-4 mt-4 pt-3 border-t border-dark-border/30">
@@ -6,15 +6,29 @@
 使用 OpenAI API 翻译标题并调整转会新闻的语气
 """
 
+import base64
 import feedparser
+import glob
+import gzip
+import hashlib
+import html
 import json
+import math
 import os
+import re
 import time
+import threading
 import requests
-from datetime import datetime
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FuturesTimeout, wait
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Optional
+from urllib.parse import urlsplit
 from openai import OpenAI
 
+from cache_backend import CacheNamespace, cache_namespace
+from news_archive import ARCHIVE_DIR, archive_news, parse_published
+from run_profiler import pause, profile_span, start_profiling, stop_profiling
+
 # 尝试导入 snscrape（如果可用）
 try:
     import snscrape.modules.twitter as sntwitter
@@ -23,6 +37,13 @@ except ImportError:
     SNSCRAPE_AVAILABLE = False
     print("⚠️  snscrape 未安装，将使用 RapidAPI 作为替代方案")
 
+# 尝试导入 brotli（如果可用，用于输出 .br 预压缩文件）
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # 尝试导入免费翻译库（如果可用）
 try:
     from deep_translator import GoogleTranslator
@@ -64,14 +85,220 @@ JOURNALISTS = {
     'Romano Fabrizio': 'FabrizioRomano',  # 备用
 }
 
+# 阿森纳相关关键词
+ARSENAL_KEYWORDS = [
+    'arsenal', 'gunners', 'emirates', 'arteta', 'saka', 'odegaard',
+    'martinelli', 'jesus', 'saliba', 'white', 'ramsdale', '阿森纳'
+]
+
+# 各球队的关键词，供新闻源配置中的 clubs 过滤使用
+CLUB_KEYWORDS = {
+    'arsenal': ARSENAL_KEYWORDS,
+}
+
+# 新闻源配置文件（见 sources.json.example），以及记录各源抓取状态的文件
+SOURCES_FILE = os.getenv('SOURCES_FILE', 'sources.json')
+SOURCE_STATE_FILE = 'source_state.json'
+
+# 新闻源默认设置：poll_interval 单位为分钟（0 表示每轮都抓取），timeout 单位为秒
+DEFAULT_SOURCE_SETTINGS = {
+    'enabled': True,
+    'poll_interval': 0,
+    'timeout': 15,
+    'max_items': None,
+    'priority': 0,
+    'clubs': [],
+    'weight': 1.0,
+}
+
+# 同时下载的新闻源数量上限
+FETCH_CONCURRENCY = int(os.getenv('FETCH_CONCURRENCY', '8'))
+
+# 优先通道跟踪的记者（Twitter 用户名），其推文与转会新闻一起优先翻译和发布
+PRIORITY_JOURNALISTS = ['FabrizioRomano', 'David_Ornstein']
+
+# 判断是否是转会新闻的关键词
+TRANSFER_KEYWORDS = [
+    'transfer', 'sign', 'signing', 'deal', 'move', 'join', 'leave',
+    'departure', 'arrival', 'agreement', 'contract', 'loan', 'permanent',
+    'here we go', 'medical', 'completed', 'announced', 'confirmed'
+]
+
+# 目标语言配置：输出字段、各翻译服务的语言代码、提示词中的语言名称，
+# 以及转会新闻提示词中该语言的激动人心的表达示例
+# zh-CN 沿用 title_cn 字段，保持网站兼容
+LANGUAGES = {
+    'zh-CN': {'field': 'title_cn', 'summary_field': 'summary_cn',
+              'google': 'zh-CN', 'deepl': 'zh', 'libre': 'zh', 'name': '中文',
+              'transfer_phrases': '"重磅！"、"官宣！"'},
+    'ja': {'field': 'title_ja', 'summary_field': 'summary_ja',
+           'google': 'ja', 'deepl': 'ja', 'libre': 'ja', 'name': '日语',
+           'transfer_phrases': '"速報！"、"正式決定！"'},
+    'ko': {'field': 'title_ko', 'summary_field': 'summary_ko',
+           'google': 'ko', 'deepl': 'ko', 'libre': 'ko', 'name': '韩语',
+           'transfer_phrases': '"속보!"、"오피셜!"'},
+    'es': {'field': 'title_es', 'summary_field': 'summary_es',
+           'google': 'es', 'deepl': 'es', 'libre': 'es', 'name': '西班牙语',
+           'transfer_phrases': '"¡Bombazo!"、"¡Oficial!"'},
+}
+DEFAULT_LANGUAGE = 'zh-CN'
+
+# 旧版翻译缓存文件（首次使用共享缓存后端时导入）
+TRANSLATION_CACHE_FILE = 'translation_cache.json'
+
+# 共享缓存（见 cache_backend.py）的过期时间（秒）
+# 翻译缓存默认永不过期；Feed 条件请求信息保留 7 天；
+# FEED_CACHE_FRESH 秒内其他进程/主机抓取过的 Feed 直接复用，不再请求；推文缓存默认 5 分钟
+TRANSLATION_CACHE_TTL = float(os.getenv('TRANSLATION_CACHE_TTL', '0')) or None
+FEED_CACHE_TTL = 7 * 24 * 3600
+FEED_CACHE_FRESH = float(os.getenv('FEED_CACHE_FRESH', '0'))
+TWEET_CACHE_TTL = float(os.getenv('TWEET_CACHE_TTL', '300'))
+
+# 付费翻译请求的抢占时间（秒）：其他进程在此期间等待结果，不重复请求
+TRANSLATION_CLAIM_TTL = 60
+
+# 批量抓取推文：用一次搜索请求（from:a OR from:b ...）覆盖多位记者，再按作者拆分
+# 搜索语句有长度限制，每批最多 TWEET_BULK_BATCH_SIZE 位记者
+TWEET_BULK_BATCH_SIZE = int(os.getenv('TWEET_BULK_BATCH_SIZE', '10'))
+TWEET_BULK_CONFIGS = [
+    {
+        'name': 'Twitter API 45 search',
+        'url': 'https://twitter-api45.p.rapidapi.com/search.php',
+        'host': 'twitter-api45.p.rapidapi.com',
+        'query_param': 'query',
+        'count_param': 'count',  # 不指定时只返回一页（约 20 条），不够覆盖多位记者
+        'params': {'search_type': 'Latest'},
+        'parse_key': 'timeline'
+    },
+]
+
+# 网站使用的新闻文件，以及记录其内容哈希的文件（用于跳过未变化的发布）
+PUBLIC_NEWS_FILE = 'public/news.json'
+PUBLIC_HASH_FILE = 'public/news.hash'
+
+# 不计入内容哈希的字段：互动数和由它们算出的热门分数每轮都在变，只有这些变化时不重新发布
+HASH_VOLATILE_FIELDS = ('like_count', 'retweet_count', 'score', 'rank')
+
+# news.json 保留的最新新闻条数（更早的新闻可以通过归档按日期读取）
+NEWS_MAX_ITEMS = int(os.getenv('NEWS_MAX_ITEMS', '300'))
+
+# 热门排序：分数半衰期（小时）、各项加分、同题报道判定阈值，以及 news-top.json 的条数
+# 同题报道需要标题关键词和专有名词（球队、球员等大写开头的词）都足够相似
+PUBLIC_TOP_FILE = 'public/news-top.json'
+RANK_HALF_LIFE_HOURS = float(os.getenv('RANK_HALF_LIFE_HOURS', '6'))
+RANK_ENGAGEMENT_WEIGHT = 0.5
+RANK_TRANSFER_BOOST = 1.5
+RANK_CLUSTER_WEIGHT = 1.0
+RANK_CLUSTER_SIMILARITY = 0.6
+RANK_ENTITY_SIMILARITY = 0.5
+RANK_TOP_ITEMS = int(os.getenv('RANK_TOP_ITEMS', '50'))
+RANK_STOPWORDS = {
+    'the', 'and', 'for', 'with', 'after', 'from', 'over', 'into', 'has', 'have', 'his', 'her',
+    'will', 'are', 'was', 'that', 'this', 'says', 'say', 'new', 'more', 'than', 'not',
+}
+
+# 进程池解析结果的字段顺序（每条新闻用元组传回主进程）
+COMPACT_FIELDS = ('title', 'link', 'published', 'published_raw', 'summary', 'is_transfer')
+
+# 摘要最大长度（字符），以及单次翻译请求的最大文本长度
+SUMMARY_MAX_LENGTH = int(os.getenv('SUMMARY_MAX_LENGTH', '500'))
+TRANSLATION_CHUNK_SIZE = 1500
+
+# 翻译路由：推文点赞数 + 转发数达到该阈值时走 OpenAI
+ROUTER_ENGAGEMENT_THRESHOLD = int(os.getenv('ROUTER_ENGAGEMENT_THRESHOLD', '1000'))
 
-def parse_feed(url: str, source: str) -> List[Dict]:
+# gpt-4o-mini 价格（美元 / 百万 tokens），用于估算每轮费用
+OPENAI_PRICING = {'input': 0.15, 'output': 0.60}
+
+# 多个翻译线程共享 OpenAI 预算时使用的锁
+openai_budget_lock = threading.Lock()
+
+# 运行报告文件：记录各阶段耗时以及哪些阶段因超出时间预算被截断
+RUN_REPORT_FILE = 'run_report.json'
+
+# 截止时间之后，仍在进行中的请求最多再等待的秒数，超过视为卡住
+STAGE_GRACE_SECONDS = 2
+
+# 服务地址覆盖（指向 mock_providers.py 等本地模拟服务做压测）
+# FEED_BASE_URL / RAPIDAPI_BASE_URL 只替换协议和主机，保留原路径；
+# TRANSLATOR_BASE_URL 设置后免费翻译统一走该 LibreTranslate 兼容接口
+FEED_BASE_URL = os.getenv('FEED_BASE_URL')
+RAPIDAPI_BASE_URL = os.getenv('RAPIDAPI_BASE_URL')
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')
+TRANSLATOR_BASE_URL = os.getenv('TRANSLATOR_BASE_URL')
+
+# 设置了任一地址覆盖时视为压测运行：共享缓存使用单独的命名空间，
+# 不写 translation_cache.json、source_state.json，也不发布到 public/
+BASE_URL_OVERRIDES = [url for url in (FEED_BASE_URL, RAPIDAPI_BASE_URL, OPENAI_BASE_URL, TRANSLATOR_BASE_URL) if url]
+
+
+def clean_summary(raw: str, max_length: int = SUMMARY_MAX_LENGTH) -> str:
+    """
+    清理 RSS 摘要：去掉 HTML 标签和实体，合并空白，并截断到指定长度
+    
+    Args:
+        raw: 原始 summary/description（可能包含 HTML）
+        max_length: 最大长度（字符）
+    
+    Returns:
+        清理后的纯文本摘要
+    """
+    if not raw:
+        return ''
+    text = re.sub(r'<(script|style)[^>]*>.*?</\1>', ' ', raw, flags=re.S | re.I)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = html.unescape(text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    
+    if len(text) > max_length:
+        # 尽量在单词边界截断
+        cut = text[:max_length].rsplit(' ', 1)[0] or text[:max_length]
+        text = cut.rstrip(' ,;:') + '…'
+    return text
+
+
+def split_text_chunks(text: str, max_chars: int = TRANSLATION_CHUNK_SIZE) -> List[str]:
+    """
+    将长文本按句子切分成不超过 max_chars 的片段，保证单次翻译请求不超限
+    
+    Args:
+        text: 原始文本
+        max_chars: 每个片段的最大长度
+    
+    Returns:
+        文本片段列表
+    """
+    chunks = []
+    current = ''
+    for sentence in re.split(r'(?<=[.!?])\s+', text.strip()):
+        # 超长句子直接硬切
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def parse_feed(url: str, source: str, include_summary: bool = False,
+               item_filter: Optional[Dict] = None, since: Optional[datetime] = None) -> List[Dict]:
     """
     解析 RSS Feed 并提取新闻信息
     
     Args:
         url: RSS Feed URL
         source: 新闻来源名称
+        include_summary: 是否提取并清理摘要（summary/description）
+        item_filter: 过滤规格（见 build_item_filter），不满足的条目在解析时直接丢弃
+        since: 该源的高水位（上一轮见到的最新发布时间，UTC），遇到更早的条目即停止
     
     Returns:
         包含新闻信息的字典列表
@@ -79,8 +306,15 @@ def parse_feed(url: str, source: str) -> List[Dict]:
     try:
         feed = feedparser.parse(url)
         news_items = []
+        cutoff = fetch_cutoff(since, item_filter)
+        
+        # 提前停止依赖时间倒序；少数按时间正序输出的 Feed 反过来遍历
+        entries = feed.entries
+        if cutoff and len(entries) > 1 and entries[0].get('published_parsed') and \
+                entries[-1].get('published_parsed') and entries[0].published_parsed < entries[-1].published_parsed:
+            entries = entries[::-1]
         
-        for entry in feed.entries:
+        for entry in entries:
             # 提取标题
             title = entry.get('title', '无标题')
             
@@ -110,6 +344,19 @@ def parse_feed(url: str, source: str) -> List[Dict]:
                 'published_raw': entry.get('published', '')
             }
             
+            # Feed 按时间倒序排列，到达高水位或超过最大时效后的条目都是旧的
+            if is_before_cutoff(news_item, cutoff):
+                break
+            
+            # 尽早过滤，被丢弃的条目不再做摘要清理、翻译和序列化
+            if not item_matches(news_item, item_filter):
+                continue
+            
+            if include_summary:
+                summary = clean_summary(entry.get('summary') or entry.get('description', ''))
+                if summary and summary != title:
+                    news_item['summary'] = summary
+            
             news_items.append(news_item)
         
         return news_items
@@ -119,48 +366,767 @@ def parse_feed(url: str, source: str) -> List[Dict]:
         return []
 
 
-def fetch_all_news(filter_arsenal: bool = False) -> List[Dict]:
+def override_base_url(url: str, base_url: Optional[str]) -> str:
+    """
+    把 URL 的协议和主机替换为 base_url（保留路径和查询参数）
+    
+    Args:
+        url: 原始地址
+        base_url: 替换用的地址（为空时原样返回）
+    
+    Returns:
+        替换后的地址
+    """
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    return base_url.rstrip('/') + parts.path + (f"?{parts.query}" if parts.query else '')
+
+
+def shared_cache(namespace: str, ttl: Optional[float] = None) -> Optional[CacheNamespace]:
+    """
+    获取共享缓存的一个命名空间（见 cache_backend.py）
+    
+    Args:
+        namespace: 命名空间
+        ttl: 默认过期时间（秒）
+    
+    Returns:
+        CacheNamespace，缓存后端不可用时返回 None（抓取和翻译照常进行）
+    """
+    # 压测运行的结果（模拟译文、推文等）放在按覆盖地址区分的命名空间里，不污染正式缓存
+    if BASE_URL_OVERRIDES:
+        namespace += '@' + hashlib.sha1('|'.join(BASE_URL_OVERRIDES).encode('utf-8')).hexdigest()[:8]
+    try:
+        return cache_namespace(namespace, ttl)
+    except Exception as e:
+        print(f"⚠️  缓存后端不可用，不使用共享缓存: {e}")
+        return None
+
+
+def fetch_feed_bytes(url: str, timeout: int = 15) -> bytes:
+    """
+    下载 RSS Feed 原始内容（不解析）
+    
+    使用共享缓存中保存的 ETag / Last-Modified 发起条件请求，返回 304 时
+    复用缓存的内容；FEED_CACHE_FRESH 秒内其他进程抓取过的 Feed 直接复用。
+    
+    Args:
+        url: RSS Feed URL
+        timeout: 超时时间（秒）
+    
+    Returns:
+        原始字节，失败时返回空字节串
+    """
+    url = override_base_url(url, FEED_BASE_URL)
+    feed_cache = shared_cache('feed', FEED_CACHE_TTL)
+    entry = feed_cache.get(url) if feed_cache is not None else None
+    if entry and FEED_CACHE_FRESH and time.time() - entry['fetched'] < FEED_CACHE_FRESH:
+        return base64.b64decode(entry['body'])
+    
+    headers = {'User-Agent': 'GoalNews/1.0'}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    try:
+        response = requests.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry:
+            entry['fetched'] = time.time()
+            feed_cache[url] = entry
+            return base64.b64decode(entry['body'])
+        if response.status_code == 200:
+            if feed_cache is not None:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified or FEED_CACHE_FRESH:
+                    feed_cache[url] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'fetched': time.time(),
+                        'body': base64.b64encode(response.content).decode('ascii'),
+                    }
+            return response.content
+        print(f"  ❌ 下载 {url} 失败，状态码: {response.status_code}")
+    except Exception as e:
+        print(f"  ❌ 下载 {url} 时出错: {e}")
+    return b''
+
+
+def parse_feed_compact(raw: bytes, source: str, include_summary: bool = False,
+                       item_filter: Optional[Dict] = None, clubs: Optional[List[str]] = None,
+                       max_items: Optional[int] = None, since: Optional[datetime] = None) -> List[tuple]:
+    """
+    在子进程中解析并分类一个 Feed，返回紧凑的元组列表（字段顺序见 COMPACT_FIELDS）
+    
+    元组比字典小得多，跨进程传回时序列化开销更低。
+    
+    Args:
+        raw: Feed 原始字节
+        source: 新闻来源名称
+        include_summary: 是否提取摘要
+        item_filter: 过滤规格（见 build_item_filter）
+        clubs: 该新闻源配置的球队过滤
+        max_items: 该新闻源最多保留的条数
+        since: 该新闻源的高水位
+    
+    Returns:
+        (title, link, published, published_raw, summary, is_transfer) 元组列表
+    """
+    news_items = parse_feed(raw, source, include_summary=include_summary, item_filter=item_filter, since=since)
+    news_items = filter_by_clubs(news_items, clubs)
+    if max_items:
+        news_items = news_items[:max_items]
+    return [(item['title'], item['link'], item['published'], item['published_raw'],
+             item.get('summary', ''), is_transfer_title(item['title'])) for item in news_items]
+
+
+def expand_compact_rows(source: str, rows: List[tuple]) -> List[Dict]:
+    """
+    把 parse_feed_compact 的结果还原成新闻字典
+    
+    Args:
+        source: 新闻来源名称
+        rows: 紧凑元组列表
+    
+    Returns:
+        新闻列表
+    """
+    news_items = []
+    for row in rows:
+        news_item = {'source': source}
+        news_item.update(zip(COMPACT_FIELDS, row))
+        if not news_item['summary']:
+            del news_item['summary']
+        news_items.append(news_item)
+    return news_items
+
+
+def fetch_all_news_parallel(sources: List[Dict], item_filter: Optional[Dict] = None,
+                            include_summary: bool = False, parse_workers: int = 2,
+                            since_marks: Optional[Dict[str, str]] = None,
+                            stage: Optional[Dict] = None) -> List[Dict]:
+    """
+    抓取所有 RSS Feed：线程池并发下载原始内容，进程池并行解析和分类
+    
+    Feed 数量很多时，feedparser 解析、日期处理和关键词分类都是 CPU 密集的，
+    放在进程池里可以绕开 GIL，按核数扩展。
+    
+    Args:
+        sources: 新闻源配置列表（见 load_source_registry）
+        item_filter: 过滤规格（见 build_item_filter），在子进程解析时应用
+        include_summary: 是否提取新闻摘要
+        parse_workers: 解析进程数
+        since_marks: 各新闻源的高水位 {源名称: ISO 时间}
+        stage: 阶段记录（见 start_stage），超时未下载完的源记入 skipped
+    
+    Returns:
+        所有新闻的列表
+    """
+    # 下载线程数按本轮需要抓取的源数量确定，不超过 FETCH_CONCURRENCY
+    fetch_workers = max(1, min(FETCH_CONCURRENCY, len(sources)))
+    print(f"并行抓取 {len(sources)} 个 RSS Feed（下载线程 {fetch_workers}，解析进程 {parse_workers}）...")
+    
+    # 到截止时间仍未下载完的源直接放弃，不等待卡住的连接
+    def download(source: Dict) -> bytes:
+        with profile_span(f"fetch/{source['name']}"):
+            return fetch_feed_bytes(source['url'], stage_timeout(source['timeout'], stage))
+    
+    executor = ThreadPoolExecutor(max_workers=fetch_workers)
+    futures = [executor.submit(download, source) for source in sources]
+    done, _ = wait(futures, timeout=stage_remaining(stage))
+    executor.shutdown(wait=False, cancel_futures=True)
+    raw_feeds = [future.result() if future in done else b'' for future in futures]
+    skipped = [source['name'] for source, future in zip(sources, futures) if future not in done]
+    if stage is not None and skipped:
+        stage.update(cut_short=True, skipped=skipped)
+        print(f"⏱️  抓取超时，放弃 {len(skipped)} 个新闻源: {', '.join(skipped)}")
+    
+    all_news = []
+    since_marks = since_marks or {}
+    fetched = [(source, raw) for source, raw in zip(sources, raw_feeds) if raw]
+    with ProcessPoolExecutor(max_workers=max(1, parse_workers)) as executor:
+        futures = [
+            executor.submit(parse_feed_compact, raw, source['name'], include_summary, item_filter,
+                            source['clubs'], source['max_items'], parse_published(since_marks.get(source['name'])))
+            for source, raw in fetched
+        ]
+        for (source, _), future in zip(fetched, futures):
+            news_items = expand_compact_rows(source['name'], future.result())
+            all_news.extend(news_items)
+            print(f"从 {source['name']} 获取了 {len(news_items)} 条新闻")
+    
+    # 按发布时间排序（最新的在前）
+    all_news.sort(key=published_sort_key, reverse=True)
+    
+    return all_news
+
+
+def fetch_all_news(filter_arsenal: bool = False, include_summary: bool = False,
+                   parse_workers: int = 0, sources: Optional[List[Dict]] = None,
+                   item_filter: Optional[Dict] = None,
+                   since_marks: Optional[Dict[str, str]] = None,
+                   stage: Optional[Dict] = None) -> List[Dict]:
     """
     抓取所有 RSS Feed 的新闻
     
+    过滤条件下推到解析阶段：不满足条件的条目在解析时就被丢弃，
+    只按来源过滤时整个源都不会被下载。
+    
     Args:
-        filter_arsenal: 是否只抓取阿森纳相关新闻
+        filter_arsenal: 是否只抓取阿森纳相关新闻（未传 item_filter 时生效）
+        include_summary: 是否提取新闻摘要
+        parse_workers: 解析进程数，大于 0 时使用进程池并行解析（见 fetch_all_news_parallel）
+        sources: 要抓取的新闻源配置，默认为配置文件中所有启用的 Feed
+        item_filter: 过滤规格（见 build_item_filter / item_filter_from_env）
+        since_marks: 各新闻源的高水位 {源名称: ISO 时间}，解析到更早的条目即停止（见 update_since_marks）
+        stage: 阶段记录（见 start_stage），超出时间预算后剩余的源不再抓取，记入 skipped
     
     Returns:
         所有新闻的列表
     """
+    if sources is None:
+        sources = [source for source in load_source_registry()['feeds'] if source['enabled']]
+    if item_filter is None and filter_arsenal:
+        item_filter = build_item_filter(clubs=['arsenal'])
+    
+    # 来源条件直接作用于新闻源，不需要的源不下载
+    if item_filter and item_filter.get('sources'):
+        sources = [source for source in sources
+                   if match_sources({'source': source['name']}, item_filter['sources'])]
+    
+    if parse_workers > 0:
+        return fetch_all_news_parallel(sources, item_filter, include_summary, parse_workers, since_marks, stage)
+    
     all_news = []
+    since_marks = since_marks or {}
+    skipped = []
     
-    # 阿森纳相关关键词
-    arsenal_keywords = [
-        'arsenal', 'gunners', 'emirates', 'arteta', 'saka', 'odegaard',
-        'martinelli', 'jesus', 'saliba', 'white', 'ramsdale', '阿森纳'
-    ]
-    
-    for source, url in RSS_FEEDS.items():
-        print(f"正在抓取 {source} 的新闻...")
-        news_items = parse_feed(url, source)
-        
-        # 如果设置了过滤，只保留阿森纳相关新闻
-        if filter_arsenal:
-            filtered_items = []
-            for item in news_items:
-                title_lower = item.get('title', '').lower()
-                if any(keyword in title_lower for keyword in arsenal_keywords):
-                    filtered_items.append(item)
-            news_items = filtered_items
-            print(f"  过滤后阿森纳相关新闻: {len(news_items)} 条")
+    for source in sources:
+        if stage_expired(stage):
+            skipped.append(source['name'])
+            continue
+        print(f"正在抓取 {source['name']} 的新闻...")
+        with profile_span(f"fetch/{source['name']}"):
+            raw = fetch_feed_bytes(source['url'], stage_timeout(source['timeout'], stage))
+            news_items = parse_feed(raw, source['name'], include_summary=include_summary, item_filter=item_filter,
+                                    since=parse_published(since_marks.get(source['name']))) if raw else []
+        
+        # 新闻源配置的球队过滤和条数上限
+        news_items = filter_by_clubs(news_items, source['clubs'])
+        if source['max_items']:
+            news_items = news_items[:source['max_items']]
+        
+        # 与进程池解析（parse_feed_compact）一样在抓取阶段完成转会分类，两条路径的输出一致
+        for item in news_items:
+            item['is_transfer'] = is_transfer_title(item['title'])
         
         all_news.extend(news_items)
-        print(f"从 {source} 获取了 {len(news_items)} 条新闻\n")
+        print(f"从 {source['name']} 获取了 {len(news_items)} 条新闻\n")
+    
+    if stage is not None and skipped:
+        stage.update(cut_short=True, skipped=skipped)
+        print(f"⏱️  抓取超时，跳过 {len(skipped)} 个新闻源: {', '.join(skipped)}")
     
     # 按发布时间排序（最新的在前）
-    all_news.sort(key=lambda x: x.get('published', ''), reverse=True)
+    all_news.sort(key=published_sort_key, reverse=True)
     
     return all_news
 
 
-def translate_title_free(title: str, is_transfer: bool = False, translator_type: str = 'google') -> Dict[str, str]:
+def is_transfer_title(title: str) -> bool:
+    """
+    根据关键词判断标题是否为转会新闻
+    
+    Args:
+        title: 原始英文标题
+    
+    Returns:
+        是否为转会新闻
+    """
+    title_lower = title.lower()
+    return any(keyword in title_lower for keyword in TRANSFER_KEYWORDS)
+
+
+def load_source_registry(filename: str = SOURCES_FILE) -> Dict[str, List[Dict]]:
+    """
+    读取新闻源配置
+    
+    配置文件格式见 sources.json.example；文件不存在时使用内置的 RSS_FEEDS 和 JOURNALISTS。
+    每个源都会补齐 DEFAULT_SOURCE_SETTINGS 中的默认设置，并转换为正确的类型。
+    
+    Args:
+        filename: 配置文件路径
+    
+    Returns:
+        {'feeds': [...], 'journalists': [...]}，各自按优先级从高到低排列
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except OSError:
+        config = {
+            'feeds': [{'name': name, 'url': url} for name, url in RSS_FEEDS.items()],
+            'journalists': [{'name': name, 'username': username} for name, username in JOURNALISTS.items()],
+        }
+    except ValueError as e:
+        raise ValueError(f"新闻源配置 {filename} 格式错误: {e}")
+    
+    registry = {}
+    for kind, required in (('feeds', 'url'), ('journalists', 'username')):
+        entries = []
+        for entry in config.get(kind, []):
+            if not entry.get('name') or not entry.get(required):
+                print(f"⚠️  忽略缺少 name/{required} 的新闻源配置: {entry}")
+                continue
+            source = dict(DEFAULT_SOURCE_SETTINGS)
+            source.update(entry)
+            entries.append(normalize_source_settings(source))
+        entries.sort(key=lambda x: x['priority'], reverse=True)
+        registry[kind] = entries
+    return registry
+
+
+def normalize_source_settings(source: Dict) -> Dict:
+    """
+    把新闻源设置转换为 DEFAULT_SOURCE_SETTINGS 中对应的类型（如 "timeout": "20" → 20.0）
+    
+    null 或无法转换的值改用默认值，并打印警告。
+    
+    Args:
+        source: 新闻源配置（原地修改）
+    
+    Returns:
+        同一个配置
+    """
+    for key, default in DEFAULT_SOURCE_SETTINGS.items():
+        value = source.get(key)
+        if value is None:
+            source[key] = default
+            continue
+        try:
+            if key == 'enabled':
+                value = value if isinstance(value, bool) else str(value).strip().lower() in ('true', '1', 'yes')
+            elif key == 'clubs':
+                value = [value] if isinstance(value, str) else [str(club) for club in value]
+            elif key == 'max_items':
+                value = int(value)
+            else:
+                value = float(value)
+        except (TypeError, ValueError):
+            print(f"⚠️  新闻源 {source.get('name')} 的 {key} 设置无效（{value!r}），使用默认值 {default!r}")
+            value = default
+        source[key] = value
+    return source
+
+
+def load_source_state(filename: str = SOURCE_STATE_FILE) -> Dict[str, Dict]:
+    """
+    读取各新闻源的运行状态（上次抓取时间等）
+    
+    Args:
+        filename: 状态文件路径
+    
+    Returns:
+        {源名称: 状态字典}
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_source_state(state: Dict[str, Dict], filename: str = SOURCE_STATE_FILE):
+    """
+    保存各新闻源的运行状态
+    
+    Args:
+        state: 状态字典
+        filename: 状态文件路径
+    """
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"⚠️  保存新闻源状态失败: {e}")
+
+
+def is_source_due(source: Dict, state: Dict[str, Dict], now: Optional[datetime] = None) -> bool:
+    """
+    判断新闻源本轮是否需要抓取（距上次抓取已超过 poll_interval 分钟）
+    
+    Args:
+        source: 新闻源配置
+        state: 运行状态
+        now: 当前时间
+    
+    Returns:
+        是否需要抓取
+    """
+    if not source.get('poll_interval'):
+        return True
+    last_fetched = state.get(source['name'], {}).get('last_fetched')
+    if not last_fetched:
+        return True
+    try:
+        elapsed = (now or datetime.now()) - datetime.fromisoformat(last_fetched)
+    except ValueError:
+        return True
+    return elapsed.total_seconds() >= source['poll_interval'] * 60
+
+
+def filter_by_clubs(news_items: List[Dict], clubs: Optional[List[str]]) -> List[Dict]:
+    """
+    只保留与指定球队相关的新闻（关键词见 CLUB_KEYWORDS）
+    
+    Args:
+        news_items: 新闻列表
+        clubs: 球队列表（如 ['arsenal']），为空时不过滤
+    
+    Returns:
+        过滤后的新闻列表
+    """
+    if not clubs:
+        return news_items
+    return [item for item in news_items if match_clubs(item, clubs)]
+
+
+def match_clubs(item: Dict, clubs: List[str]) -> bool:
+    """标题包含任一球队关键词（见 CLUB_KEYWORDS）"""
+    keywords = [keyword for club in clubs for keyword in CLUB_KEYWORDS.get(club.lower(), [club.lower()])]
+    title_lower = item.get('title', '').lower()
+    return any(keyword in title_lower for keyword in keywords)
+
+
+def match_keywords(item: Dict, keywords: List[str]) -> bool:
+    """标题包含任一关键词"""
+    title_lower = item.get('title', '').lower()
+    return any(keyword.lower() in title_lower for keyword in keywords)
+
+
+def match_sources(item: Dict, sources: List[str]) -> bool:
+    """来源名称包含任一指定来源（不区分大小写，如 "BBC"、"Twitter"）"""
+    source_lower = item.get('source', '').lower()
+    return any(source.lower() in source_lower for source in sources)
+
+
+def match_max_age(item: Dict, max_age_hours: float) -> bool:
+    """发布时间在 max_age_hours 小时以内（无法解析时间的条目保留）"""
+    published = parse_published(item.get('published'))
+    if published is None:
+        return True
+    return datetime.utcnow() - published <= timedelta(hours=max_age_hours)
+
+
+# 可组合的过滤条件：过滤规格中的每个键对应一个条件，全部满足才保留
+ITEM_PREDICATES = {
+    'clubs': match_clubs,
+    'keywords': match_keywords,
+    'sources': match_sources,
+    'max_age_hours': match_max_age,
+}
+
+
+def build_item_filter(clubs: Optional[List[str]] = None, keywords: Optional[List[str]] = None,
+                      sources: Optional[List[str]] = None,
+                      max_age_hours: Optional[float] = None) -> Optional[Dict]:
+    """
+    构建过滤规格（普通字典，可以传给解析子进程）
+    
+    Args:
+        clubs: 球队列表
+        keywords: 标题关键词列表
+        sources: 来源名称列表
+        max_age_hours: 最大新闻时效（小时）
+    
+    Returns:
+        过滤规格，没有任何条件时返回 None
+    """
+    item_filter = {
+        'clubs': clubs,
+        'keywords': keywords,
+        'sources': sources,
+        'max_age_hours': max_age_hours,
+    }
+    item_filter = {key: value for key, value in item_filter.items() if value}
+    return item_filter or None
+
+
+def item_filter_from_env(filter_arsenal: bool = False) -> Optional[Dict]:
+    """
+    根据环境变量构建过滤规格（FILTER_KEYWORDS / FILTER_SOURCES / FILTER_MAX_AGE_HOURS）
+    
+    Args:
+        filter_arsenal: 是否只保留阿森纳相关新闻
+    
+    Returns:
+        过滤规格
+    """
+    def split_list(value: Optional[str]) -> Optional[List[str]]:
+        values = [part.strip() for part in (value or '').split(',') if part.strip()]
+        return values or None
+    
+    max_age = os.getenv('FILTER_MAX_AGE_HOURS')
+    return build_item_filter(
+        clubs=['arsenal'] if filter_arsenal else None,
+        keywords=split_list(os.getenv('FILTER_KEYWORDS')),
+        sources=split_list(os.getenv('FILTER_SOURCES')),
+        max_age_hours=float(max_age) if max_age else None
+    )
+
+
+def item_matches(item: Dict, item_filter: Optional[Dict]) -> bool:
+    """
+    判断新闻是否满足过滤规格中的全部条件
+    
+    Args:
+        item: 新闻项
+        item_filter: build_item_filter 构建的过滤规格（None 表示不过滤）
+    
+    Returns:
+        是否保留
+    """
+    if not item_filter:
+        return True
+    return all(ITEM_PREDICATES[key](item, value) for key, value in item_filter.items())
+
+
+def fetch_cutoff(since: Optional[datetime], item_filter: Optional[Dict] = None) -> Optional[datetime]:
+    """
+    计算抓取时的截止时间：高水位和最大时效中较晚的一个
+    
+    Args:
+        since: 新闻源的高水位（UTC）
+        item_filter: 过滤规格（使用其中的 max_age_hours）
+    
+    Returns:
+        截止时间（UTC），都没有时返回 None
+    """
+    cutoffs = [since] if since else []
+    if item_filter and item_filter.get('max_age_hours'):
+        cutoffs.append(datetime.utcnow() - timedelta(hours=item_filter['max_age_hours']))
+    return max(cutoffs) if cutoffs else None
+
+
+def is_before_cutoff(item: Dict, cutoff: Optional[datetime]) -> bool:
+    """
+    判断条目是否早于截止时间（发布时间无法解析时视为新条目）
+    
+    与高水位相同时间的条目仍然保留，由去重合并处理，避免漏掉同一秒发布的新闻。
+    """
+    if cutoff is None:
+        return False
+    published = parse_published(item.get('published'))
+    return published is not None and published < cutoff
+
+
+def published_sort_key(item: Dict) -> datetime:
+    """
+    按发布时间排序用的键（UTC）
+    
+    RSS 的 ISO 时间和 Twitter 格式的时间不能直接按字符串比较，统一解析后排序；
+    无法解析时间的条目排在最后。
+    """
+    return parse_published(item.get('published')) or datetime.min
+
+
+def update_since_marks(state: Dict[str, Dict], sources: List[Dict], news_items: List[Dict]):
+    """
+    用本轮抓到的最新发布时间推进各新闻源的高水位（只前进不后退）
+    
+    Args:
+        state: 新闻源运行状态（见 load_source_state），高水位保存在 'since' 字段
+        sources: 本轮抓取的新闻源配置
+        news_items: 本轮抓取的新闻
+    """
+    latest = {}
+    for item in news_items:
+        published = parse_published(item.get('published'))
+        if published is not None:
+            source = item.get('source')
+            latest[source] = max(latest.get(source, published), published)
+    
+    for source in sources:
+        item_source = f"Twitter - {source['username']}" if 'username' in source else source['name']
+        if item_source not in latest:
+            continue
+        entry = state.setdefault(source['name'], {})
+        previous = parse_published(entry.get('since'))
+        if previous is None or latest[item_source] > previous:
+            entry['since'] = latest[item_source].isoformat()
+
+
+def parse_target_languages(value: Optional[str]) -> List[str]:
+    """
+    解析目标语言列表（逗号分隔，如 "zh-CN,ja,ko,es"）
+    
+    Args:
+        value: 语言列表字符串
+    
+    Returns:
+        有效的语言代码列表，为空时返回默认语言
+    """
+    languages = []
+    for code in (value or '').split(','):
+        code = code.strip()
+        if not code:
+            continue
+        if code not in LANGUAGES:
+            print(f"⚠️  不支持的目标语言: {code}，已忽略")
+            continue
+        if code not in languages:
+            languages.append(code)
+    return languages or [DEFAULT_LANGUAGE]
+
+
+def load_translation_cache(filename: str = TRANSLATION_CACHE_FILE):
+    """
+    读取翻译缓存
+    
+    优先使用共享缓存后端（多个进程/主机共用，写入即时生效）；旧版的
+    translation_cache.json 只在第一次使用共享缓存时导入一次。
+    共享缓存不可用时退回到 JSON 文件；压测运行（设置了地址覆盖）不读写 JSON 文件。
+    
+    Args:
+        filename: 旧版缓存文件名
+    
+    Returns:
+        类似字典的缓存 {缓存键: 译文}
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+        if not isinstance(legacy, dict) or BASE_URL_OVERRIDES:
+            legacy = {}
+    except (OSError, ValueError):
+        legacy = {}
+    
+    cache = shared_cache('translation', TRANSLATION_CACHE_TTL)
+    if cache is None:
+        return legacy
+    if legacy and cache.backend.add('meta', f'imported:{os.path.abspath(filename)}', time.time()):
+        for key, value in legacy.items():
+            cache.add(key, value)
+        print(f"已把 {filename} 中的 {len(legacy)} 条译文导入共享缓存")
+    return cache
+
+
+def save_translation_cache(cache, filename: str = TRANSLATION_CACHE_FILE):
+    """
+    保存翻译缓存（共享缓存已即时写入，只有退回 JSON 文件时才需要保存）
+    
+    Args:
+        cache: 缓存
+        filename: 缓存文件名
+    """
+    if isinstance(cache, CacheNamespace) or BASE_URL_OVERRIDES:
+        return
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⚠️  保存翻译缓存失败: {e}")
+
+
+def translation_cache_key(text: str, target_lang: str, backend: str) -> str:
+    """生成翻译缓存键（按翻译服务和目标语言区分）"""
+    return f"{backend}|{target_lang}|{text}"
+
+
+def seed_translation_cache(cache: Dict[str, str], previous_items: List[Dict], backends: List[str]) -> int:
+    """
+    用上一轮输出的译文填充翻译缓存
+    
+    缓存文件不在时（如 GitHub Actions 的全新环境），已发布过的标题和摘要
+    仍然沿用原来的译文，输出保持稳定，也不会重复请求翻译服务。
+    译文只填充到产生它的翻译服务（translated_by 字段）的缓存键下，
+    免费翻译的结果不会冒充 OpenAI 的译文。
+    
+    Args:
+        cache: 翻译缓存字典（原地更新，已有条目不会被覆盖）
+        previous_items: 上一轮输出的新闻列表
+        backends: 没有 translated_by 记录的旧条目要填充的翻译服务
+    
+    Returns:
+        新填充的条目数
+    """
+    added = 0
+    for item in previous_items:
+        for code, lang in LANGUAGES.items():
+            for source_field, field in (('title', lang['field']), ('summary', lang['summary_field'])):
+                text = item.get(source_field)
+                translated = item.get(field)
+                if not text or not translated or translated == text:
+                    continue
+                recorded = (item.get('translated_by') or {}).get(field)
+                for backend in ([recorded] if recorded else backends):
+                    key = translation_cache_key(text, code, backend)
+                    if key not in cache:
+                        cache[key] = translated
+                        added += 1
+    return added
+
+
+def compute_content_hash(news_items: List[Dict]) -> str:
+    """
+    计算新闻列表的规范化内容哈希（与字段顺序、缩进无关）
+    
+    只覆盖新闻本身和译文，HASH_VOLATILE_FIELDS 中的字段不参与计算。
+    
+    Args:
+        news_items: 新闻列表
+    
+    Returns:
+        sha256 十六进制字符串
+    """
+    stable = [{key: value for key, value in item.items() if key not in HASH_VOLATILE_FIELDS}
+              for item in news_items]
+    canonical = json.dumps(stable, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def create_free_translator(translator_type: str = 'google', target_lang: str = DEFAULT_LANGUAGE):
+    """
+    创建免费翻译服务实例
+    
+    Args:
+        translator_type: 翻译服务类型 ('google', 'deepl', 'libre')
+        target_lang: 目标语言代码（见 LANGUAGES）
+    
+    Returns:
+        deep_translator 翻译器实例
+    """
+    lang = LANGUAGES[target_lang]
+    if TRANSLATOR_BASE_URL and LibreTranslator:
+        # 指定了翻译服务地址时统一使用 LibreTranslate 兼容接口
+        return LibreTranslator(source='en', target=lang['libre'], api_key=os.getenv('LIBRE_API_KEY', 'local'),
+                               custom_url=TRANSLATOR_BASE_URL.rstrip('/') + '/')
+    if translator_type == 'google' and GoogleTranslator:
+        translator = GoogleTranslator(source='en', target=lang['google'])
+    elif translator_type == 'deepl' and DeepL:
+        # DeepL 需要 API key，但这里尝试使用免费版本
+        try:
+            translator = DeepL(source='en', target=lang['deepl'], use_free_api=True)
+        except:
+            if GoogleTranslator:
+                translator = GoogleTranslator(source='en', target=lang['google'])
+            else:
+                raise Exception("无法使用 DeepL 或 Google Translator")
+    elif translator_type == 'libre' and LibreTranslator:
+        translator = LibreTranslator(source='en', target=lang['libre'])
+    else:
+        if GoogleTranslator:
+            translator = GoogleTranslator(source='en', target=lang['google'])
+        else:
+            raise Exception("Google Translator 不可用")
+    return translator
+
+
+def translate_title_free(title: str, is_transfer: bool = False, translator_type: str = 'google',
+                         target_lang: str = DEFAULT_LANGUAGE, item_id: Optional[str] = None) -> Dict[str, str]:
     """
     使用免费翻译服务翻译标题
     
@@ -168,36 +1134,22 @@ def translate_title_free(title: str, is_transfer: bool = False, translator_type:
         title: 原始英文标题
         is_transfer: 是否为转会新闻
         translator_type: 翻译服务类型 ('google', 'deepl', 'libre')
+        target_lang: 目标语言代码（见 LANGUAGES）
+        item_id: 新闻 ID（链接），用于确定性地选择转会前缀，默认使用标题
     
     Returns:
-        包含翻译后标题和是否转会的字典
+        包含翻译后标题（字段名见 LANGUAGES）和是否转会的字典
     """
+    lang = LANGUAGES[target_lang]
+    field = lang['field']
     try:
         if not FREE_TRANSLATOR_AVAILABLE:
             return {
-                'title_cn': title,
+                field: title,
                 'is_transfer': is_transfer
             }
         
-        # 选择翻译服务
-        if translator_type == 'google' and GoogleTranslator:
-            translator = GoogleTranslator(source='en', target='zh-CN')
-        elif translator_type == 'deepl' and DeepL:
-            # DeepL 需要 API key，但这里尝试使用免费版本
-            try:
-                translator = DeepL(source='en', target='zh', use_free_api=True)
-            except:
-                if GoogleTranslator:
-                    translator = GoogleTranslator(source='en', target='zh-CN')
-                else:
-                    raise Exception("无法使用 DeepL 或 Google Translator")
-        elif translator_type == 'libre' and LibreTranslator:
-            translator = LibreTranslator(source='en', target='zh')
-        else:
-            if GoogleTranslator:
-                translator = GoogleTranslator(source='en', target='zh-CN')
-            else:
-                raise Exception("Google Translator 不可用")
+        translator = create_free_translator(translator_type, target_lang)
         
         # 翻译标题（添加重试机制）
         max_retries = 3
@@ -210,7 +1162,7 @@ def translate_title_free(title: str, is_transfer: bool = False, translator_type:
                     break
             except Exception as e:
                 if attempt < max_retries - 1:
-                    time.sleep(1)  # 等待后重试
+                    pause(1)  # 等待后重试
                     continue
                 else:
                     raise e
@@ -223,178 +1175,795 @@ def translate_title_free(title: str, is_transfer: bool = False, translator_type:
         if is_transfer and translated != title:
             # 检查是否已经包含激动人心的词汇，如果没有则添加
             if '🚨' not in translated and '重磅' not in translated and '官宣' not in translated:
-                # 随机添加一些激动人心的前缀
+                # 按新闻 ID 选择前缀，同一条新闻每次输出相同，避免无意义的文件变化
                 prefixes = ['🚨', '💥', '✅']
-                import random
-                prefix = random.choice(prefixes)
-                translated = f"{prefix} {translated}"
+                seed = hashlib.sha1((item_id or title).encode('utf-8')).digest()[0]
+                translated = f"{prefixes[seed % len(prefixes)]} {translated}"
         
         return {
-            'title_cn': translated,
+            field: translated,
             'is_transfer': is_transfer
         }
     
     except Exception as e:
         # 静默失败，返回原标题
         return {
-            'title_cn': title,
+            field: title,
             'is_transfer': is_transfer
         }
 
 
-def translate_title_with_ai(title: str, client: OpenAI) -> Dict[str, str]:
+def translate_title_with_ai(title: str, client: OpenAI, target_lang: str = DEFAULT_LANGUAGE,
+                            budget: Optional[Dict] = None) -> Dict[str, str]:
     """
     使用 OpenAI API 翻译标题并调整语气
     
     Args:
         title: 原始英文标题
         client: OpenAI 客户端
+        target_lang: 目标语言代码（见 LANGUAGES）
+        budget: OpenAI 预算（用于记录 token 用量）
     
     Returns:
-        包含翻译后标题和是否转会的字典
+        包含翻译后标题（字段名见 LANGUAGES）和是否转会的字典
     """
+    field = LANGUAGES[target_lang]['field']
+    language_name = LANGUAGES[target_lang]['name']
     try:
         # 首先判断是否是转会新闻
-        transfer_keywords = [
-            'transfer', 'sign', 'signing', 'deal', 'move', 'join', 'leave',
-            'departure', 'arrival', 'agreement', 'contract', 'loan', 'permanent',
-            'here we go', 'medical', 'completed', 'announced', 'confirmed'
-        ]
-        
-        title_lower = title.lower()
-        is_transfer = any(keyword in title_lower for keyword in transfer_keywords)
+        is_transfer = is_transfer_title(title)
         
         # 构建提示词
         if is_transfer:
-            prompt = f"""请将以下足球转会新闻标题翻译成中文，并使用 Fabrizio Romano 的激动人心的风格。
+            prompt = f"""请将以下足球转会新闻标题翻译成{language_name}，并使用 Fabrizio Romano 的激动人心的风格。
 
 Fabrizio Romano 的风格特点：
-- 使用"Here we go!"、"重磅！"、"官宣！"等激动人心的表达
+- 使用"Here we go!"、{LANGUAGES[target_lang]['transfer_phrases']}等激动人心的{language_name}表达
 - 使用感叹号和emoji（如✅、🚨、💥等）
 - 语气兴奋、直接、有冲击力
 - 突出转会的重大性和确定性
 
 原标题：{title}
 
-请只返回翻译后的中文标题，不要添加其他解释。"""
+请只返回翻译后的{language_name}标题，不要添加其他解释。"""
         else:
-            prompt = f"""请将以下足球新闻标题准确翻译成中文，保持原意和语气。
+            prompt = f"""请将以下足球新闻标题准确翻译成{language_name}，保持原意和语气。
 
 原标题：{title}
 
-请只返回翻译后的中文标题，不要添加其他解释。"""
+请只返回翻译后的{language_name}标题，不要添加其他解释。"""
         
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": "你是一个专业的足球新闻翻译专家，擅长将英文足球新闻翻译成流畅的中文。"},
+                {"role": "system", "content": f"你是一个专业的足球新闻翻译专家，擅长将英文足球新闻翻译成流畅的{language_name}。"},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7 if is_transfer else 0.3,
             max_tokens=200
         )
+        record_openai_usage(budget, response)
         
         translated_title = response.choices[0].message.content.strip()
         
         return {
-            'title_cn': translated_title,
+            field: translated_title,
             'is_transfer': is_transfer
         }
     
-    except Exception as e:
-        print(f"翻译标题时出错: {e}")
-        return {
-            'title_cn': title,  # 出错时返回原标题
-            'is_transfer': False
-        }
+    except Exception as e:
+        print(f"翻译标题时出错: {e}")
+        return {
+            field: title,  # 出错时返回原标题
+            'is_transfer': False
+        }
+
+
+def translate_summary_free(summary: str, translator_type: str = 'google',
+                           target_lang: str = DEFAULT_LANGUAGE) -> str:
+    """
+    使用免费翻译服务翻译摘要（长文本分片后批量翻译）
+    
+    Args:
+        summary: 原始英文摘要
+        translator_type: 翻译服务类型 ('google', 'deepl', 'libre')
+        target_lang: 目标语言代码（见 LANGUAGES）
+    
+    Returns:
+        翻译后的摘要，失败时返回原文
+    """
+    if not FREE_TRANSLATOR_AVAILABLE:
+        return summary
+    try:
+        translator = create_free_translator(translator_type, target_lang)
+        chunks = split_text_chunks(summary)
+        translated = translator.translate_batch(chunks)
+        if not translated or not all(part and part.strip() for part in translated):
+            return summary
+        return ' '.join(part.strip() for part in translated)
+    except Exception:
+        # 静默失败，返回原文
+        return summary
+
+
+def translate_summary_with_ai(summary: str, client: OpenAI, target_lang: str = DEFAULT_LANGUAGE,
+                              budget: Optional[Dict] = None) -> str:
+    """
+    使用 OpenAI API 翻译摘要（长文本分片，每片一次请求）
+    
+    Args:
+        summary: 原始英文摘要
+        client: OpenAI 客户端
+        target_lang: 目标语言代码（见 LANGUAGES）
+        budget: OpenAI 预算（用于记录 token 用量）
+    
+    Returns:
+        翻译后的摘要，失败时返回原文
+    """
+    language_name = LANGUAGES[target_lang]['name']
+    try:
+        parts = []
+        for i, chunk in enumerate(split_text_chunks(summary)):
+            # 第一片的请求已由调用方预占，后续分片各自占用预算
+            if i > 0 and not reserve_openai_request(budget):
+                return summary
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": f"你是一个专业的足球新闻翻译专家，擅长将英文足球新闻翻译成流畅的{language_name}。"},
+                    {"role": "user", "content": f"请将以下足球新闻摘要准确翻译成{language_name}，保持原意。\n\n原文：{chunk}\n\n请只返回译文，不要添加其他解释。"}
+                ],
+                temperature=0.3,
+                max_tokens=1000
+            )
+            record_openai_usage(budget, response)
+            parts.append(response.choices[0].message.content.strip())
+        return ' '.join(parts)
+    except Exception as e:
+        print(f"翻译摘要时出错: {e}")
+        return summary
+
+
+def start_stage(run_report: Dict, name: str, budget_seconds: Optional[float] = None) -> Dict:
+    """
+    在运行报告中登记一个阶段并开始计时
+    
+    Args:
+        run_report: 运行报告（{'stages': {...}}）
+        name: 阶段名称
+        budget_seconds: 该阶段的时间预算（秒），None 表示不限制
+    
+    Returns:
+        阶段记录；deadline 为 time.monotonic() 下的截止时间，各阶段函数据此提前收尾
+    """
+    started = time.monotonic()
+    stage = {
+        'budget': budget_seconds,
+        'cut_short': False,
+        'started': started,
+        'deadline': started + budget_seconds if budget_seconds else None,
+        'span': profile_span(name),
+    }
+    stage['span'].__enter__()
+    run_report['stages'][name] = stage
+    return stage
+
+
+def finish_stage(stage: Dict):
+    """结束阶段计时，只保留可序列化的统计信息"""
+    stage.pop('span').__exit__(None, None, None)
+    stage['seconds'] = round(time.monotonic() - stage.pop('started'), 2)
+    stage.pop('deadline', None)
+
+
+def stage_remaining(stage: Optional[Dict]) -> Optional[float]:
+    """阶段剩余时间（秒），没有截止时间时返回 None"""
+    if not stage or not stage.get('deadline'):
+        return None
+    return max(0.0, stage['deadline'] - time.monotonic())
+
+
+def stage_expired(stage: Optional[Dict]) -> bool:
+    """阶段是否已超出时间预算"""
+    remaining = stage_remaining(stage)
+    return remaining is not None and remaining <= 0
+
+
+def stage_timeout(timeout: float, stage: Optional[Dict]) -> float:
+    """把单次请求的超时时间限制在阶段剩余时间以内"""
+    remaining = stage_remaining(stage)
+    if remaining is None:
+        return timeout
+    return max(0.5, min(timeout, remaining))
+
+
+def save_run_report(run_report: Dict, filename: str = RUN_REPORT_FILE):
+    """
+    保存运行报告，并打印被截断的阶段
+    
+    Args:
+        run_report: 运行报告
+        filename: 报告文件路径
+    """
+    run_report['finished'] = datetime.now().isoformat()
+    run_report['cut_short'] = [name for name, stage in run_report['stages'].items() if stage.get('cut_short')]
+    if run_report['cut_short']:
+        print(f"⏱️  以下阶段超出时间预算被提前结束: {', '.join(run_report['cut_short'])}")
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(run_report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"⚠️  保存运行报告失败: {e}")
+
+
+def create_openai_budget(max_requests: Optional[int] = None, max_tokens: Optional[int] = None) -> Dict:
+    """
+    创建单次运行的 OpenAI 预算
+    
+    Args:
+        max_requests: 最大请求数（None 表示不限制）
+        max_tokens: 最大 token 数（None 表示不限制）
+    
+    Returns:
+        预算字典，翻译过程中会原地累加用量
+    """
+    return {
+        'max_requests': max_requests,
+        'max_tokens': max_tokens,
+        'requests': 0,
+        'prompt_tokens': 0,
+        'completion_tokens': 0,
+    }
+
+
+def reserve_openai_request(budget: Optional[Dict]) -> bool:
+    """
+    预占一次 OpenAI 请求；预算用尽时返回 False
+    
+    Args:
+        budget: create_openai_budget 创建的预算（None 表示不限制）
+    
+    Returns:
+        是否允许发起请求
+    """
+    if budget is None:
+        return True
+    with openai_budget_lock:
+        used_tokens = budget['prompt_tokens'] + budget['completion_tokens']
+        if budget['max_requests'] is not None and budget['requests'] >= budget['max_requests']:
+            return False
+        if budget['max_tokens'] is not None and used_tokens >= budget['max_tokens']:
+            return False
+        budget['requests'] += 1
+        return True
+
+
+def record_openai_usage(budget: Optional[Dict], response) -> None:
+    """
+    记录一次 OpenAI 响应的 token 用量
+    
+    Args:
+        budget: 预算字典（None 时忽略）
+        response: chat.completions.create 的返回值
+    """
+    usage = getattr(response, 'usage', None)
+    if budget is None or usage is None:
+        return
+    with openai_budget_lock:
+        budget['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+        budget['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+
+
+def format_openai_spend(budget: Dict) -> str:
+    """
+    生成 OpenAI 用量报告（按 OPENAI_PRICING 估算费用）
+    
+    Args:
+        budget: 预算字典
+    
+    Returns:
+        一行用量描述
+    """
+    tokens = budget['prompt_tokens'] + budget['completion_tokens']
+    cost = (budget['prompt_tokens'] * OPENAI_PRICING['input'] +
+            budget['completion_tokens'] * OPENAI_PRICING['output']) / 1_000_000
+    max_requests = budget['max_requests'] if budget['max_requests'] is not None else '∞'
+    max_tokens = budget['max_tokens'] if budget['max_tokens'] is not None else '∞'
+    return (f"OpenAI 用量: 请求 {budget['requests']}/{max_requests} 次, "
+            f"tokens {tokens}/{max_tokens}, 估算费用 ${cost:.4f}")
+
+
+def is_priority_news(item: Dict) -> bool:
+    """
+    判断新闻是否走优先通道（转会新闻，或重点记者的推文）
+    
+    Args:
+        item: 新闻项（需已包含 is_transfer）
+    
+    Returns:
+        是否优先处理
+    """
+    if item.get('is_transfer'):
+        return True
+    return item.get('source') in {f'Twitter - {username}' for username in PRIORITY_JOURNALISTS}
+
+
+def needs_premium_translation(item: Dict, engagement_threshold: int = ROUTER_ENGAGEMENT_THRESHOLD) -> bool:
+    """
+    判断新闻是否需要走 OpenAI（转会新闻，或高互动推文）
+    
+    Args:
+        item: 新闻项（需已包含 is_transfer）
+        engagement_threshold: 推文点赞数 + 转发数的阈值
+    
+    Returns:
+        是否优先使用 OpenAI
+    """
+    if item.get('is_transfer'):
+        return True
+    engagement = (item.get('like_count') or 0) + (item.get('retweet_count') or 0)
+    return engagement >= engagement_threshold
 
 
 def process_news_with_translation(news_items: List[Dict], 
                                   api_key: Optional[str] = None,
                                   use_free_translator: bool = False,
-                                  translator_type: str = 'google') -> List[Dict]:
+                                  translator_type: str = 'google',
+                                  target_languages: Optional[List[str]] = None,
+                                  cache: Optional[Dict[str, str]] = None,
+                                  max_workers: int = 1,
+                                  translate_summaries: bool = False,
+                                  use_router: bool = False,
+                                  budget: Optional[Dict] = None,
+                                  priority_flush: Optional[Callable[[List[Dict]], None]] = None,
+                                  stage: Optional[Dict] = None) -> List[Dict]:
     """
-    为所有新闻添加中文翻译
+    为所有新闻添加翻译
+    
+    转会分类只做一次，然后按目标语言扇出翻译任务；所有语言共用同一个
+    翻译缓存和同一个线程池（max_workers 即整体并发上限）。
+    摘要与标题走同样的缓存，已翻译过的摘要不会重复请求。
+    
+    路由模式下按条目选择翻译服务：转会新闻和高互动推文走 OpenAI，
+    其余走免费翻译；OpenAI 失败或预算用尽时自动降级到免费翻译。
+    
+    设置 priority_flush 时启用优先通道：转会新闻和重点记者的推文先翻译，
+    完成后立即调用 priority_flush 发布，其余新闻随后再翻译。
+    
+    设置 stage 且超出时间预算后不再发起翻译请求：有缓存（含上一轮沿用的译文）
+    的条目使用缓存，其余保留原文，保证本轮仍能发布。
     
     Args:
         news_items: 新闻列表
         api_key: OpenAI API 密钥（如果为 None，则从环境变量读取）
         use_free_translator: 是否使用免费翻译服务（默认 False，使用 OpenAI）
         translator_type: 免费翻译服务类型 ('google', 'deepl', 'libre')
+        target_languages: 目标语言列表（默认只翻译成中文）
+        cache: 翻译缓存字典（会被原地更新），为 None 时不使用缓存
+        max_workers: 所有语言共享的翻译并发数
+        translate_summaries: 是否同时翻译摘要（需要新闻项带有 summary 字段）
+        use_router: 是否按条目路由到 OpenAI / 免费翻译
+        budget: OpenAI 预算（create_openai_budget），None 表示不限制
+        priority_flush: 优先新闻翻译完成后的回调（参数为优先新闻列表）
+        stage: 阶段记录（见 start_stage），记录因超时未翻译的条数
     
     Returns:
         包含翻译的新闻列表
     """
     print("\n开始翻译新闻标题...")
     
-    # 判断是否是转会新闻的关键词
-    transfer_keywords = [
-        'transfer', 'sign', 'signing', 'deal', 'move', 'join', 'leave',
-        'departure', 'arrival', 'agreement', 'contract', 'loan', 'permanent',
-        'here we go', 'medical', 'completed', 'announced', 'confirmed'
-    ]
+    languages = target_languages or [DEFAULT_LANGUAGE]
+    client = None
+    if api_key is None:
+        api_key = os.getenv('OPENAI_API_KEY')
+    
+    if use_router and not (api_key and FREE_TRANSLATOR_AVAILABLE):
+        print("⚠️  翻译路由需要 OPENAI_API_KEY 和免费翻译库，改用单一翻译服务")
+        use_router = False
     
     # 使用免费翻译
-    if use_free_translator or not os.getenv('OPENAI_API_KEY'):
+    if not use_router and (use_free_translator or not os.getenv('OPENAI_API_KEY')):
         if not FREE_TRANSLATOR_AVAILABLE:
             print("⚠️  免费翻译库未安装，跳过翻译步骤")
             print("   可以运行: pip install deep-translator")
             return news_items
         
         print(f"使用免费翻译服务: {translator_type}")
-        total = len(news_items)
+    else:
+        # 使用 OpenAI API
+        if not api_key:
+            print("⚠️  未设置 OPENAI_API_KEY，切换到免费翻译服务")
+            return process_news_with_translation(news_items, use_free_translator=True,
+                                                 translator_type=translator_type,
+                                                 target_languages=target_languages,
+                                                 cache=cache, max_workers=max_workers,
+                                                 translate_summaries=translate_summaries,
+                                                 stage=stage)
         
-        for i, item in enumerate(news_items, 1):
-            title_lower = item['title'].lower()
-            is_transfer = any(keyword in title_lower for keyword in transfer_keywords)
+        client = OpenAI(api_key=api_key, base_url=OPENAI_BASE_URL)
+        if use_router:
+            print(f"使用翻译路由: 转会/高互动 → OpenAI，其余 → {translator_type}")
+    
+    # 转会分类只做一次，所有语言共用
+    for item in news_items:
+        item['is_transfer'] = is_transfer_title(item['title'])
+    
+    if len(languages) > 1:
+        print(f"目标语言: {', '.join(languages)}（并发数: {max_workers}）")
+    
+    # 优先通道：转会新闻和重点记者排在最前面
+    if priority_flush is not None:
+        priority_items = [item for item in news_items if is_priority_news(item)]
+        normal_items = [item for item in news_items if not is_priority_news(item)]
+    else:
+        priority_items, normal_items = [], news_items
+    
+    def build_tasks(items: List[Dict]) -> List[tuple]:
+        # 任务: (新闻项, 目标语言, 'title' 或 'summary')
+        batch = [(item, lang, 'title') for item in items for lang in languages]
+        if translate_summaries:
+            batch += [(item, lang, 'summary') for item in items if item.get('summary')
+                      for lang in languages]
+        return batch
+    
+    priority_tasks = build_tasks(priority_items)
+    tasks = priority_tasks + build_tasks(normal_items)
+    total = len(tasks)
+    stats = {'cache_hits': 0, 'openai': 0, 'free': 0, 'fallbacks': 0, 'untranslated': 0}
+    stats_lock = threading.Lock()
+    
+    def backend_chain(item: Dict) -> List[str]:
+        # 按优先级排列的翻译服务，前一个失败或预算用尽时依次降级
+        if use_router:
+            if needs_premium_translation(item):
+                return ['openai', translator_type]
+            return [translator_type]
+        return ['openai'] if client is not None else [translator_type]
+    
+    def translate_with(backend: str, item: Dict, lang: str, kind: str) -> Optional[str]:
+        text = item[kind]
+        if backend == 'openai':
+            if not reserve_openai_request(budget):
+                return None  # 预算用尽
+            if kind == 'summary':
+                return translate_summary_with_ai(text, client, lang, budget)
+            return translate_title_with_ai(text, client, lang, budget)[LANGUAGES[lang]['field']]
+        if kind == 'summary':
+            return translate_summary_free(text, backend, lang)
+        return translate_title_free(text, item['is_transfer'], backend, lang,
+                                    item.get('link'))[LANGUAGES[lang]['field']]
+    
+    def translate_task(item: Dict, lang: str, kind: str) -> tuple:
+        # 返回 (译文, 产生译文的翻译服务)；未能翻译时为 (原文, None)
+        text = item[kind]
+        for position, backend in enumerate(backend_chain(item)):
+            key = translation_cache_key(text, lang, backend)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                with stats_lock:
+                    stats['cache_hits'] += 1
+                return cached, backend
             
-            if i % 10 == 0 or i == 1:
-                print(f"正在处理第 {i}/{total} 条: {item['title'][:50]}...")
+            # 超出时间预算后只查缓存，不再发起请求
+            if stage_expired(stage):
+                continue
             
-            # 使用免费翻译
-            translation_result = translate_title_free(item['title'], is_transfer, translator_type)
+            # 共享缓存下，付费请求先抢占：其他进程/主机正在翻译同一条时等待其结果
+            claimed = backend == 'openai' and isinstance(cache, CacheNamespace)
+            if claimed and not cache.claim(key, TRANSLATION_CLAIM_TTL):
+                claimed = False
+                cached = cache.wait_for(key, timeout=min(10, stage_remaining(stage) or 10))
+                if cached is not None:
+                    with stats_lock:
+                        stats['cache_hits'] += 1
+                    return cached, backend
             
-            # 添加到新闻项
-            item['title_cn'] = translation_result['title_cn']
-            item['is_transfer'] = is_transfer
+            with profile_span(f"translate/{backend}"):
+                translated = translate_with(backend, item, lang, kind)
+            if translated is None:
+                if claimed:
+                    cache.release(key)
+                continue
             
-            # 添加延迟以避免速率限制（免费服务通常有速率限制）
-            if i < total:
-                time.sleep(0.3)  # 每次请求间隔 0.3 秒
-        
-        print(f"\n完成！共翻译了 {total} 条新闻标题\n")
-        return news_items
+            # 每个工作线程在真实请求后稍作等待，避免速率限制
+            pause(0.5 if backend == 'openai' else 0.3)
+            
+            # 只缓存成功的翻译，失败（返回原文）的下次重试
+            # 写入结果后（或失败时）释放 claim，不留下占位键
+            if translated != text and cache is not None:
+                cache[key] = translated
+            if claimed:
+                cache.release(key)
+            if translated != text:
+                with stats_lock:
+                    stats['openai' if backend == 'openai' else 'free'] += 1
+                    if position > 0:
+                        stats['fallbacks'] += 1
+                return translated, backend
+        if stage_expired(stage):
+            with stats_lock:
+                stats['untranslated'] += 1
+        return text, None
     
-    # 使用 OpenAI API
-    if api_key is None:
-        api_key = os.getenv('OPENAI_API_KEY')
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    hung = []
     
-    if not api_key:
-        print("⚠️  未设置 OPENAI_API_KEY，切换到免费翻译服务")
-        return process_news_with_translation(news_items, use_free_translator=True, translator_type=translator_type)
+    def resolve(item: Dict, lang: str, kind: str, future) -> tuple:
+        remaining = stage_remaining(stage)
+        if remaining is None:
+            return future.result()
+        try:
+            return future.result(timeout=remaining)
+        except FuturesTimeout:
+            pass
+        # 超出时间预算：还在排队的任务直接在当前线程完成（translate_task 此时只查缓存），
+        # 正在请求的再等一小段时间，仍未完成才视为卡住
+        if future.cancel():
+            return translate_task(item, lang, kind)
+        return future.result(timeout=STAGE_GRACE_SECONDS)
     
-    client = OpenAI(api_key=api_key)
-    total = len(news_items)
+    def run_tasks(batch: List[tuple], offset: int = 0):
+        futures = [executor.submit(translate_task, item, lang, kind) for item, lang, kind in batch]
+        for i, ((item, lang, kind), future) in enumerate(zip(batch, futures), offset + 1):
+            field = LANGUAGES[lang]['summary_field' if kind == 'summary' else 'field']
+            try:
+                item[field], backend = resolve(item, lang, kind, future)
+                # 记录每个译文字段由哪个翻译服务产生，下一轮只沿用到对应服务的缓存键
+                translated_by = item.setdefault('translated_by', {})
+                if backend:
+                    translated_by[field] = backend
+                else:
+                    translated_by.pop(field, None)
+                if not translated_by:
+                    del item['translated_by']
+            except FuturesTimeout:
+                # 请求卡住超过截止时间：保留已有译文或原文，不再等待
+                item[field] = item.get(field, item[kind])
+                hung.append(future)
+                with stats_lock:
+                    stats['untranslated'] += 1
+            if i % 10 == 0 or i == 1:
+                print(f"正在处理第 {i}/{total} 条 [{lang}]: {item['title'][:50]}...")
     
-    for i, item in enumerate(news_items, 1):
-        print(f"正在处理第 {i}/{total} 条: {item['title'][:50]}...")
-        
-        # 翻译标题
-        translation_result = translate_title_with_ai(item['title'], client)
-        
-        # 添加到新闻项
-        item['title_cn'] = translation_result['title_cn']
-        item['is_transfer'] = translation_result['is_transfer']
-        
-        # 添加延迟以避免 API 速率限制
-        if i < total:
-            time.sleep(0.5)  # 每次请求间隔 0.5 秒
+    try:
+        if priority_items:
+            print(f"⚡ 优先翻译 {len(priority_items)} 条转会/重点记者新闻")
+            run_tasks(priority_tasks)
+            priority_flush(priority_items)
+        run_tasks(tasks[len(priority_tasks):], len(priority_tasks))
+    finally:
+        # 超时后不等待仍卡在请求中的线程
+        executor.shutdown(wait=not hung, cancel_futures=True)
+    
+    if stats['untranslated']:
+        print(f"⏱️  翻译超出时间预算，{stats['untranslated']} 条保留原文（已有译文的沿用缓存）")
+        if stage is not None:
+            stage.update(cut_short=True, untranslated=stats['untranslated'])
     
-    print(f"\n完成！共翻译了 {total} 条新闻标题\n")
+    summary_note = f"，含摘要 {sum(1 for _, _, kind in tasks if kind == 'summary')} 条" if translate_summaries else ''
+    print(f"\n完成！共翻译了 {len(news_items)} 条新闻标题 × {len(languages)} 种语言{summary_note}（缓存命中 {stats['cache_hits']} 次）")
+    if use_router:
+        print(f"路由统计: OpenAI {stats['openai']} 条, {translator_type} {stats['free']} 条, 降级 {stats['fallbacks']} 条")
+    if budget is not None and client is not None:
+        print(format_openai_spend(budget))
+    print()
     
     return news_items
 
 
+def title_tokens(title: str) -> frozenset:
+    """提取标题中的关键词（小写，去掉标点和常见虚词），用于判断不同来源的同一条新闻"""
+    words = re.findall(r"[a-z0-9']+", title.lower())
+    return frozenset(word for word in words if len(word) > 2 and word not in RANK_STOPWORDS)
+
+
+def title_entities(title: str) -> frozenset:
+    """提取标题中的专有名词（大写开头的词，小写化），如球队和球员名"""
+    words = re.findall(r"\b[A-Z][A-Za-z']+", title)
+    return frozenset(word.lower() for word in words if word.lower() not in RANK_STOPWORDS)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    """两个集合的 Jaccard 相似度（有一个为空时为 0）"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def cluster_news(news_items: List[Dict], similarity: float = RANK_CLUSTER_SIMILARITY,
+                 entity_similarity: float = RANK_ENTITY_SIMILARITY) -> List[List[int]]:
+    """
+    把不同来源报道的同一条新闻归为一组
+    
+    加入一组需要与组内每一条都相似：标题关键词的 Jaccard 相似度达到 similarity，
+    且专有名词的相似度达到 entity_similarity。同一模板的不同新闻
+    （如 "Arsenal vs Chelsea: team news" 和 "Arsenal vs Tottenham: team news"）不会被合并。
+    
+    Args:
+        news_items: 新闻列表
+        similarity: 关键词相似度阈值
+        entity_similarity: 专有名词相似度阈值（两条标题都有专有名词时才检查）
+    
+    Returns:
+        分组列表，每组为新闻在列表中的下标
+    """
+    tokens = [title_tokens(item.get('title', '')) for item in news_items]
+    entities = [title_entities(item.get('title', '')) for item in news_items]
+    
+    def same_story(a: int, b: int) -> bool:
+        if jaccard(tokens[a], tokens[b]) < similarity:
+            return False
+        return not (entities[a] and entities[b]) or jaccard(entities[a], entities[b]) >= entity_similarity
+    
+    clusters = []
+    for index in range(len(news_items)):
+        for cluster in clusters:
+            if all(same_story(index, member) for member in cluster):
+                cluster.append(index)
+                break
+        else:
+            clusters.append([index])
+    return clusters
+
+
+def rank_news(news_items: List[Dict], source_weights: Optional[Dict[str, float]] = None,
+              half_life_hours: float = RANK_HALF_LIFE_HOURS) -> List[Dict]:
+    """
+    计算每条新闻的热度分，并生成预先排好的“热门”顺序
+    
+    分数 = (1 + 互动分 + 转会加分 + 同题报道加分) × 来源权重 × 时间衰减。
+    时间衰减以列表中最新一条新闻的发布时间为基准（而不是当前时间），
+    相同的输入总是得到相同的分数，不影响“内容未变化时跳过发布”。
+    
+    会原地写入 score（分数）、cluster_size（同题报道数）字段，每组中分数最高的一条
+    另有 rank 字段（热门顺序，从 1 开始），网站按 rank 排序即可，不必在浏览器里重新计算。
+    
+    Args:
+        news_items: 新闻列表（保持原来的时间顺序）
+        source_weights: 来源权重 {来源名称: 权重}，未列出的来源为 1
+        half_life_hours: 分数减半所需的小时数
+    
+    Returns:
+        热门顺序的新闻列表（每组只保留分数最高的一条）
+    """
+    source_weights = source_weights or {}
+    published = [parse_published(item.get('published')) for item in news_items]
+    reference = max((p for p in published if p is not None), default=None)
+    
+    clusters = cluster_news(news_items)
+    for cluster in clusters:
+        cluster_bonus = math.log1p(len(cluster) - 1) * RANK_CLUSTER_WEIGHT
+        for index in cluster:
+            item = news_items[index]
+            engagement = math.log1p((item.get('like_count') or 0) + 2 * (item.get('retweet_count') or 0))
+            base = 1 + engagement * RANK_ENGAGEMENT_WEIGHT + cluster_bonus
+            if item.get('is_transfer'):
+                base += RANK_TRANSFER_BOOST
+            age_hours = 0.0
+            if reference is not None and published[index] is not None:
+                age_hours = max(0.0, (reference - published[index]).total_seconds() / 3600)
+            decay = 0.5 ** (age_hours / half_life_hours)
+            item['score'] = round(base * source_weights.get(item.get('source'), 1.0) * decay, 4)
+            item['cluster_size'] = len(cluster)
+            item.pop('rank', None)
+    
+    top_items = [max((news_items[index] for index in cluster), key=lambda x: x['score']) for cluster in clusters]
+    top_items.sort(key=lambda x: (-x['score'], x.get('published', '')))
+    for rank, item in enumerate(top_items, 1):
+        item['rank'] = rank
+    return top_items
+
+
+def source_weights_from_registry(registry: Dict[str, List[Dict]]) -> Dict[str, float]:
+    """从新闻源配置中取出各来源的排序权重（weight），键为新闻项中的 source 字段"""
+    weights = {source['name']: source['weight'] for source in registry['feeds']}
+    weights.update({f"Twitter - {source['username']}": source['weight'] for source in registry['journalists']})
+    return weights
+
+
+def save_top_news(top_items: List[Dict], filename: str = PUBLIC_TOP_FILE, limit: int = RANK_TOP_ITEMS):
+    """
+    输出热门顺序的新闻文件（news-top.json）
+    
+    Args:
+        top_items: rank_news 返回的热门顺序
+        filename: 输出文件
+        limit: 保留条数
+    """
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(top_items[:limit], f, ensure_ascii=False, indent=2)
+    print(f"🔥 热门排序已保存到 {filename}（{min(limit, len(top_items))} 条）")
+
+
+def save_static_outputs(news_items: List[Dict], directory: str = 'public', keep: int = 3) -> Optional[Dict]:
+    """
+    输出带内容哈希的静态文件和预压缩版本，并更新 manifest
+    
+    生成 news.<hash>.json（紧凑 JSON）及其 .gz / .br 版本，文件名随内容变化，
+    CDN 和浏览器可以永久缓存；news-manifest.json 指向当前版本，每次只需重新验证它。
+    
+    Args:
+        news_items: 新闻列表
+        directory: 输出目录
+        keep: 保留的历史哈希版本数（避免正在加载旧版本的页面 404）
+    
+    Returns:
+        manifest 字典，目录不存在时返回 None
+    """
+    if not os.path.exists(directory):
+        return None
+    
+    payload = json.dumps(news_items, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    content_hash = hashlib.sha256(payload).hexdigest()[:12]
+    filename = f'news.{content_hash}.json'
+    path = os.path.join(directory, filename)
+    
+    encodings = ['identity']
+    with open(path, 'wb') as f:
+        f.write(payload)
+    # mtime=0 让相同内容得到完全相同的 .gz 文件
+    with open(f'{path}.gz', 'wb') as f:
+        f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    encodings.append('gzip')
+    if BROTLI_AVAILABLE:
+        with open(f'{path}.br', 'wb') as f:
+            f.write(brotli.compress(payload))
+        encodings.append('br')
+    
+    manifest = {
+        'file': filename,
+        'hash': content_hash,
+        'count': len(news_items),
+        'size': len(payload),
+        'encodings': encodings,
+        'updated': datetime.now().isoformat(),
+    }
+    manifest_path = os.path.join(directory, 'news-manifest.json')
+    with open(f'{manifest_path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(f'{manifest_path}.tmp', manifest_path)
+    
+    # 清理旧的哈希版本（语言版 news.<lang>.json 不受影响）
+    hashed = [p for p in glob.glob(os.path.join(directory, 'news.*.json'))
+              if re.match(r'^news\.[0-9a-f]{12}\.json$', os.path.basename(p))]
+    hashed.sort(key=os.path.getmtime, reverse=True)
+    for old in [p for p in hashed if p != path][max(0, keep - 1):]:
+        for suffix in ('', '.gz', '.br'):
+            try:
+                os.remove(old + suffix)
+            except OSError:
+                pass
+    
+    print(f"✅ 已输出 {filename}（{', '.join(encodings)}）并更新 news-manifest.json")
+    return manifest
+
+
+def save_language_editions(news_items: List[Dict], languages: List[str], directory: str = 'public'):
+    """
+    为每种目标语言输出单独的 news.<lang>.json 文件
+    
+    每个文件只保留对应语言的标题和摘要字段，避免前端加载不需要的译文。
+    
+    Args:
+        news_items: 已翻译的新闻列表
+        languages: 目标语言列表
+        directory: 输出目录
+    """
+    if not os.path.exists(directory):
+        return
+    
+    other_fields = {lang[key] for lang in LANGUAGES.values() for key in ('field', 'summary_field')}
+    for code in languages:
+        keep = {LANGUAGES[code]['field'], LANGUAGES[code]['summary_field']}
+        edition = []
+        for item in news_items:
+            entry = {key: value for key, value in item.items() if key in keep or key not in other_fields}
+            if 'translated_by' in entry:
+                entry['translated_by'] = {key: value for key, value in entry['translated_by'].items() if key in keep}
+            edition.append(entry)
+        save_to_json(edition, os.path.join(directory, f'news.{code}.json'))
+
+
 def save_to_json(news_items: List[Dict], filename: str = 'football_news.json'):
     """
     将新闻保存到 JSON 文件
@@ -408,13 +1977,146 @@ def save_to_json(news_items: List[Dict], filename: str = 'football_news.json'):
     print(f"新闻已保存到 {filename}")
 
 
-def fetch_tweets_with_snscrape(username: str, limit: int = 10) -> List[Dict]:
+def merge_news_items(existing: List[Dict], new_items: List[Dict],
+                     max_items: Optional[int] = None) -> List[Dict]:
+    """
+    将新条目合并进已有新闻列表（按链接去重，新条目覆盖旧条目）
+    
+    Args:
+        existing: 已有新闻列表
+        new_items: 新抓取/推送的新闻
+        max_items: 合并后保留的最大条数（None 表示不限制）
+    
+    Returns:
+        按发布时间倒序排列的合并结果
+    """
+    merged = {}
+    for item in existing + new_items:
+        key = item.get('link') or item.get('tweet_id') or item.get('title')
+        merged[key] = item
+    result = sorted(merged.values(), key=published_sort_key, reverse=True)
+    return result[:max_items] if max_items else result
+
+
+def update_news_json(new_items: List[Dict], filename: str = PUBLIC_NEWS_FILE,
+                     max_items: Optional[int] = None, hash_file: Optional[str] = None) -> int:
+    """
+    增量更新网站使用的 news.json（原子替换，网站读取时不会读到半个文件）
+    
+    Args:
+        new_items: 新条目
+        filename: news.json 路径
+        max_items: 保留的最大条数
+        hash_file: 内容哈希文件（如 public/news.hash），设置后同步更新，保持与 news.json 一致
+    
+    Returns:
+        更新后的总条数
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+        if not isinstance(existing, list):
+            existing = []
+    except (OSError, ValueError):
+        existing = []
+    
+    merged = merge_news_items(existing, new_items, max_items)
+    tmp_file = f"{filename}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, filename)
+    if hash_file:
+        with open(hash_file, 'w', encoding='utf-8') as f:
+            f.write(compute_content_hash(merged) + '\n')
+    return len(merged)
+
+
+def publish_news(news_items: List[Dict], directory: str = 'public', languages: Optional[List[str]] = None,
+                 top_news: Optional[List[Dict]] = None, static_outputs: bool = False,
+                 content_hash: Optional[str] = None):
+    """
+    把新闻发布到网站目录：news.json 和 news.hash，以及按需输出的语言版、热门顺序和静态文件
+    
+    定时抓取（main）和推送接收服务共用，保证各个输出文件始终一致。
+    news.json 写入失败时抛出异常，其余文件不再输出。
+    
+    Args:
+        news_items: 要发布的新闻列表
+        directory: 网站静态目录
+        languages: 需要单独输出 news.<lang>.json 的语言（None 表示不输出）
+        top_news: rank_news 返回的热门顺序（None 表示不输出 news-top.json）
+        static_outputs: 是否输出预压缩、带内容哈希的静态文件和 manifest
+        content_hash: 已计算好的内容哈希（None 时重新计算）
+    """
+    news_file = os.path.join(directory, 'news.json')
+    tmp_file = f"{news_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(news_items, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, news_file)
+    with open(os.path.join(directory, 'news.hash'), 'w', encoding='utf-8') as f:
+        f.write((content_hash or compute_content_hash(news_items)) + '\n')
+    print(f"✅ 数据已自动更新到 {news_file}")
+    
+    # 多语言模式：为每种语言输出单独的文件
+    if languages:
+        save_language_editions(news_items, languages, directory)
+    
+    if top_news is not None:
+        save_top_news(top_news, os.path.join(directory, 'news-top.json'))
+    
+    # 预压缩 + 内容哈希文件名，供 CDN 长期缓存
+    if static_outputs:
+        try:
+            save_static_outputs(news_items, directory)
+        except Exception as e:
+            print(f"⚠️  输出静态文件失败: {e}")
+
+
+def missing_outputs(directory: str = 'public', languages: Optional[List[str]] = None,
+                    top_news: Optional[List[Dict]] = None, static_outputs: bool = False) -> List[str]:
+    """
+    列出 publish_news 应该输出、但目录中不存在的文件
+    
+    内容哈希未变化时据此判断是否仍需重新发布（例如 news.json 被删除，
+    或新开启了多语言 / 热门排序 / 静态文件输出）。
+    
+    Args:
+        directory: 网站静态目录
+        languages: 同 publish_news
+        top_news: 同 publish_news
+        static_outputs: 同 publish_news
+    
+    Returns:
+        缺少的文件路径列表
+    """
+    expected = ['news.json']
+    expected += [f'news.{code}.json' for code in languages or []]
+    if top_news is not None:
+        expected.append('news-top.json')
+    missing = [os.path.join(directory, name) for name in expected
+               if not os.path.exists(os.path.join(directory, name))]
+    
+    if static_outputs:
+        manifest_path = os.path.join(directory, 'news-manifest.json')
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                current = os.path.join(directory, json.load(f)['file'])
+            if not os.path.exists(current):
+                missing.append(current)
+        except (OSError, ValueError, KeyError):
+            missing.append(manifest_path)
+    return missing
+
+
+def fetch_tweets_with_snscrape(username: str, limit: int = 10,
+                               cutoff: Optional[datetime] = None) -> List[Dict]:
     """
     使用 snscrape 获取指定用户的最新推文
     
     Args:
         username: Twitter 用户名（不含 @）
         limit: 获取的推文数量
+        cutoff: 截止时间（见 fetch_cutoff），时间线遇到更早的推文即停止翻页
     
     Returns:
         推文列表
@@ -426,11 +2128,18 @@ def fetch_tweets_with_snscrape(username: str, limit: int = 10) -> List[Dict]:
             if i >= limit:
                 break
             
+            # 时间线按时间倒序，第一条可能是置顶推文，跳过而不是停止
+            if cutoff and hasattr(tweet, 'date') and tweet.date \
+                    and is_before_cutoff({'published': tweet.date}, cutoff):
+                if i == 0:
+                    continue
+                break
+            
             tweet_data = {
                 'source': f'Twitter - {username}',
                 'title': tweet.rawContent[:200] if hasattr(tweet, 'rawContent') else tweet.content[:200],
                 'link': tweet.url if hasattr(tweet, 'url') else f'https://twitter.com/{username}/status/{tweet.id}',
-                'published': tweet.date.isoformat() if hasattr(tweet, 'date') and tweet.date else datetime.now().isoformat(),
+                'published': tweet.date.isoformat() if hasattr(tweet, 'date') and tweet.date else tweet_id_published(getattr(tweet, 'id', None)),
                 'published_raw': str(tweet.date) if hasattr(tweet, 'date') else '',
                 'tweet_id': str(tweet.id) if hasattr(tweet, 'id') else '',
                 'retweet_count': tweet.retweetCount if hasattr(tweet, 'retweetCount') else 0,
@@ -444,7 +2153,83 @@ def fetch_tweets_with_snscrape(username: str, limit: int = 10) -> List[Dict]:
         return []
 
 
-def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api_type: str = 'auto') -> List[Dict]:
+def tweet_id_published(tweet_id) -> str:
+    """
+    从推文 ID（Snowflake）推算发布时间，作为接口未返回时间时的稳定替代
+    
+    同一条推文每次得到相同的时间，不会因为抓取时间不同而改变内容哈希。
+    
+    Args:
+        tweet_id: 推文 ID
+    
+    Returns:
+        ISO 格式的 UTC 时间，ID 无法解析时返回空字符串
+    """
+    try:
+        milliseconds = (int(tweet_id) >> 22) + 1288834974657
+    except (TypeError, ValueError):
+        return ''
+    if milliseconds <= 1288834974657:
+        return ''
+    return datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc).isoformat()
+
+
+def rapidapi_tweet(tweet_data: Dict, username: str) -> Dict:
+    """
+    把 RapidAPI 返回的一条推文转换为统一的新闻格式
+    
+    Args:
+        tweet_data: 接口返回的推文
+        username: 作者的 Twitter 用户名
+    
+    Returns:
+        推文（新闻格式）
+    """
+    # 提取推文文本
+    text = tweet_data.get('text') or tweet_data.get('full_text') or tweet_data.get('content', '')
+    
+    # 提取推文 ID
+    tweet_id = str(tweet_data.get('id') or tweet_data.get('tweet_id') or '')
+    
+    # 构建链接
+    link = tweet_data.get('url') or f"https://twitter.com/{username}/status/{tweet_id}"
+    
+    # 提取时间（没有时间时按推文 ID 推算，保证每次抓取结果一致）
+    created_at = tweet_data.get('created_at') or tweet_data.get('date') or tweet_id_published(tweet_id)
+    
+    return {
+        'source': f'Twitter - {username}',
+        'title': text[:200] if text else '',
+        'link': link,
+        'published': created_at if isinstance(created_at, str) else created_at.isoformat() if hasattr(created_at, 'isoformat') else tweet_id_published(tweet_id),
+        'published_raw': str(created_at),
+        'tweet_id': tweet_id,
+        'retweet_count': tweet_data.get('retweet_count', tweet_data.get('retweets', 0)),
+        'like_count': tweet_data.get('favorite_count', tweet_data.get('like_count', tweet_data.get('likes', tweet_data.get('favorites', 0)))),
+    }
+
+
+def tweet_author(tweet_data: Dict) -> str:
+    """
+    从搜索结果中的推文找出作者用户名（小写），找不到时返回空字符串
+    
+    不同接口把作者放在 screen_name / user / author / user_info 字段，或只体现在链接里。
+    """
+    author = tweet_data.get('screen_name') or tweet_data.get('username')
+    if not author:
+        for field in ('user_info', 'author', 'user'):
+            if isinstance(tweet_data.get(field), dict):
+                author = tweet_data[field].get('screen_name') or tweet_data[field].get('username')
+                if author:
+                    break
+    if not author:
+        match = re.search(r'(?:twitter|x)\.com/([A-Za-z0-9_]+)/status/', tweet_data.get('url') or '')
+        author = match.group(1) if match else ''
+    return author.lower()
+
+
+def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api_type: str = 'auto',
+                               timeout: int = 15, cutoff: Optional[datetime] = None) -> List[Dict]:
     """
     使用 RapidAPI 的 Twitter API 获取指定用户的最新推文
     
@@ -455,6 +2240,8 @@ def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api
         api_key: RapidAPI API Key
         limit: 获取的推文数量
         api_type: API 类型 ('auto', 'api45', 'scraper', 'v2')，auto 会依次尝试
+        timeout: 单次请求超时时间（秒）
+        cutoff: 截止时间（见 fetch_cutoff），遇到更早的推文即停止
     
     Returns:
         推文列表
@@ -507,7 +2294,8 @@ def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api
                 "X-RapidAPI-Host": config['host']
             }
             
-            response = requests.get(config['url'], headers=headers, params=config['params'], timeout=15)
+            response = requests.get(override_base_url(config['url'], RAPIDAPI_BASE_URL), headers=headers,
+                                    params=config['params'], timeout=timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -515,32 +2303,17 @@ def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api
                 # 解析数据
                 tweet_list = data.get(config['parse_key'], [])
                 
-                for tweet_data in tweet_list[:limit]:
-                    # 提取推文文本
-                    text = tweet_data.get('text') or tweet_data.get('full_text') or tweet_data.get('content', '')
-                    
-                    # 提取推文 ID
-                    tweet_id = str(tweet_data.get('id', ''))
-                    
-                    # 构建链接
-                    link = tweet_data.get('url') or f"https://twitter.com/{username}/status/{tweet_id}"
+                for position, tweet_data in enumerate(tweet_list[:limit]):
+                    # 时间线按时间倒序，第一条可能是置顶推文，跳过而不是停止
+                    if is_before_cutoff({'published': tweet_data.get('created_at') or tweet_data.get('date')}, cutoff):
+                        if position == 0:
+                            continue
+                        break
                     
-                    # 提取时间
-                    created_at = tweet_data.get('created_at') or tweet_data.get('date', datetime.now().isoformat())
-                    
-                    tweet = {
-                        'source': f'Twitter - {username}',
-                        'title': text[:200] if text else '',
-                        'link': link,
-                        'published': created_at if isinstance(created_at, str) else created_at.isoformat() if hasattr(created_at, 'isoformat') else datetime.now().isoformat(),
-                        'published_raw': str(created_at),
-                        'tweet_id': tweet_id,
-                        'retweet_count': tweet_data.get('retweet_count', tweet_data.get('retweets', 0)),
-                        'like_count': tweet_data.get('favorite_count', tweet_data.get('like_count', tweet_data.get('likes', 0))),
-                    }
-                    tweets.append(tweet)
+                    tweets.append(rapidapi_tweet(tweet_data, username))
                 
-                if tweets:
+                if tweets or (cutoff and tweet_list):
+                    # 有高水位时没有新推文也是成功，不再尝试其他 API
                     print(f"  ✅ 使用 {config['name']} 成功获取推文")
                     return tweets
             else:
@@ -558,10 +2331,85 @@ def fetch_tweets_with_rapidapi(username: str, api_key: str, limit: int = 10, api
     return tweets
 
 
+def fetch_tweets_bulk_with_rapidapi(usernames: List[str], api_key: str, limits: Dict[str, int],
+                                    cutoffs: Optional[Dict[str, Optional[datetime]]] = None,
+                                    timeout: int = 15) -> Dict[str, List[Dict]]:
+    """
+    用一次搜索请求抓取多位记者的推文，再按作者拆分
+    
+    请求的条数是各记者 limits 之和（推文平均分布时每人都能拿满）。
+    只返回能确定结果完整的记者：拿满了 limits 条的，或者搜索结果已经早于其截止时间
+    （说明截止时间之后的推文都在结果里）。其余记者（接口失败、结果被其他人的推文挤满）
+    不在返回值里，由调用方逐个抓取，不完整的结果也不会被当作完整时间线写入缓存。
+    
+    Args:
+        usernames: Twitter 用户名列表（不超过 TWEET_BULK_BATCH_SIZE 位）
+        api_key: RapidAPI API Key
+        limits: 各用户保留的推文数量 {用户名: 条数}
+        cutoffs: 各用户的截止时间 {用户名: 截止时间}（见 fetch_cutoff）
+        timeout: 请求超时时间（秒）
+    
+    Returns:
+        {用户名: 推文列表}
+    """
+    cutoffs = cutoffs or {}
+    query = ' OR '.join(f'from:{username}' for username in usernames)
+    # 所有人都有截止时间时，用 since: 缩小搜索范围（按天，精确过滤在下面完成）
+    if usernames and all(cutoffs.get(username) for username in usernames):
+        query = f"({query}) since:{min(cutoffs[username] for username in usernames):%Y-%m-%d}"
+    
+    for config in TWEET_BULK_CONFIGS:
+        try:
+            headers = {
+                "X-RapidAPI-Key": api_key,
+                "X-RapidAPI-Host": config['host']
+            }
+            # 请求所有记者的条数之和，让每位记者都有机会拿满
+            params = dict(config['params'], **{config['query_param']: query,
+                                               config['count_param']: sum(limits.get(username, 10) for username in usernames)})
+            response = requests.get(override_base_url(config['url'], RAPIDAPI_BASE_URL), headers=headers,
+                                    params=params, timeout=timeout)
+            if response.status_code != 200:
+                continue
+            tweet_list = response.json().get(config['parse_key'], [])
+        except Exception:
+            continue
+        
+        # 按作者拆分（搜索结果按时间倒序）
+        by_author = {username.lower(): username for username in usernames}
+        results = {username: [] for username in usernames}
+        oldest = None
+        for tweet_data in tweet_list:
+            published = parse_published(tweet_data.get('created_at') or tweet_data.get('date'))
+            if published and (oldest is None or published < oldest):
+                oldest = published
+            username = by_author.get(tweet_author(tweet_data))
+            if not username or len(results[username]) >= limits.get(username, 10):
+                continue
+            tweet = rapidapi_tweet(tweet_data, username)
+            if not is_before_cutoff(tweet, cutoffs.get(username)):
+                results[username].append(tweet)
+        
+        complete = {}
+        for username, tweets in results.items():
+            cutoff = cutoffs.get(username)
+            if len(tweets) >= limits.get(username, 10) or (cutoff and oldest and oldest < cutoff):
+                complete[username] = tweets
+        print(f"  ✅ 使用 {config['name']} 一次请求获取了 {len(complete)}/{len(usernames)} 位记者的推文")
+        return complete
+    
+    return {}
+
+
 def fetch_journalist_tweets(journalists: Optional[Dict[str, str]] = None, 
                             limit_per_journalist: int = 5,
                             use_rapidapi: bool = False,
-                            rapidapi_key: Optional[str] = None) -> List[Dict]:
+                            rapidapi_key: Optional[str] = None,
+                            source_settings: Optional[Dict[str, Dict]] = None,
+                            item_filter: Optional[Dict] = None,
+                            since_marks: Optional[Dict[str, str]] = None,
+                            stage: Optional[Dict] = None,
+                            bulk: bool = False) -> List[Dict]:
     """
     获取多个知名记者的最新推文
     
@@ -570,51 +2418,130 @@ def fetch_journalist_tweets(journalists: Optional[Dict[str, str]] = None,
         limit_per_journalist: 每个记者获取的推文数量
         use_rapidapi: 是否使用 RapidAPI（如果 snscrape 不可用或失败）
         rapidapi_key: RapidAPI API Key（如果使用 RapidAPI）
+        source_settings: 各记者的新闻源配置 {显示名称: 配置}（max_items / timeout / clubs）
+        item_filter: 过滤规格（见 build_item_filter），推文抓取后立即应用
+        since_marks: 各记者的高水位 {显示名称: ISO 时间}，只抓取更新的推文
+        stage: 阶段记录（见 start_stage），超出时间预算后剩余的记者不再抓取，记入 skipped
+        bulk: 使用 RapidAPI 时先按批次用搜索接口一次抓取多位记者（见 fetch_tweets_bulk_with_rapidapi），
+              未能确定结果的记者再逐个抓取
     
     Returns:
         所有推文的列表
     """
     if journalists is None:
         journalists = JOURNALISTS
+    if source_settings is None:
+        source_settings = {}
+    if since_marks is None:
+        since_marks = {}
     
     all_tweets = []
+    skipped = []
+    tweet_cache = shared_cache('tweets', TWEET_CACHE_TTL) if TWEET_CACHE_TTL else None
     
     print(f"\n开始抓取记者推文...")
     print(f"使用方式: {'RapidAPI' if use_rapidapi or not SNSCRAPE_AVAILABLE else 'snscrape'}\n")
     
+    # 批量模式：缓存里没有的记者按批次合并成搜索请求，结果按作者拆分
+    bulk_results = {}
+    if not rapidapi_key:
+        rapidapi_key = os.getenv('RAPIDAPI_KEY')
+    if bulk and rapidapi_key and (use_rapidapi or not SNSCRAPE_AVAILABLE):
+        pending = {}
+        for display_name, username in journalists.items():
+            settings = source_settings.get(display_name, {})
+            limit = settings.get('max_items') or limit_per_journalist
+            if tweet_cache is None or tweet_cache.get(f"{username}|{limit}") is None:
+                pending[username] = (limit, fetch_cutoff(parse_published(since_marks.get(display_name)), item_filter))
+        usernames = list(pending)
+        batches = [usernames[i:i + TWEET_BULK_BATCH_SIZE] for i in range(0, len(usernames), TWEET_BULK_BATCH_SIZE)]
+        for batch in batches:
+            if stage_expired(stage):
+                break
+            with profile_span('tweets/bulk'):
+                bulk_results.update(fetch_tweets_bulk_with_rapidapi(
+                    batch, rapidapi_key,
+                    limits={username: pending[username][0] for username in batch},
+                    cutoffs={username: pending[username][1] for username in batch},
+                    timeout=stage_timeout(15, stage)
+                ))
+        if batches:
+            print(f"批量抓取: {len(batches)} 次请求覆盖 {len(bulk_results)}/{len(usernames)} 位记者，"
+                  f"其余逐个抓取\n")
+    
     for display_name, username in journalists.items():
+        if stage_expired(stage):
+            skipped.append(f"Twitter - {username}")
+            continue
         print(f"正在获取 {display_name} (@{username}) 的推文...")
         
+        settings = source_settings.get(display_name, {})
+        limit = settings.get('max_items') or limit_per_journalist
+        timeout = stage_timeout(settings.get('timeout', 15), stage)
+        cutoff = fetch_cutoff(parse_published(since_marks.get(display_name)), item_filter)
         tweets = []
         
-        # 优先尝试 snscrape（如果可用且未强制使用 RapidAPI）
-        if SNSCRAPE_AVAILABLE and not use_rapidapi:
-            tweets = fetch_tweets_with_snscrape(username, limit_per_journalist)
-            
-            # 如果 snscrape 失败，尝试 RapidAPI
-            if not tweets and rapidapi_key:
-                print(f"  snscrape 失败，尝试使用 RapidAPI...")
-                tweets = fetch_tweets_with_rapidapi(username, rapidapi_key, limit_per_journalist)
-        elif use_rapidapi or not SNSCRAPE_AVAILABLE:
-            if not rapidapi_key:
-                rapidapi_key = os.getenv('RAPIDAPI_KEY')
-            
-            if rapidapi_key:
-                tweets = fetch_tweets_with_rapidapi(username, rapidapi_key, limit_per_journalist)
-            else:
-                print(f"  ⚠️  未提供 RapidAPI Key，跳过 {display_name}")
+        # 共享推文缓存：其他进程/主机刚抓取过（或正在抓取）的时间线直接复用
+        # 带截止时间抓到的只是新条目，不会写入缓存，因此也不抢占、不等待
+        cache_key = f"{username}|{limit}"
+        cached = None
+        claimed = False
+        if tweet_cache is not None:
+            cached = tweet_cache.get(cache_key)
+            if cached is None and cutoff is None:
+                claimed = tweet_cache.claim(cache_key, min(TWEET_CACHE_TTL, 30))
+                if not claimed:
+                    cached = tweet_cache.wait_for(cache_key, timeout=10)
+        
+        with profile_span(f"tweets/{username}"):
+            if cached is not None:
+                tweets = [tweet for tweet in cached if not is_before_cutoff(tweet, cutoff)]
+                print(f"  使用缓存的推文")
+            elif username in bulk_results:
+                tweets = bulk_results[username]
+                print(f"  使用批量抓取的结果")
+            # 优先尝试 snscrape（如果可用且未强制使用 RapidAPI）
+            elif SNSCRAPE_AVAILABLE and not use_rapidapi:
+                tweets = fetch_tweets_with_snscrape(username, limit, cutoff)
+                
+                # 如果 snscrape 失败，尝试 RapidAPI
+                if not tweets and rapidapi_key:
+                    print(f"  snscrape 失败，尝试使用 RapidAPI...")
+                    tweets = fetch_tweets_with_rapidapi(username, rapidapi_key, limit, timeout=timeout, cutoff=cutoff)
+            elif use_rapidapi or not SNSCRAPE_AVAILABLE:
+                if rapidapi_key:
+                    tweets = fetch_tweets_with_rapidapi(username, rapidapi_key, limit, timeout=timeout, cutoff=cutoff)
+                else:
+                    print(f"  ⚠️  未提供 RapidAPI Key，跳过 {display_name}")
+        
+        # 只缓存完整的时间线，只释放自己持有的 claim
+        if claimed:
+            if tweets:
+                tweet_cache[cache_key] = tweets
+            tweet_cache.release(cache_key)
+        
+        # 新闻源配置的球队过滤，以及全局过滤条件（在翻译之前就丢弃）
+        tweets = filter_by_clubs(tweets, settings.get('clubs'))
+        tweets = [tweet for tweet in tweets if item_matches(tweet, item_filter)]
         
         if tweets:
             all_tweets.extend(tweets)
             print(f"  ✅ 获取了 {len(tweets)} 条推文")
+        elif cutoff:
+            print(f"  没有新推文")
         else:
             print(f"  ❌ 未能获取推文")
         
-        # 添加延迟避免请求过快
-        time.sleep(1)
+        # 添加延迟避免请求过快（使用缓存或批量结果时没有请求）
+        if cached is None and username not in bulk_results:
+            pause(1)
+    
+    if stage is not None and skipped:
+        stage.update(cut_short=True, skipped=skipped)
+        print(f"⏱️  推文抓取超时，跳过 {len(skipped)} 位记者")
     
     # 按发布时间排序（最新的在前）
-    all_tweets.sort(key=lambda x: x.get('published', ''), reverse=True)
+    all_tweets.sort(key=published_sort_key, reverse=True)
     
     print(f"\n总共获取了 {len(all_tweets)} 条推文\n")
     
@@ -643,46 +2570,151 @@ def print_news(news_items: List[Dict], limit: int = 10):
         print()
 
 
-def main(filter_arsenal: bool = False):
+def main(filter_arsenal: bool = False, target_languages: Optional[List[str]] = None,
+         include_summary: bool = False, use_router: bool = False, use_priority: bool = False,
+         use_archive: bool = False, static_outputs: bool = False, incremental: bool = False,
+         use_ranking: bool = False):
     """
     主函数
     
     Args:
         filter_arsenal: 是否只抓取阿森纳相关新闻
+        target_languages: 目标语言列表（默认只翻译成中文）；指定后会额外输出 news.<lang>.json
+        include_summary: 是否提取并翻译新闻摘要
+        use_router: 是否按条目路由翻译服务（转会/高互动走 OpenAI）
+        use_priority: 是否启用优先通道（转会/重点记者新闻先翻译并立即发布）
+        use_archive: 是否把新闻追加到按日期划分的历史归档
+        static_outputs: 是否输出预压缩、带内容哈希的静态文件和 manifest
+        incremental: 是否增量抓取（按各源的高水位只处理新条目，旧条目沿用上一轮的结果）
+        use_ranking: 是否计算热度分并输出热门顺序（news-top.json）
     """
     print("开始抓取足球新闻...\n")
     if filter_arsenal:
         print("🔴 仅抓取阿森纳相关新闻\n")
     
+    # 压测运行（指向模拟服务）的结果不发布、不归档，也不推进新闻源状态
+    publish_public = os.path.exists('public') and not BASE_URL_OVERRIDES
+    if BASE_URL_OVERRIDES:
+        print(f"🧪 已设置服务地址覆盖（{', '.join(BASE_URL_OVERRIDES)}），本轮结果只写入 football_news_translated.json\n")
+    
+    # 各阶段的时间预算（秒）：超时的阶段提前收尾，本轮仍然发布已有的结果
+    def stage_budget(name: str) -> Optional[float]:
+        value = os.getenv(f'{name}_DEADLINE')
+        return float(value) if value else None
+    
+    run_report = {'started': datetime.now().isoformat(), 'stages': {}}
+    
+    # 上一轮发布的新闻：用于沿用译文，以及补上本轮未到抓取间隔的新闻源
+    try:
+        with open(PUBLIC_NEWS_FILE, 'r', encoding='utf-8') as f:
+            previous_items = json.load(f)
+        if not isinstance(previous_items, list):
+            previous_items = []
+    except (OSError, ValueError):
+        previous_items = []
+    
+    # 读取新闻源配置，按各源的 poll_interval 决定本轮抓取哪些源
+    registry = load_source_registry()
+    source_state = load_source_state()
+    now = datetime.now()
+    due_feeds, due_journalists, skipped_sources, polled_sources = [], [], set(), set()
+    for kind, due_list in (('feeds', due_feeds), ('journalists', due_journalists)):
+        for source in registry[kind]:
+            polled_sources.add(source['name'] if kind == 'feeds' else f"Twitter - {source['username']}")
+            if not source['enabled']:
+                continue
+            if is_source_due(source, source_state, now):
+                due_list.append(source)
+            else:
+                skipped_sources.add(source['name'] if kind == 'feeds' else f"Twitter - {source['username']}")
+    
+    # 过滤条件（球队 / 关键词 / 来源 / 时效）尽早应用，被丢弃的新闻不会进入翻译和输出
+    item_filter = item_filter_from_env(filter_arsenal)
+    if item_filter and item_filter.get('sources'):
+        due_journalists = [source for source in due_journalists
+                           if match_sources({'source': f"Twitter - {source['username']}"}, item_filter['sources'])]
+    
+    # 增量模式：各源只抓取高水位之后的新条目
+    since_marks = {name: entry['since'] for name, entry in source_state.items()
+                   if incremental and isinstance(entry, dict) and entry.get('since')}
+    
     # 抓取所有新闻
-    all_news = fetch_all_news(filter_arsenal=filter_arsenal)
+    fetch_stage = start_stage(run_report, 'fetch', stage_budget('FETCH'))
+    all_news = fetch_all_news(filter_arsenal=filter_arsenal, include_summary=include_summary,
+                              parse_workers=int(os.getenv('PARSE_WORKERS', '0')),
+                              sources=due_feeds, item_filter=item_filter, since_marks=since_marks,
+                              stage=fetch_stage)
+    finish_stage(fetch_stage)
     
     # 抓取记者推文
+    tweets_stage = start_stage(run_report, 'tweets', stage_budget('TWEETS'))
     try:
         # 检查是否使用 RapidAPI
         use_rapidapi = os.getenv('USE_RAPIDAPI', 'false').lower() == 'true'
         rapidapi_key = os.getenv('RAPIDAPI_KEY')
         
         journalist_tweets = fetch_journalist_tweets(
+            journalists={source['name']: source['username'] for source in due_journalists},
             limit_per_journalist=5,
             use_rapidapi=use_rapidapi,
-            rapidapi_key=rapidapi_key
+            rapidapi_key=rapidapi_key,
+            source_settings={source['name']: source for source in due_journalists},
+            item_filter=item_filter,
+            since_marks=since_marks,
+            stage=tweets_stage,
+            bulk=os.getenv('TWEET_BULK_FETCH', 'false').lower() == 'true'
         )
         
         # 将推文添加到新闻列表（格式统一）
         all_news.extend(journalist_tweets)
         
         # 重新排序
-        all_news.sort(key=lambda x: x.get('published', ''), reverse=True)
+        all_news.sort(key=published_sort_key, reverse=True)
         
     except Exception as e:
         print(f"\n⚠️  抓取记者推文时出错: {e}")
         print("继续处理其他新闻...")
+    finish_stage(tweets_stage)
+    
+    # 超时未抓取的源与未到抓取间隔的源一样，沿用上一轮的新闻，下一轮重新抓取
+    cut_sources = set(fetch_stage.get('skipped', []) + tweets_stage.get('skipped', []))
+    skipped_sources |= cut_sources
+    
+    # 本轮抓取时间和高水位在发布之后才保存：翻译失败或运行被中断时，
+    # 下一轮会重新抓取这些新闻，增量模式下也不会漏掉
+    fetched_news = list(all_news)
+    
+    def commit_source_state():
+        for source in due_feeds + due_journalists:
+            item_source = f"Twitter - {source['username']}" if 'username' in source else source['name']
+            if item_source in cut_sources:
+                continue
+            source_state.setdefault(source['name'], {})['last_fetched'] = now.isoformat()
+        update_since_marks(source_state, due_feeds + due_journalists, fetched_news)
+        save_source_state(source_state)
+    if incremental:
+        # 增量模式下本轮只有新条目，上一轮的新闻（仍满足过滤条件的）全部沿用，按链接去重合并
+        carried = [item for item in previous_items if item_matches(item, item_filter)]
+        fetched_count = len(all_news)
+        all_news = merge_news_items(carried, all_news)
+        print(f"\n增量抓取: 新条目 {fetched_count} 条，沿用上一轮 {len(all_news) - fetched_count} 条")
+    else:
+        carried = [item for item in previous_items if item.get('source') in skipped_sources]
+        if skipped_sources:
+            print(f"\n{len(skipped_sources)} 个新闻源未到抓取间隔或超时，沿用上一轮的 {len(carried)} 条新闻")
+        # 推送服务（push_receiver.py）发布的、不在轮询范围内的来源的新闻也沿用，
+        # 直到按时间被挤出 news.json
+        pushed = [item for item in previous_items
+                  if item.get('source') not in polled_sources and item_matches(item, item_filter)]
+        if pushed:
+            print(f"沿用推送的 {len(pushed)} 条新闻")
+        # 按链接去重合并：超时跳过的源可能与已抓取的源同名（如同一记者的别名），本轮抓到的优先
+        all_news = merge_news_items(carried + pushed, all_news)
     
     # 打印统计信息
     print(f"\n总共获取了 {len(all_news)} 条新闻/推文")
     print(f"来源分布:")
-    for source in RSS_FEEDS.keys():
+    for source in [source['name'] for source in registry['feeds']]:
         count = sum(1 for item in all_news if item['source'] == source)
         if count > 0:
             print(f"  - {source}: {count} 条")
@@ -703,12 +2735,54 @@ def main(filter_arsenal: bool = False):
         else:
             print(f"\n使用免费翻译服务: {translator_type}")
     
+    languages = target_languages or [DEFAULT_LANGUAGE]
+    translation_cache = load_translation_cache()
+    max_workers = int(os.getenv('TRANSLATION_CONCURRENCY', '1'))
+    
+    # 翻译路由：按条目选择 OpenAI / 免费翻译，并限制每轮 OpenAI 用量
+    use_router = use_router or os.getenv('TRANSLATION_ROUTER', 'false').lower() == 'true'
+    
+    # 沿用上一轮已发布的译文，保证同一条新闻的输出稳定
+    # （路由模式下不知道来源的旧译文只当作免费翻译的结果，需要 OpenAI 的条目会重新请求）
+    if use_router:
+        backends = [translator_type]
+    else:
+        backends = [translator_type] if use_free else ['openai']
+    seeded = seed_translation_cache(translation_cache, previous_items, backends)
+    if seeded:
+        print(f"沿用上一轮的 {seeded} 条译文")
+    max_requests = os.getenv('OPENAI_REQUEST_BUDGET')
+    max_tokens = os.getenv('OPENAI_TOKEN_BUDGET')
+    budget = create_openai_budget(
+        max_requests=int(max_requests) if max_requests else None,
+        max_tokens=int(max_tokens) if max_tokens else None
+    )
+    
+    # 优先通道：转会/重点记者新闻翻译完后先合并进网站的 news.json
+    use_priority = use_priority or os.getenv('PRIORITY_LANE', 'false').lower() == 'true'
+    priority_flush = None
+    if use_priority and publish_public:
+        def priority_flush(priority_items: List[Dict]):
+            total = update_news_json(priority_items, PUBLIC_NEWS_FILE, max_items=NEWS_MAX_ITEMS,
+                                     hash_file=PUBLIC_HASH_FILE)
+            print(f"⚡ 已优先发布 {len(priority_items)} 条新闻到 public/news.json（共 {total} 条）")
+    
+    translate_stage = start_stage(run_report, 'translate', stage_budget('TRANSLATE'))
     try:
         all_news = process_news_with_translation(
             all_news, 
             use_free_translator=use_free,
-            translator_type=translator_type
+            translator_type=translator_type,
+            target_languages=languages,
+            cache=translation_cache,
+            max_workers=max_workers,
+            translate_summaries=include_summary,
+            use_router=use_router,
+            budget=budget,
+            priority_flush=priority_flush,
+            stage=translate_stage
         )
+        save_translation_cache(translation_cache)
         
         # 统计转会新闻数量
         transfer_count = sum(1 for item in all_news if item.get('is_transfer', False))
@@ -723,22 +2797,83 @@ def main(filter_arsenal: bool = False):
     except Exception as e:
         print(f"\n❌ 翻译过程中出错: {e}")
         print("跳过翻译步骤，仅保存原始新闻数据")
+    finish_stage(translate_stage)
+    save_run_report(run_report)
     
     # 显示前 10 条新闻
     print_news(all_news, limit=10)
     
+    # 归档：全部新闻按日期追加到归档分区
+    use_archive = use_archive or os.getenv('ARCHIVE_NEWS', 'false').lower() == 'true'
+    if use_archive and not BASE_URL_OVERRIDES:
+        try:
+            retention_days = os.getenv('ARCHIVE_RETENTION_DAYS')
+            added = archive_news(
+                all_news,
+                ARCHIVE_DIR,
+                compress=os.getenv('ARCHIVE_COMPRESS', 'false').lower() == 'true',
+                retention_days=int(retention_days) if retention_days else None
+            )
+            print(f"🗄️  新归档 {added} 条新闻到 {ARCHIVE_DIR}/")
+        except Exception as e:
+            print(f"⚠️  归档失败: {e}")
+    
+    # news.json 只保留最新的 N 条
+    all_news.sort(key=published_sort_key, reverse=True)
+    all_news = all_news[:NEWS_MAX_ITEMS]
+    
+    # 热门排序：分数写入每条新闻，news.json 仍按时间排列
+    use_ranking = use_ranking or os.getenv('RANK_NEWS', 'false').lower() == 'true'
+    top_news = None
+    if use_ranking:
+        top_news = rank_news(all_news, source_weights_from_registry(registry))
+    else:
+        # 沿用的旧条目可能带有之前的排序字段
+        for item in all_news:
+            for field in ('score', 'rank', 'cluster_size'):
+                item.pop(field, None)
+    
     # 保存到 JSON 文件
     save_to_json(all_news, 'football_news_translated.json')
     
-    # 自动复制到 public 目录供网站使用
+    if BASE_URL_OVERRIDES:
+        return all_news
+    
+    # 内容哈希与上次发布相同时跳过发布，避免无意义的提交、部署和缓存失效
+    content_hash = compute_content_hash(all_news)
+    try:
+        with open(PUBLIC_HASH_FILE, 'r', encoding='utf-8') as f:
+            previous_hash = f.read().strip()
+    except OSError:
+        previous_hash = ''
+    
+    # 哈希相同但网站目录缺少输出文件时（被删除或新开启了某项输出）仍然重新发布
+    publish_languages = languages if target_languages else None
+    static_outputs = static_outputs or os.getenv('STATIC_OUTPUTS', 'false').lower() == 'true'
+    missing = missing_outputs('public', publish_languages, top_news, static_outputs) if publish_public else []
+    changed = content_hash != previous_hash or bool(missing)
+    if missing and content_hash == previous_hash:
+        print(f"ℹ️  新闻内容未变化，但缺少 {', '.join(missing)}，重新发布")
+    
+    # GitHub Actions 中把结果写入 step output，供发布步骤判断
+    if os.getenv('GITHUB_OUTPUT'):
+        with open(os.getenv('GITHUB_OUTPUT'), 'a', encoding='utf-8') as f:
+            f.write(f"changed={'true' if changed else 'false'}\n")
+            f.write(f"content_hash={content_hash}\n")
+    
+    if not changed:
+        print(f"ℹ️  新闻内容未变化（{content_hash[:12]}），跳过发布")
+        commit_source_state()
+        return all_news
+    
+    # 发布到 public 目录供网站使用
     try:
-        import shutil
-        public_file = 'public/news.json'
-        if os.path.exists('public'):
-            shutil.copy2('football_news_translated.json', public_file)
-            print(f"✅ 数据已自动更新到 {public_file}")
+        if publish_public:
+            publish_news(all_news, 'public', languages=publish_languages, top_news=top_news,
+                         static_outputs=static_outputs, content_hash=content_hash)
+        commit_source_state()
     except Exception as e:
-        print(f"⚠️  复制到 public 目录失败: {e}")
+        print(f"⚠️  发布到 public 目录失败: {e}")
     
     return all_news
 
@@ -747,5 +2882,28 @@ if __name__ == '__main__':
     import sys
     # 检查命令行参数，是否只抓取阿森纳新闻
     filter_arsenal = '--arsenal' in sys.argv or os.getenv('FILTER_ARSENAL', 'false').lower() == 'true'
-    main(filter_arsenal=filter_arsenal)
+    
+    # 多语言模式：--langs=zh-CN,ja,ko,es 或环境变量 TARGET_LANGUAGES
+    langs_value = os.getenv('TARGET_LANGUAGES')
+    for arg in sys.argv[1:]:
+        if arg.startswith('--langs='):
+            langs_value = arg.split('=', 1)[1]
+    target_languages = parse_target_languages(langs_value) if langs_value else None
+    
+    # 摘要模式：提取并翻译 RSS 摘要
+    include_summary = '--summaries' in sys.argv or os.getenv('TRANSLATE_SUMMARIES', 'false').lower() == 'true'
+    
+    # 剖析模式：记录 CPU 热点、各阶段 / 新闻源耗时、内存峰值和固定等待，报告写入 profile/
+    profile_run = '--profile' in sys.argv or os.getenv('PROFILE_RUN', 'false').lower() == 'true'
+    if profile_run:
+        start_profiling()
+    try:
+        main(filter_arsenal=filter_arsenal, target_languages=target_languages, include_summary=include_summary,
+             use_router='--router' in sys.argv, use_priority='--priority' in sys.argv,
+             use_archive='--archive' in sys.argv, static_outputs='--static-outputs' in sys.argv,
+             incremental='--incremental' in sys.argv or os.getenv('INCREMENTAL_FETCH', 'false').lower() == 'true',
+             use_ranking='--rank' in sys.argv)
+    finally:
+        if profile_run:
+            stop_profiling()
 
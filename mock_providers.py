@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地模拟服务
+模拟 RSS Feed、RapidAPI Twitter（timeline / tweets 两种格式）、OpenAI Chat Completions、
+LibreTranslate 兼容的翻译接口和 WebSub Hub，用于离线压测抓取、翻译的并发和推送接收服务
+
+延迟、错误率和 429 限流都可以通过环境变量配置，配合以下变量让抓取脚本指向本服务:
+FEED_BASE_URL / RAPIDAPI_BASE_URL / OPENAI_BASE_URL / TRANSLATOR_BASE_URL
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict
+from urllib.parse import urlencode, urlparse, parse_qs
+
+import requests
+from xml.sax.saxutils import escape
+
+
+# 服务配置
+MOCK_HOST = os.getenv('MOCK_HOST', '127.0.0.1')
+MOCK_PORT = int(os.getenv('MOCK_PORT', '8090'))
+MOCK_LATENCY_MS = float(os.getenv('MOCK_LATENCY_MS', '50'))  # 平均响应延迟
+MOCK_JITTER_MS = float(os.getenv('MOCK_JITTER_MS', '20'))  # 延迟抖动（±）
+MOCK_ERROR_RATE = float(os.getenv('MOCK_ERROR_RATE', '0'))  # 返回 500 的比例（0~1）
+MOCK_RATE_LIMIT = float(os.getenv('MOCK_RATE_LIMIT', '0'))  # 每秒允许的请求数，超出返回 429（0 表示不限）
+MOCK_ITEMS = int(os.getenv('MOCK_ITEMS', '30'))  # 每个 Feed / 时间线的条目数
+MOCK_ITEM_INTERVAL = int(os.getenv('MOCK_ITEM_INTERVAL', '10'))  # 相邻条目的发布间隔（分钟）
+
+# 生成标题用的素材（部分命中转会和阿森纳关键词）
+PLAYERS = ['Saka', 'Odegaard', 'Rice', 'Haaland', 'Salah', 'Palmer', 'Isak', 'Bellingham']
+CLUBS = ['Arsenal', 'Chelsea', 'Liverpool', 'Man City', 'Newcastle', 'Tottenham']
+TEMPLATES = [
+    '{club} agree deal to sign {player} after medical',
+    'Here we go! {player} joins {club} on permanent transfer',
+    '{player} scores twice as {club} win at home',
+    '{club} manager gives injury update on {player}',
+    '{player} contract talks with {club} stall',
+]
+
+# 请求统计和限流状态（多线程共享）
+stats_lock = threading.Lock()
+stats = {'requests': 0, 'errors': 0, 'rate_limited': 0, 'by_endpoint': {}}
+rate_window = {'second': 0, 'count': 0}
+
+# WebSub 订阅 {topic: {callback: secret}}
+subscriptions_lock = threading.Lock()
+subscriptions: Dict[str, Dict[str, str]] = {}
+
+
+def build_items(seed: str, count: int) -> List[Dict]:
+    """
+    按种子生成确定性的模拟条目（时间倒序，最新的一条对齐到当前时间）
+
+    同一路径在不同时间请求时，会随时间“滚动”出新条目，便于测试增量抓取。
+
+    Args:
+        seed: 种子（请求路径或用户名）
+        count: 条目数
+
+    Returns:
+        条目列表 [{id, title, published}]
+    """
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    latest_slot = int(now.timestamp() // 60 // MOCK_ITEM_INTERVAL)
+    base = zlib.crc32(seed.encode('utf-8'))
+    items = []
+    for offset in range(count):
+        slot = latest_slot - offset
+        rng = random.Random(base + slot)
+        title = rng.choice(TEMPLATES).format(club=rng.choice(CLUBS), player=rng.choice(PLAYERS))
+        items.append({
+            'id': f"{base % 100000}{slot}",
+            'title': title,
+            'published': datetime.fromtimestamp(slot * MOCK_ITEM_INTERVAL * 60, timezone.utc),
+        })
+    return items
+
+
+def render_rss(path: str, count: int) -> bytes:
+    """生成 RSS 2.0 Feed"""
+    entries = []
+    for item in build_items(path, count):
+        entries.append(f"""<item>
+<title>{escape(item['title'])}</title>
+<link>https://mock.local{escape(path)}/{item['id']}</link>
+<pubDate>{format_datetime(item['published'])}</pubDate>
+<description>{escape(item['title'])}. More details to follow.</description>
+</item>""")
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Mock {escape(path)}</title>
+{''.join(entries)}
+</channel></rss>""".encode('utf-8')
+
+
+def render_tweets(username: str, count: int, twitter_format: bool) -> List[Dict]:
+    """
+    生成模拟推文
+
+    Args:
+        username: 用户名
+        count: 条数
+        twitter_format: created_at 是否使用 Twitter 格式（timeline 接口），否则使用 ISO 格式
+
+    Returns:
+        推文列表
+    """
+    tweets = []
+    for item in build_items(username, count):
+        rng = random.Random(item['id'])
+        created_at = item['published'].strftime('%a %b %d %H:%M:%S +0000 %Y') if twitter_format \
+            else item['published'].isoformat()
+        tweets.append({
+            'id': item['id'],
+            'text': item['title'],
+            'url': f"https://twitter.com/{username}/status/{item['id']}",
+            'created_at': created_at,
+            'retweet_count': rng.randint(0, 3000),
+            'favorite_count': rng.randint(0, 20000),
+        })
+    return tweets
+
+
+def search_tweets(query: str, count: int) -> List[Dict]:
+    """
+    模拟 Twitter API 45 的搜索接口：支持 from:用户名（用 OR 连接）和 since:YYYY-MM-DD
+
+    Args:
+        query: 搜索语句
+        count: 返回的最大条数（一页）
+
+    Returns:
+        按时间倒序合并后的推文列表，每条带 screen_name
+    """
+    since = re.search(r'since:(\d{4}-\d{2}-\d{2})', query)
+    since = datetime.strptime(since.group(1), '%Y-%m-%d').replace(tzinfo=timezone.utc) if since else None
+    results = []
+    for username in re.findall(r'from:(\w+)', query):
+        for tweet in render_tweets(username, MOCK_ITEMS, True):
+            published = datetime.strptime(tweet['created_at'], '%a %b %d %H:%M:%S %z %Y')
+            if since and published < since:
+                continue
+            tweet['screen_name'] = username
+            results.append((published, tweet))
+    results.sort(key=lambda entry: entry[0], reverse=True)
+    return [tweet for _, tweet in results[:count]]
+
+
+def chat_completion(body: Dict) -> Dict:
+    """生成 OpenAI 兼容的 Chat Completions 响应（回显提示词中的原文）"""
+    messages = body.get('messages') or [{}]
+    prompt = str(messages[-1].get('content', ''))
+    lines = [line.split('：', 1)[1] for line in prompt.splitlines() if line.startswith(('原标题：', '原文：'))]
+    text = lines[0].strip() if lines else prompt.strip()[:200]
+    content = f"【模拟】{text}"
+    prompt_tokens = max(1, len(json.dumps(messages)) // 4)
+    completion_tokens = max(1, len(content) // 2)
+    return {
+        'id': f"chatcmpl-mock-{random.randint(0, 10**9)}",
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': body.get('model', 'gpt-4o-mini'),
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop',
+        }],
+        'usage': {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def verify_subscription(mode: str, topic: str, callback: str) -> bool:
+    """WebSub 订阅验证：向回调地址发送 hub.challenge，订阅方原样返回才算成功"""
+    challenge = f"{random.getrandbits(64):x}"
+    query = urlencode({'hub.mode': mode, 'hub.topic': topic, 'hub.challenge': challenge})
+    separator = '&' if urlparse(callback).query else '?'
+    try:
+        response = requests.get(f"{callback}{separator}{query}", timeout=10)
+    except requests.RequestException:
+        return False
+    return response.status_code == 200 and response.text == challenge
+
+
+def distribute(topic: str, hub_url: str) -> int:
+    """
+    把 topic 的最新内容推送给所有订阅方（带 Link 头，设置了密钥时带 X-Hub-Signature）
+
+    Args:
+        topic: Feed 地址（内容按其路径生成，与 GET 同一路径返回的 Feed 相同）
+        hub_url: 本 Hub 的地址
+
+    Returns:
+        推送成功的订阅方数量
+    """
+    body = render_rss(urlparse(topic).path or '/', MOCK_ITEMS)
+    with subscriptions_lock:
+        subscribers = dict(subscriptions.get(topic, {}))
+    delivered = 0
+    for callback, secret in subscribers.items():
+        headers = {
+            'Content-Type': 'application/rss+xml; charset=utf-8',
+            'Link': f'<{hub_url}>; rel="hub", <{topic}>; rel="self"',
+        }
+        if secret:
+            headers['X-Hub-Signature'] = 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+        try:
+            response = requests.post(callback, data=body, headers=headers, timeout=10)
+            delivered += response.status_code < 300
+        except requests.RequestException:
+            continue
+    return delivered
+
+
+def is_rate_limited() -> bool:
+    """固定窗口限流：每秒超过 MOCK_RATE_LIMIT 个请求时返回 True"""
+    if MOCK_RATE_LIMIT <= 0:
+        return False
+    second = int(time.time())
+    with stats_lock:
+        if rate_window['second'] != second:
+            rate_window['second'] = second
+            rate_window['count'] = 0
+        rate_window['count'] += 1
+        return rate_window['count'] > MOCK_RATE_LIMIT
+
+
+def record(endpoint: str, outcome: str = None):
+    """记录请求统计"""
+    with stats_lock:
+        stats['requests'] += 1
+        stats['by_endpoint'][endpoint] = stats['by_endpoint'].get(endpoint, 0) + 1
+        if outcome:
+            stats[outcome] += 1
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """
+    模拟接口
+
+    GET  /timeline.php?screenname=&count=   RapidAPI Twitter API 45（timeline 字段）
+    GET  /user?username=&count=             RapidAPI Twitter Scraper（tweets 字段）
+    GET  /search.php?query=from:a OR from:b RapidAPI Twitter API 45 搜索（timeline 字段，一页 20 条）
+    POST /v1/chat/completions               OpenAI Chat Completions
+    POST /translate                         LibreTranslate（q / source / target）
+    POST /hub                               WebSub Hub：hub.mode=subscribe / unsubscribe（同步验证回调），
+                                            hub.mode=publish&hub.url=topic（立即推送给订阅方）
+    GET  /stats                             请求统计
+    GET  其他路径                            RSS Feed（同一路径返回同一组条目）
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # 压测时请求量大，不逐条打印
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        if parsed.path == '/stats':
+            with stats_lock:
+                self._send_json(200, stats)
+            return
+        if not self._simulate(parsed.path):
+            return
+
+        count = min(int(params.get('count', MOCK_ITEMS)), MOCK_ITEMS)
+        if parsed.path == '/timeline.php':
+            self._send_json(200, {'timeline': render_tweets(params.get('screenname', 'mock'), count, True)})
+        elif parsed.path == '/search.php':
+            self._send_json(200, {'timeline': search_tweets(params.get('query', ''), int(params.get('count', 20)))})
+        elif parsed.path == '/user':
+            self._send_json(200, {'tweets': render_tweets(params.get('username', 'mock'), count, False)})
+        else:
+            self._send(200, render_rss(parsed.path, MOCK_ITEMS), 'application/rss+xml; charset=utf-8')
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length', 0))
+        raw = self.rfile.read(length) if length else b''
+        if not self._simulate(parsed.path):
+            return
+
+        if parsed.path.endswith('/chat/completions'):
+            try:
+                body = json.loads(raw.decode('utf-8') or '{}')
+            except ValueError:
+                self._send_json(400, {'error': {'message': 'invalid JSON'}})
+                return
+            self._send_json(200, chat_completion(body))
+        elif parsed.path.rstrip('/') == '/translate':
+            # deep_translator 把参数放在查询字符串里，其他客户端可能用表单或 JSON
+            params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+            if raw:
+                try:
+                    params.update(json.loads(raw.decode('utf-8')))
+                except ValueError:
+                    params.update({key: values[0] for key, values in parse_qs(raw.decode('utf-8')).items()})
+            self._send_json(200, {'translatedText': f"[{params.get('target', '')}] {params.get('q', '')}"})
+        elif parsed.path.rstrip('/') == '/hub':
+            self._handle_hub({key: values[0] for key, values in parse_qs(raw.decode('utf-8')).items()})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _handle_hub(self, form: Dict[str, str]):
+        mode = form.get('hub.mode', '')
+        hub_url = f"http://{self.headers.get('Host', f'{MOCK_HOST}:{MOCK_PORT}')}/hub"
+        if mode in ('subscribe', 'unsubscribe'):
+            topic, callback = form.get('hub.topic', ''), form.get('hub.callback', '')
+            if not topic or not callback or not verify_subscription(mode, topic, callback):
+                self._send_json(403, {'error': 'verification failed'})
+                return
+            with subscriptions_lock:
+                if mode == 'subscribe':
+                    subscriptions.setdefault(topic, {})[callback] = form.get('hub.secret', '')
+                else:
+                    subscriptions.get(topic, {}).pop(callback, None)
+            self._send(204, b'', 'text/plain')
+        elif mode == 'publish':
+            topic = form.get('hub.url') or form.get('hub.topic', '')
+            self._send_json(200, {'delivered': distribute(topic, hub_url)})
+        else:
+            self._send_json(400, {'error': 'unknown hub.mode'})
+
+    def _simulate(self, endpoint: str) -> bool:
+        """模拟延迟、限流和随机错误，返回是否继续正常响应"""
+        delay = max(0.0, MOCK_LATENCY_MS + random.uniform(-MOCK_JITTER_MS, MOCK_JITTER_MS)) / 1000
+        time.sleep(delay)
+
+        if is_rate_limited():
+            record(endpoint, 'rate_limited')
+            self._send_json(429, {'error': {'message': 'Rate limit exceeded', 'type': 'rate_limit'}},
+                            {'Retry-After': '1'})
+            return False
+        if MOCK_ERROR_RATE and random.random() < MOCK_ERROR_RATE:
+            record(endpoint, 'errors')
+            self._send_json(500, {'error': {'message': 'Mock server error', 'type': 'server_error'}})
+            return False
+        record(endpoint)
+        return True
+
+    def _send_json(self, status: int, data, headers: Dict = None):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8', headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    """主函数"""
+    server = ThreadingHTTPServer((MOCK_HOST, MOCK_PORT), MockHandler)
+    base_url = f"http://{MOCK_HOST}:{MOCK_PORT}"
+    print("="*60)
+    print("🧪 本地模拟服务")
+    print("="*60)
+    print(f"监听地址: {base_url}")
+    print(f"延迟: {MOCK_LATENCY_MS}±{MOCK_JITTER_MS} ms, 错误率: {MOCK_ERROR_RATE}, "
+          f"限流: {MOCK_RATE_LIMIT or '不限'} 次/秒")
+    print("\n让抓取脚本指向本服务:")
+    print(f"  export FEED_BASE_URL={base_url}")
+    print(f"  export RAPIDAPI_BASE_URL={base_url}")
+    print(f"  export OPENAI_BASE_URL={base_url}/v1")
+    print(f"  export TRANSLATOR_BASE_URL={base_url}")
+    print(f"  export PUSH_HUB_URL={base_url}/hub   # push_receiver.py --subscribe")
+    print("="*60)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n服务已停止")
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+新闻历史归档
+按发布日期把新闻追加到每天一个的 JSONL 分区（可选 gzip 压缩），并维护分区索引
+public/news.json 只保留最新的 N 条，更早的新闻可以按日期从归档中读取
+"""
+
+import gzip
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional
+
+
+ARCHIVE_DIR = os.getenv('ARCHIVE_DIR', 'archive')
+ARCHIVE_INDEX_FILE = 'index.json'
+
+# 发布时间无法识别的新闻放进固定分区（按日期范围读取时不包含）
+UNDATED_PARTITION = 'undated'
+
+
+def parse_published(value) -> Optional[datetime]:
+    """
+    把各种格式的发布时间统一解析为 UTC 的 naive datetime
+
+    支持 ISO 格式（RSS 解析结果、snscrape）、Twitter API 的
+    "Wed Oct 10 20:19:24 +0000 2018" 格式和 RSS 原始的 RFC 822 格式。
+
+    Args:
+        value: 发布时间（字符串或 datetime）
+
+    Returns:
+        datetime，无法解析时返回 None
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value or '').strip()
+        parsed = None
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = datetime.strptime(text, '%a %b %d %H:%M:%S %z %Y')
+            except ValueError:
+                # RSS 的 RFC 822 格式（时区可能写作 GMT / EST 等）
+                try:
+                    parsed = parsedate_to_datetime(text)
+                except (TypeError, ValueError, IndexError):
+                    parsed = None
+        if parsed is None:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def partition_date(item: Dict) -> str:
+    """
+    计算新闻所属的日期分区（YYYY-MM-DD，UTC）
+
+    Args:
+        item: 新闻项
+
+    Returns:
+        日期字符串；发布时间无法识别时返回 UNDATED_PARTITION（固定分区，重复运行也能去重）
+    """
+    published = parse_published(item.get('published')) or parse_published(item.get('published_raw'))
+    if published is None:
+        return UNDATED_PARTITION
+    return published.strftime('%Y-%m-%d')
+
+
+def item_key(item: Dict) -> str:
+    """新闻的去重键（链接优先）"""
+    return item.get('link') or item.get('tweet_id') or item.get('title', '')
+
+
+def open_partition(path: str, mode: str):
+    """按扩展名打开分区文件（.gz 使用 gzip）"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def load_archive_index(directory: str = ARCHIVE_DIR) -> Dict:
+    """
+    读取分区索引
+
+    Args:
+        directory: 归档目录
+
+    Returns:
+        索引字典 {'partitions': {日期: {file, count, first, last}}}
+    """
+    try:
+        with open(os.path.join(directory, ARCHIVE_INDEX_FILE), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if isinstance(index, dict) and isinstance(index.get('partitions'), dict):
+            return index
+    except (OSError, ValueError):
+        pass
+    return {'partitions': {}}
+
+
+def save_archive_index(index: Dict, directory: str = ARCHIVE_DIR):
+    """
+    保存分区索引（原子替换）
+
+    Args:
+        index: 索引字典
+        directory: 归档目录
+    """
+    index['updated'] = datetime.now().isoformat()
+    path = os.path.join(directory, ARCHIVE_INDEX_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def read_partition(path: str) -> List[Dict]:
+    """
+    逐行读取一个分区文件
+
+    Args:
+        path: 分区文件路径
+
+    Returns:
+        新闻列表（跳过损坏的行）
+    """
+    items = []
+    if not os.path.exists(path):
+        return items
+    with open_partition(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                continue
+    return items
+
+
+def archive_news(news_items: List[Dict], directory: str = ARCHIVE_DIR,
+                 compress: bool = False, retention_days: Optional[int] = None) -> int:
+    """
+    将新闻追加到按日期划分的归档分区，已归档的条目会被跳过
+
+    Args:
+        news_items: 新闻列表
+        directory: 归档目录
+        compress: 新建分区时是否使用 gzip 压缩
+        retention_days: 只保留最近多少天的分区（None 表示永久保留）
+
+    Returns:
+        新归档的条数
+    """
+    os.makedirs(directory, exist_ok=True)
+    index = load_archive_index(directory)
+    partitions = index['partitions']
+
+    by_date = {}
+    for item in news_items:
+        by_date.setdefault(partition_date(item), []).append(item)
+
+    added = 0
+    for date, items in sorted(by_date.items()):
+        entry = partitions.get(date)
+        if entry is None:
+            entry = {'file': f"{date}.jsonl.gz" if compress else f"{date}.jsonl", 'count': 0}
+        path = os.path.join(directory, entry['file'])
+
+        # 分区只有一天的数据，读一遍用来去重即可
+        seen = {item_key(item) for item in read_partition(path)}
+        new_items = []
+        for item in items:
+            key = item_key(item)
+            if key not in seen:
+                seen.add(key)
+                new_items.append(item)
+        if not new_items:
+            continue
+
+        # gzip 支持以追加方式写入多个成员，读取时自动拼接
+        with open_partition(path, 'a') as f:
+            for item in new_items:
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+
+        # 索引中的 first / last 统一为 UTC ISO 格式，不同来源的时间格式可以直接比较
+        published = [parse_published(item.get('published')) for item in new_items]
+        published = [parsed.isoformat() for parsed in published if parsed is not None]
+        if entry.get('first'):
+            published += [entry['first'], entry['last']]
+        entry['count'] += len(new_items)
+        if published:
+            entry['first'] = min(published)
+            entry['last'] = max(published)
+        partitions[date] = entry
+        added += len(new_items)
+
+    if retention_days:
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).strftime('%Y-%m-%d')
+        for date in [d for d in partitions if d != UNDATED_PARTITION and d < cutoff]:
+            try:
+                os.remove(os.path.join(directory, partitions[date]['file']))
+            except OSError:
+                pass
+            del partitions[date]
+
+    save_archive_index(index, directory)
+    return added
+
+
+def read_archive(start_date: str, end_date: Optional[str] = None,
+                 directory: str = ARCHIVE_DIR) -> List[Dict]:
+    """
+    按日期范围读取归档（只打开范围内的分区）
+
+    Args:
+        start_date: 起始日期 YYYY-MM-DD
+        end_date: 结束日期 YYYY-MM-DD（包含），默认与起始日期相同
+        directory: 归档目录
+
+    Returns:
+        按发布时间倒序排列的新闻列表
+    """
+    end_date = end_date or start_date
+    index = load_archive_index(directory)
+    items = []
+    for date, entry in sorted(index['partitions'].items()):
+        if start_date <= date <= end_date:
+            items.extend(read_partition(os.path.join(directory, entry['file'])))
+    items.sort(key=lambda x: parse_published(x.get('published')) or datetime.min, reverse=True)
+    return items
+
+
+if __name__ == '__main__':
+    # 用法: python3 news_archive.py 2025-12-14 [2025-12-15]
+    if len(sys.argv) < 2:
+        index = load_archive_index()
+        for date, entry in sorted(index['partitions'].items()):
+            print(f"{date}: {entry['count']} 条 ({entry['file']})")
+    else:
+        end = sys.argv[2] if len(sys.argv) > 2 else None
+        json.dump(read_archive(sys.argv[1], end), sys.stdout, ensure_ascii=False, indent=2)
+        print()
@@ -1,7 +1,20 @@
 /** @type {import('next').NextConfig} */
 const nextConfig = {
   reactStrictMode: true,
+  async headers() {
+    return [
+      {
+        // 带内容哈希的新闻文件内容不会变化，可以永久缓存
+        source: '/news.:hash([0-9a-f]{12}).json',
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+      },
+      {
+        // manifest 每次都需要重新验证
+        source: '/news-manifest.json',
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=0, must-revalidate' }],
+      },
+    ]
+  },
 }
 
 module.exports = nextConfig
-
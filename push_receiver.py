@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+推送接收服务
+接收 WebSub/PubSubHubbub 通知或通用 JSON Webhook，收到后立即分类、翻译并增量更新 news.json
+定时轮询（scheduler.py / GitHub Actions）仍然作为兜底
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import queue
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+import requests
+
+from fetch_football_news import (
+    item_filter_from_env,
+    item_matches,
+    load_source_registry,
+    load_translation_cache,
+    merge_news_items,
+    parse_feed,
+    parse_target_languages,
+    process_news_with_translation,
+    publish_news,
+    rank_news,
+    save_translation_cache,
+    source_weights_from_registry,
+)
+
+
+# 服务配置（默认只监听本机；对外监听时必须设置 PUSH_SECRET，否则任何人都能发布新闻）
+PUSH_HOST = os.getenv('PUSH_HOST', '127.0.0.1')
+PUSH_PORT = int(os.getenv('PUSH_PORT', '8080'))
+PUSH_SECRET = os.getenv('PUSH_SECRET')  # 设置后校验 X-Hub-Signature
+PUSH_MAX_ITEMS = int(os.getenv('PUSH_MAX_ITEMS', '300'))
+PUSH_PUBLIC_DIR = os.getenv('PUSH_PUBLIC_DIR', 'public')
+
+# Webhook 中只接受这些字段，其余字段（包括译文字段）一律丢弃，译文由本服务生成
+WEBHOOK_FIELDS = ('title', 'link', 'published', 'published_raw', 'summary', 'source',
+                  'tweet_id', 'retweet_count', 'like_count')
+
+# 待处理的推送（由后台线程串行处理，避免并发写 news.json）
+push_queue = queue.Queue()
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: Optional[str]) -> bool:
+    """
+    校验 WebSub 签名（X-Hub-Signature: sha1=... / sha256=...）
+
+    Args:
+        body: 请求体
+        signature: 请求头中的签名
+        secret: 订阅时使用的密钥（为空时不校验）
+
+    Returns:
+        签名是否有效
+    """
+    if not secret:
+        return True
+    if not signature or '=' not in signature:
+        return False
+    method, digest = signature.split('=', 1)
+    if method not in ('sha1', 'sha256', 'sha512'):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, getattr(hashlib, method)).hexdigest()
+    return hmac.compare_digest(expected, digest)
+
+
+def is_loopback(host: str) -> bool:
+    """监听地址是否只对本机开放"""
+    return host in ('localhost', '::1') or host.startswith('127.')
+
+
+def source_for_topic(topic: str) -> str:
+    """
+    根据 Feed 地址找到对应的新闻来源名称
+
+    Args:
+        topic: WebSub topic（即 RSS Feed URL）
+
+    Returns:
+        来源名称，未知时返回域名
+    """
+    for source in load_source_registry()['feeds']:
+        if source['url'] == topic:
+            return source['name']
+    return urlparse(topic).netloc or 'WebSub'
+
+
+def parse_webhook_json(data, default_source: str = 'Webhook') -> List[Dict]:
+    """
+    解析通用 JSON Webhook
+
+    支持 {"source": "...", "items": [...]}、单条新闻对象或新闻列表，
+    每条新闻至少需要 title 和 link，只保留 WEBHOOK_FIELDS 中的字段。
+
+    Args:
+        data: 已解析的 JSON
+        default_source: 未指定来源时使用的名称
+
+    Returns:
+        新闻列表
+    """
+    source = default_source
+    if isinstance(data, dict):
+        source = data.get('source', default_source)
+        entries = data.get('items', [data])
+    elif isinstance(data, list):
+        entries = data
+    else:
+        return []
+
+    news_items = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get('title') or not entry.get('link'):
+            continue
+        news_item = {key: entry[key] for key in WEBHOOK_FIELDS if entry.get(key) is not None}
+        news_item.setdefault('source', source)
+        # 与 RSS 的发布时间一致使用 UTC，避免推送的新闻被标成未来时间
+        news_item.setdefault('published', datetime.utcnow().isoformat())
+        news_item.setdefault('published_raw', news_item['published'])
+        news_items.append(news_item)
+    return news_items
+
+
+def process_pushed_items(news_items: List[Dict], directory: str = PUSH_PUBLIC_DIR) -> int:
+    """
+    处理推送过来的新闻：过滤、翻译，合并进已发布的新闻后重新发布
+
+    与定时抓取使用同一个发布流程（publish_news），news.hash、语言版、
+    热门顺序和静态文件都随 news.json 一起更新。
+
+    Args:
+        news_items: 新闻列表
+        directory: 网站静态目录
+
+    Returns:
+        发布后 news.json 的总条数
+    """
+    item_filter = item_filter_from_env(os.getenv('FILTER_ARSENAL', 'false').lower() == 'true')
+    news_items = [item for item in news_items if item_matches(item, item_filter)]
+    if not news_items:
+        return 0
+
+    languages_value = os.getenv('TARGET_LANGUAGES')
+    languages = parse_target_languages(languages_value)
+    translation_cache = load_translation_cache()
+    process_news_with_translation(
+        news_items,
+        use_free_translator=os.getenv('USE_FREE_TRANSLATOR', 'false').lower() == 'true',
+        translator_type=os.getenv('TRANSLATOR_TYPE', 'google'),
+        target_languages=languages,
+        cache=translation_cache,
+        use_router=os.getenv('TRANSLATION_ROUTER', 'false').lower() == 'true'
+    )
+    save_translation_cache(translation_cache)
+
+    try:
+        with open(os.path.join(directory, 'news.json'), 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+        if not isinstance(existing, list):
+            existing = []
+    except (OSError, ValueError):
+        existing = []
+    merged = merge_news_items(existing, news_items, PUSH_MAX_ITEMS)
+
+    top_news = None
+    if os.getenv('RANK_NEWS', 'false').lower() == 'true':
+        top_news = rank_news(merged, source_weights_from_registry(load_source_registry()))
+
+    publish_news(merged, directory,
+                 languages=languages if languages_value else None,
+                 top_news=top_news,
+                 static_outputs=os.getenv('STATIC_OUTPUTS', 'false').lower() == 'true')
+    print(f"✅ 推送的 {len(news_items)} 条新闻已发布（共 {len(merged)} 条）")
+    return len(merged)
+
+
+def push_worker():
+    """后台线程：依次处理推送队列"""
+    while True:
+        news_items = push_queue.get()
+        try:
+            process_pushed_items(news_items)
+        except Exception as e:
+            print(f"❌ 处理推送时出错: {e}")
+        finally:
+            push_queue.task_done()
+
+
+class PushHandler(BaseHTTPRequestHandler):
+    """
+    推送请求处理
+
+    GET  /websub   WebSub 订阅验证（回显 hub.challenge）
+    POST /websub   WebSub 内容通知（Atom/RSS），可用 ?source= 指定来源
+    POST /webhook  通用 JSON Webhook
+    """
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        mode = params.get('hub.mode', [''])[0]
+        challenge = params.get('hub.challenge', [''])[0]
+
+        if parsed.path == '/websub' and mode in ('subscribe', 'unsubscribe') and challenge:
+            print(f"🔔 WebSub {mode} 验证: {params.get('hub.topic', [''])[0]}")
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.end_headers()
+            self.wfile.write(challenge.encode('utf-8'))
+            return
+
+        self.send_response(404)
+        self.end_headers()
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+
+        if not verify_signature(body, self.headers.get('X-Hub-Signature'), PUSH_SECRET):
+            self.send_response(403)
+            self.end_headers()
+            return
+
+        if parsed.path == '/websub':
+            topic = params.get('source', [None])[0] or source_for_topic(self._topic_from_links())
+            news_items = parse_feed(body, topic)
+        elif parsed.path == '/webhook':
+            try:
+                news_items = parse_webhook_json(json.loads(body.decode('utf-8')),
+                                                params.get('source', ['Webhook'])[0])
+            except ValueError:
+                self.send_response(400)
+                self.end_headers()
+                return
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if news_items:
+            push_queue.put(news_items)
+            print(f"📥 收到推送: {len(news_items)} 条 ({parsed.path})")
+
+        # 先返回 202，翻译在后台完成，避免推送方超时重试
+        self.send_response(202)
+        self.end_headers()
+
+    def _topic_from_links(self) -> str:
+        # WebSub 通知在 Link 头中携带 rel="self" 的 topic 地址
+        for link in self.headers.get('Link', '').split(','):
+            if 'rel="self"' in link and '<' in link and '>' in link:
+                return link[link.index('<') + 1:link.index('>')]
+        return ''
+
+
+def subscribe(hub_url: str, topic_url: str, callback_url: str,
+              secret: Optional[str] = None, mode: str = 'subscribe') -> bool:
+    """
+    向 WebSub Hub 发起订阅（或取消订阅）
+
+    Args:
+        hub_url: Hub 地址
+        topic_url: 要订阅的 Feed 地址
+        callback_url: 本服务的回调地址（.../websub）
+        secret: 签名密钥
+        mode: 'subscribe' 或 'unsubscribe'
+
+    Returns:
+        Hub 是否接受请求
+    """
+    data = {
+        'hub.mode': mode,
+        'hub.topic': topic_url,
+        'hub.callback': callback_url,
+    }
+    if secret:
+        data['hub.secret'] = secret
+    try:
+        response = requests.post(hub_url, data=data, timeout=15)
+        return response.status_code in (202, 204)
+    except Exception as e:
+        print(f"❌ 订阅 {topic_url} 失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    # 可选：启动时向 Hub 订阅所有 RSS Feed
+    if '--subscribe' in sys.argv:
+        hub_url = os.getenv('PUSH_HUB_URL')
+        callback_url = os.getenv('PUSH_CALLBACK_URL')
+        if not hub_url or not callback_url:
+            print("⚠️  订阅需要设置 PUSH_HUB_URL 和 PUSH_CALLBACK_URL")
+        else:
+            for source in load_source_registry()['feeds']:
+                if not source['enabled']:
+                    continue
+                ok = subscribe(hub_url, source['url'], f"{callback_url.rstrip('/')}/websub", PUSH_SECRET)
+                print(f"  {'✅' if ok else '❌'} 订阅 {source['name']}")
+
+    if not PUSH_SECRET and not is_loopback(PUSH_HOST):
+        print(f"❌ 监听 {PUSH_HOST} 需要设置 PUSH_SECRET（否则任何能访问该端口的人都能发布新闻）")
+        sys.exit(1)
+
+    threading.Thread(target=push_worker, daemon=True).start()
+
+    server = ThreadingHTTPServer((PUSH_HOST, PUSH_PORT), PushHandler)
+    print("="*60)
+    print("📡 足球新闻推送接收服务")
+    print("="*60)
+    print(f"监听地址: http://{PUSH_HOST}:{PUSH_PORT}")
+    print("  WebSub:  /websub")
+    print("  Webhook: /webhook")
+    print("="*60)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n服务已停止")
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
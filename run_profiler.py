@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单轮运行的性能剖析
+fetch_football_news.py --profile 时启用：CPU 剖析（cProfile）、各阶段 / 各新闻源的耗时区间、
+内存分配峰值（tracemalloc）、固定等待（sleep）的累计时间，以及全线程的调用栈采样，
+输出报告和火焰图文件（folded stacks，可用 flamegraph.pl / speedscope 打开）
+
+未启用时 profile_span / pause 只是空操作和普通的 time.sleep
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+
+# 输出目录和调用栈采样间隔
+PROFILE_DIR = os.getenv('PROFILE_DIR', 'profile')
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', '10'))
+
+# 当前的剖析会话（未启用时为 None）
+_session = None
+
+
+class ProfileSession:
+    """
+    一次剖析会话
+
+    cProfile 只能记录启用它的线程（主线程）；下载、翻译等工作线程的耗时
+    由耗时区间和调用栈采样覆盖。进程池中解析 Feed 的子进程不在剖析范围内。
+    """
+
+    def __init__(self, sample_interval_ms: float = PROFILE_SAMPLE_INTERVAL_MS):
+        self.lock = threading.Lock()
+        self.spans: List[Dict] = []
+        self.sleeps: Dict[str, float] = {}
+        self.stacks: Dict[str, int] = {}
+        self.sample_interval = sample_interval_ms / 1000
+        self.sample_count = 0
+        self.profiler = cProfile.Profile()
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self._sample_loop, name='profile-sampler', daemon=True)
+
+    def start(self):
+        tracemalloc.start()
+        self.started = time.monotonic()
+        self.cpu_started = time.process_time()
+        self.sampler.start()
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+        self.stopped.set()
+        self.sampler.join()
+        self.seconds = time.monotonic() - self.started
+        self.cpu_seconds = time.process_time() - self.cpu_started
+        self.memory_peak = tracemalloc.get_traced_memory()[1]
+        self.top_allocations = tracemalloc.take_snapshot().statistics('lineno')[:10]
+        tracemalloc.stop()
+
+    def _sample_loop(self):
+        """定时采样所有线程的调用栈，累计为 folded stacks（墙钟时间，包含网络等待和 sleep）"""
+        own_id = threading.get_ident()
+        while not self.stopped.wait(self.sample_interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or is_idle_worker(frame):
+                    continue
+                stack = [names.get(thread_id, str(thread_id))]
+                stack.extend(reversed(frame_labels(frame)))
+                key = ';'.join(stack)
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.sample_count += 1
+
+
+def frame_labels(frame) -> List[str]:
+    """从最内层开始列出调用栈中每一帧的标签：函数名 (文件:行)"""
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return labels
+
+
+def is_idle_worker(frame) -> bool:
+    """线程池中空闲等待任务的工作线程（采样时跳过，避免淹没有效的调用栈）"""
+    while frame is not None and frame.f_code.co_filename.endswith(('threading.py', 'queue.py')):
+        frame = frame.f_back
+    return (frame is not None and frame.f_code.co_name == '_worker'
+            and frame.f_code.co_filename.endswith(os.path.join('concurrent', 'futures', 'thread.py')))
+
+
+def start_profiling(sample_interval_ms: float = PROFILE_SAMPLE_INTERVAL_MS):
+    """开始剖析（整个进程只应调用一次）"""
+    global _session
+    _session = ProfileSession(sample_interval_ms)
+    _session.start()
+
+
+@contextlib.contextmanager
+def profile_span(name: str):
+    """
+    记录一段代码的墙钟耗时
+
+    名称用 "/" 表示层级，例如 "fetch" 和 "fetch/BBC Sport"；
+    顶层区间同时记录该区间内的内存分配峰值。未启用剖析时不做任何事。
+
+    Args:
+        name: 区间名称
+    """
+    session = _session
+    if session is None:
+        yield
+        return
+    top_level = '/' not in name
+    if top_level:
+        tracemalloc.reset_peak()
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        span = {
+            'name': name,
+            'thread': threading.current_thread().name,
+            'start': round(started - session.started, 4),
+            'seconds': round(time.monotonic() - started, 4),
+        }
+        if top_level:
+            span['memory_peak'] = tracemalloc.get_traced_memory()[1]
+        with session.lock:
+            session.spans.append(span)
+
+
+def pause(seconds: float):
+    """
+    固定等待（限速用的 time.sleep），剖析模式下按调用位置累计等待时间
+
+    Args:
+        seconds: 等待秒数
+    """
+    session = _session
+    if session is not None:
+        caller = sys._getframe(1).f_code.co_name
+        with session.lock:
+            session.sleeps[caller] = session.sleeps.get(caller, 0.0) + seconds
+    time.sleep(seconds)
+
+
+def format_bytes(size: float) -> str:
+    """字节数转为易读格式"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def stop_profiling(directory: str = PROFILE_DIR) -> Optional[Dict]:
+    """
+    结束剖析，写出报告并打印摘要
+
+    输出文件：
+      report.json    各阶段 / 新闻源 / 翻译请求耗时、sleep 累计、内存峰值、CPU 热点函数
+      cpu.prof       cProfile 原始数据（python -m pstats / snakeviz）
+      stacks.folded  全线程调用栈采样（flamegraph.pl / speedscope）
+
+    Args:
+        directory: 输出目录
+
+    Returns:
+        报告；未启用剖析时返回 None
+    """
+    global _session
+    session = _session
+    if session is None:
+        return None
+    _session = None
+    session.stop()
+
+    os.makedirs(directory, exist_ok=True)
+    session.profiler.dump_stats(os.path.join(directory, 'cpu.prof'))
+    with open(os.path.join(directory, 'stacks.folded'), 'w', encoding='utf-8') as f:
+        for stack, count in sorted(session.stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+    stats = pstats.Stats(session.profiler, stream=io.StringIO())
+    hot_functions = []
+    for (filename, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+        hot_functions.append({
+            'function': f"{function} ({os.path.basename(filename)}:{line})",
+            'calls': calls,
+            'own_seconds': round(own, 4),
+            'cumulative_seconds': round(cumulative, 4),
+        })
+    hot_functions.sort(key=lambda entry: entry['own_seconds'], reverse=True)
+
+    # 子区间按名称汇总（翻译等区间每条请求记录一次）
+    stages = [span for span in session.spans if '/' not in span['name']]
+    totals = {}
+    for span in session.spans:
+        if '/' not in span['name']:
+            continue
+        entry = totals.setdefault(span['name'], {'name': span['name'], 'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+        entry['count'] += 1
+        entry['seconds'] = round(entry['seconds'] + span['seconds'], 4)
+        entry['max_seconds'] = max(entry['max_seconds'], span['seconds'])
+    sources = sorted(totals.values(), key=lambda entry: entry['seconds'], reverse=True)
+    report = {
+        'wall_seconds': round(session.seconds, 2),
+        'cpu_seconds': round(session.cpu_seconds, 2),
+        'sleep_seconds': round(sum(session.sleeps.values()), 2),
+        'sleep_by_caller': {caller: round(seconds, 2) for caller, seconds in session.sleeps.items()},
+        'memory_peak': session.memory_peak,
+        'stages': stages,
+        'spans': sources,
+        'hot_functions': hot_functions[:30],
+        'top_allocations': [
+            {'location': str(stat.traceback), 'size': stat.size, 'count': stat.count}
+            for stat in session.top_allocations
+        ],
+        'samples': session.sample_count,
+    }
+    with open(os.path.join(directory, 'report.json'), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print("\n" + "="*60)
+    print("🔬 性能剖析")
+    print("="*60)
+    print(f"墙钟 {report['wall_seconds']} 秒，CPU {report['cpu_seconds']} 秒，"
+          f"固定等待（各线程累计）{report['sleep_seconds']} 秒，内存峰值 {format_bytes(session.memory_peak)}")
+    for span in stages:
+        print(f"  {span['name']:<12}{span['seconds']:>8.2f} 秒   内存峰值 {format_bytes(span['memory_peak'])}")
+    if session.sleeps:
+        print("固定等待:")
+        for caller, seconds in sorted(session.sleeps.items(), key=lambda entry: entry[1], reverse=True):
+            print(f"  {caller:<32}{seconds:>8.2f} 秒")
+    if sources:
+        print("耗时最多的新闻源 / 请求:")
+        for entry in sources[:10]:
+            print(f"  {entry['name']:<40}{entry['seconds']:>8.2f} 秒（{entry['count']} 次，最长 {entry['max_seconds']:.2f} 秒）")
+    print("CPU 热点（主线程，按自身耗时）:")
+    for entry in hot_functions[:10]:
+        print(f"  {entry['function']:<60}{entry['own_seconds']:>8.3f} 秒")
+    print(f"报告和火焰图文件已写入 {directory}/（report.json / cpu.prof / stacks.folded）")
+    return report
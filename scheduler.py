@@ -12,6 +12,10 @@ import sys
 import os
 from datetime import datetime
 
+# 抓取脚本各阶段的默认时间预算（秒），可用 FETCH_DEADLINE 等环境变量覆盖
+STAGE_DEADLINES = {'FETCH': 150, 'TWEETS': 120, 'TRANSLATE': 240}
+
+
 def run_news_fetch(filter_arsenal=False):
     """
     执行新闻抓取脚本
@@ -36,6 +40,10 @@ def run_news_fetch(filter_arsenal=False):
         # 如果设置了环境变量，传递给子进程
         env = os.environ.copy()
         
+        # 各阶段的默认时间预算（秒），合计留出余量，确保在 10 分钟超时前完成发布
+        for name, seconds in STAGE_DEADLINES.items():
+            env.setdefault(f'{name}_DEADLINE', str(seconds))
+        
         # 执行脚本
         result = subprocess.run(
             cmd,
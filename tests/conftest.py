@@ -0,0 +1,70 @@
+import os
+import sys
+from types import SimpleNamespace
+
+# 测试直接导入仓库根目录下的脚本模块
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """在临时目录中运行抓取脚本（带 public/），不使用持久缓存"""
+    import fetch_football_news
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'public').mkdir()
+    monkeypatch.setattr(fetch_football_news, 'shared_cache', lambda namespace, ttl=None: None)
+    monkeypatch.delenv('GITHUB_OUTPUT', raising=False)
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    return tmp_path
+
+
+class FakeOpenAI:
+    """记录发送的提示词的 OpenAI 客户端：返回 "译文 <序号>"，fail=True 时每次请求都抛出异常"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.prompts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, messages, **kwargs):
+        self.prompts.append(messages[-1]['content'])
+        if self.fail:
+            raise RuntimeError('OpenAI unavailable')
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+        message = SimpleNamespace(content=f" 译文 {len(self.prompts)} ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+@pytest.fixture
+def fake_openai():
+    """创建 FakeOpenAI 客户端的工厂"""
+    return FakeOpenAI
+
+
+@pytest.fixture
+def pipeline(workdir, monkeypatch):
+    """
+    替换 main() 的抓取和翻译步骤，之后可以直接调用 fetch_football_news.main()
+
+    用法：pipeline(news=[...], tweets=[...], translate=函数)，返回临时工作目录。
+    news / tweets 每次抓取都返回副本；tweets 也可以是函数（接收 fetch_journalist_tweets 的参数）。
+    translate 替换 process_news_with_translation，默认原样返回（不翻译）。
+    """
+    import fetch_football_news
+
+    def install(news=(), tweets=(), translate=None):
+        monkeypatch.setattr(fetch_football_news, 'fetch_all_news',
+                            lambda **kwargs: [dict(item) for item in news])
+        if callable(tweets):
+            monkeypatch.setattr(fetch_football_news, 'fetch_journalist_tweets', tweets)
+        else:
+            monkeypatch.setattr(fetch_football_news, 'fetch_journalist_tweets',
+                                lambda **kwargs: [dict(item) for item in tweets])
+        monkeypatch.setattr(fetch_football_news, 'process_news_with_translation',
+                            translate or (lambda news_items, **kwargs: news_items))
+        return workdir
+
+    return install
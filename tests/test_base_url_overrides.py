@@ -0,0 +1,32 @@
+import fetch_football_news as ffn
+
+
+class FakeNamespace:
+    def __init__(self, namespace):
+        self.namespace = namespace
+
+
+def test_override_runs_use_separate_cache_namespace(monkeypatch):
+    monkeypatch.setattr(ffn, 'cache_namespace', lambda namespace, ttl=None: FakeNamespace(namespace))
+
+    monkeypatch.setattr(ffn, 'BASE_URL_OVERRIDES', [])
+    assert ffn.shared_cache('translation').namespace == 'translation'
+
+    monkeypatch.setattr(ffn, 'BASE_URL_OVERRIDES', ['http://127.0.0.1:8090'])
+    scoped = ffn.shared_cache('translation').namespace
+    assert scoped.startswith('translation@') and scoped != 'translation'
+
+
+def test_override_runs_do_not_publish(pipeline, monkeypatch):
+    monkeypatch.setattr(ffn, 'BASE_URL_OVERRIDES', ['http://127.0.0.1:8090'])
+    workdir = pipeline(news=[{
+        'source': 'BBC Sport', 'title': 'Mock title', 'link': 'https://mock.local/1',
+        'published': '2026-10-19T12:00:00', 'published_raw': '',
+    }])
+
+    ffn.main()
+
+    assert (workdir / 'football_news_translated.json').exists()
+    assert list((workdir / 'public').iterdir()) == []
+    assert not (workdir / 'source_state.json').exists()
+    assert not (workdir / 'translation_cache.json').exists()
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import fetch_football_news as ffn
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def tweet(author, minutes_ago, now, tweet_id):
+    return {'screen_name': author, 'text': f'{author} {tweet_id}', 'tweet_id': str(tweet_id),
+            'created_at': (now - timedelta(minutes=minutes_ago)).isoformat()}
+
+
+def test_bulk_split_only_returns_complete_users(monkeypatch):
+    now = datetime.utcnow().replace(microsecond=0)
+    timeline = [
+        tweet('A', 1, now, 1), tweet('A', 2, now, 2),
+        {'user_info': {'screen_name': 'b'}, 'text': 'b', 'tweet_id': '3',
+         'created_at': (now - timedelta(minutes=3)).isoformat()},
+        tweet('A', 50, now, 4),
+    ]
+    requests_made = []
+
+    def fake_get(url, headers=None, params=None, timeout=None):
+        requests_made.append(params)
+        return FakeResponse({'timeline': timeline})
+
+    monkeypatch.setattr(ffn.requests, 'get', fake_get)
+    results = ffn.fetch_tweets_bulk_with_rapidapi(
+        ['A', 'B', 'C', 'D'], 'key',
+        limits={'A': 3, 'B': 3, 'C': 3, 'D': 3},
+        cutoffs={'A': None, 'B': None, 'C': now - timedelta(minutes=30), 'D': now - timedelta(minutes=60)},
+    )
+
+    assert len(requests_made) == 1
+    assert requests_made[0]['query'] == 'from:A OR from:B OR from:C OR from:D'
+    # A 拿满了 3 条；C 的截止时间之后的推文都在结果里（没有新推文）
+    assert [item['tweet_id'] for item in results['A']] == ['1', '2', '4']
+    assert results['C'] == []
+    # B 只拿到 1 条（可能被 A 挤掉），D 的截止时间早于结果中最早的推文，都需要逐个抓取
+    assert 'B' not in results and 'D' not in results
+
+
+def test_bulk_failure_falls_back_to_per_user(monkeypatch):
+    def failing_get(*args, **kwargs):
+        raise ffn.requests.ConnectionError('down')
+
+    monkeypatch.setattr(ffn.requests, 'get', failing_get)
+    assert ffn.fetch_tweets_bulk_with_rapidapi(['A'], 'key', limits={'A': 5}) == {}
+
+
+def test_bulk_search_covers_all_journalists_against_mock(workdir, monkeypatch):
+    import threading
+    from http.server import ThreadingHTTPServer
+
+    import mock_providers
+
+    monkeypatch.setattr(mock_providers, 'MOCK_LATENCY_MS', 0)
+    monkeypatch.setattr(mock_providers, 'MOCK_JITTER_MS', 0)
+    monkeypatch.setattr(mock_providers, 'MOCK_ERROR_RATE', 0)
+    monkeypatch.setattr(mock_providers, 'stats', {'requests': 0, 'errors': 0, 'rate_limited': 0, 'by_endpoint': {}})
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), mock_providers.MockHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(ffn, 'RAPIDAPI_BASE_URL', f"http://127.0.0.1:{server.server_address[1]}")
+    try:
+        tweets = ffn.fetch_journalist_tweets(limit_per_journalist=5, use_rapidapi=True,
+                                             rapidapi_key='key', bulk=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    journalists = set(ffn.JOURNALISTS.values())
+    # 一次搜索请求覆盖所有记者，不再逐个请求时间线
+    assert mock_providers.stats['by_endpoint'] == {'/search.php': 1}
+    assert {tweet['source'] for tweet in tweets} == {f"Twitter - {username}" for username in journalists}
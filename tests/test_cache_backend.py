@@ -0,0 +1,167 @@
+import fnmatch
+import time
+
+import pytest
+
+import cache_backend
+import fetch_football_news as ffn
+from cache_backend import CacheNamespace, RedisCache, SQLiteCache
+
+
+class FakeRedis:
+    """只实现 RedisCache 用到的命令（GET / SET PX NX / DELETE / SCAN）的内存版 Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    @classmethod
+    def from_url(cls, url, decode_responses=False):
+        return cls()
+
+    def _alive(self, key):
+        entry = self.data.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def get(self, key):
+        entry = self._alive(key)
+        return entry[0] if entry else None
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and self._alive(key):
+            return None
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match='*', count=None):
+        return [key for key in list(self.data) if self._alive(key) and fnmatch.fnmatchcase(key, match)]
+
+
+class FakeRedisModule:
+    Redis = FakeRedis
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def backend(request, tmp_path, monkeypatch):
+    if request.param == 'redis':
+        monkeypatch.setattr(cache_backend, 'redis', FakeRedisModule, raising=False)
+        monkeypatch.setattr(cache_backend, 'REDIS_AVAILABLE', True)
+        return cache_backend.create_cache_backend('redis://localhost:6379/0')
+    return cache_backend.create_cache_backend(f"sqlite:///{tmp_path / 'cache.db'}")
+
+
+def test_create_cache_backend_picks_backend_by_url(backend):
+    assert isinstance(backend, (RedisCache, SQLiteCache))
+
+
+def test_namespace_behaves_like_a_dict(backend):
+    cache = CacheNamespace(backend, 'translation')
+    cache['a'] = '译文'
+    cache['b'] = {'etag': 'x'}
+
+    assert cache['a'] == '译文' and cache.get('b') == {'etag': 'x'}
+    assert 'missing' not in cache and cache.get('missing', 'default') == 'default'
+    assert len(cache) == 2
+    assert 'translation' in list(backend.namespaces())
+
+
+def test_entries_expire_after_ttl(backend):
+    cache = CacheNamespace(backend, 'tweets', ttl=0.05)
+    cache['user|10'] = [{'title': 'tweet'}]
+    assert 'user|10' in cache
+    time.sleep(0.1)
+    assert 'user|10' not in cache
+
+
+def test_claim_is_exclusive_until_released(backend):
+    cache = CacheNamespace(backend, 'translation')
+    assert cache.claim('key', ttl=60)
+    assert not cache.claim('key', ttl=60)
+    cache.release('key')
+    assert cache.claim('key', ttl=60)
+
+
+def test_wait_for_returns_value_written_by_other_process(backend):
+    cache = CacheNamespace(backend, 'translation')
+    assert cache.wait_for('key', timeout=0.05, interval=0.01) is None
+    cache['key'] = '译文'
+    assert cache.wait_for('key', timeout=0.05, interval=0.01) == '译文'
+
+
+def test_redis_cache_requires_redis_package(monkeypatch):
+    monkeypatch.setattr(cache_backend, 'REDIS_AVAILABLE', False)
+    with pytest.raises(RuntimeError):
+        RedisCache('redis://localhost:6379/0')
+
+
+def test_translation_releases_claim_after_caching_result(backend, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setattr(ffn, 'OpenAI', lambda **kwargs: object())
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+    field = ffn.LANGUAGES['zh-CN']['field']
+    monkeypatch.setattr(ffn, 'translate_title_with_ai',
+                        lambda text, client, lang, budget=None: {field: f"译文 {text}"})
+
+    cache = CacheNamespace(backend, 'translation')
+    items = [{'title': f'Arsenal news {i}', 'source': 'BBC Sport'} for i in range(3)]
+    ffn.process_news_with_translation(items, cache=cache, max_workers=2)
+
+    assert [item[field] for item in items] == [f"译文 Arsenal news {i}" for i in range(3)]
+    assert backend.count('translation:claim') == 0
+
+
+def fetch_romano(backend, monkeypatch, since_marks=None):
+    """用指定的缓存后端抓取一位记者的推文，返回推文缓存命名空间和请求次数"""
+    tweet_cache = CacheNamespace(backend, 'tweets', 300)
+    requests_made = []
+
+    def fake_fetch(username, api_key, limit, timeout=15, cutoff=None):
+        requests_made.append(username)
+        return [{'source': f'Twitter - {username}', 'title': 'Here we go!', 'link': 'https://x.com/f/1',
+                 'published': '2026-10-19T12:00:00'}]
+
+    monkeypatch.setattr(ffn, 'shared_cache', lambda namespace, ttl=None: tweet_cache)
+    monkeypatch.setattr(ffn, 'fetch_tweets_with_rapidapi', fake_fetch)
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+    ffn.fetch_journalist_tweets({'Fabrizio Romano': 'FabrizioRomano'}, limit_per_journalist=5,
+                                use_rapidapi=True, rapidapi_key='key', since_marks=since_marks)
+    return tweet_cache, requests_made
+
+
+def test_tweet_fetch_caches_timeline_and_releases_own_claim(backend, monkeypatch):
+    tweet_cache, requests_made = fetch_romano(backend, monkeypatch)
+
+    assert requests_made == ['FabrizioRomano']
+    assert tweet_cache.get('FabrizioRomano|5')
+    assert backend.count('tweets:claim') == 0
+
+
+def test_tweet_fetch_does_not_release_claim_held_by_another_worker(backend, monkeypatch):
+    other = CacheNamespace(backend, 'tweets', 300)
+    assert other.claim('FabrizioRomano|5', ttl=60)
+    monkeypatch.setattr(CacheNamespace, 'wait_for', lambda self, key, timeout=10, interval=0.5: None)
+
+    fetch_romano(backend, monkeypatch)
+
+    # 另一个进程的 claim 仍然有效
+    assert not other.claim('FabrizioRomano|5', ttl=60)
+
+
+def test_incremental_tweet_fetch_skips_claim_and_wait(backend, monkeypatch):
+    def no_wait(self, key, timeout=10, interval=0.5):
+        raise AssertionError('带截止时间的抓取不会写缓存，不应等待')
+
+    other = CacheNamespace(backend, 'tweets', 300)
+    assert other.claim('FabrizioRomano|5', ttl=60)
+    monkeypatch.setattr(CacheNamespace, 'wait_for', no_wait)
+
+    tweet_cache, requests_made = fetch_romano(backend, monkeypatch,
+                                              since_marks={'Fabrizio Romano': '2026-10-19T00:00:00'})
+
+    assert requests_made == ['FabrizioRomano']
+    assert tweet_cache.get('FabrizioRomano|5') is None
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import fetch_football_news as ffn
+
+
+def item(title, source='BBC Sport', hours_ago=1.0):
+    published = datetime.utcnow() - timedelta(hours=hours_ago)
+    return {'title': title, 'source': source, 'published': published.isoformat()}
+
+
+def test_build_item_filter_drops_empty_conditions():
+    assert ffn.build_item_filter() is None
+    assert ffn.build_item_filter(clubs=[], keywords=None) is None
+    assert ffn.build_item_filter(clubs=['arsenal'], max_age_hours=6) == {'clubs': ['arsenal'], 'max_age_hours': 6}
+
+
+def test_item_matches_requires_every_condition():
+    item_filter = ffn.build_item_filter(clubs=['arsenal'], sources=['twitter'], max_age_hours=6)
+
+    assert ffn.item_matches(item('Gunners confirm Saka injury', 'Twitter - FabrizioRomano'), item_filter)
+    assert not ffn.item_matches(item('Gunners confirm Saka injury', 'BBC Sport'), item_filter)
+    assert not ffn.item_matches(item('Chelsea sign striker', 'Twitter - FabrizioRomano'), item_filter)
+    assert not ffn.item_matches(item('Arsenal win', 'Twitter - FabrizioRomano', hours_ago=12), item_filter)
+    assert ffn.item_matches(item('anything'), None)
+
+
+def test_max_age_keeps_items_without_a_parsable_date():
+    item_filter = ffn.build_item_filter(max_age_hours=1)
+    assert ffn.item_matches({'title': 'Arsenal', 'published': ''}, item_filter)
+
+
+def test_item_filter_from_env(monkeypatch):
+    monkeypatch.setenv('FILTER_KEYWORDS', 'transfer, here we go ,')
+    monkeypatch.setenv('FILTER_SOURCES', 'Twitter')
+    monkeypatch.delenv('FILTER_MAX_AGE_HOURS', raising=False)
+
+    assert ffn.item_filter_from_env(filter_arsenal=True) == {
+        'clubs': ['arsenal'],
+        'keywords': ['transfer', 'here we go'],
+        'sources': ['Twitter'],
+    }
@@ -0,0 +1,32 @@
+import json
+
+import news_archive
+
+
+def test_partition_date_normalizes_formats():
+    assert news_archive.partition_date({'published': '2026-10-19T13:40:00'}) == '2026-10-19'
+    assert news_archive.partition_date({'published': 'Mon Oct 19 23:40:00 -0300 2026'}) == '2026-10-20'
+    assert news_archive.partition_date({'published': 'Mon, 19 Oct 2026 13:40:00 GMT'}) == '2026-10-19'
+    assert news_archive.partition_date({'published': 'yesterday'}) == news_archive.UNDATED_PARTITION
+
+
+def test_archive_dedups_twitter_dates_and_normalizes_index(tmp_path):
+    items = [
+        {'link': 'https://twitter.com/a/status/1', 'published': 'Mon Oct 19 13:40:00 +0000 2026'},
+        {'link': 'https://example.com/1', 'published': '2026-10-19T09:00:00'},
+        {'link': 'https://example.com/2', 'published': 'not a date'},
+    ]
+
+    assert news_archive.archive_news(items, str(tmp_path)) == 3
+    # 重复运行（例如第二天）不会再次归档
+    assert news_archive.archive_news(items, str(tmp_path)) == 0
+
+    index = json.loads((tmp_path / 'index.json').read_text(encoding='utf-8'))
+    entry = index['partitions']['2026-10-19']
+    assert entry['count'] == 2
+    assert entry['first'] == '2026-10-19T09:00:00'
+    assert entry['last'] == '2026-10-19T13:40:00'
+    assert index['partitions']['undated']['count'] == 1
+
+    links = [item['link'] for item in news_archive.read_archive('2026-10-19', directory=str(tmp_path))]
+    assert links == ['https://twitter.com/a/status/1', 'https://example.com/1']
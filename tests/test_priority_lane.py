@@ -0,0 +1,36 @@
+import json
+
+import fetch_football_news as ffn
+
+
+def fetched():
+    return [
+        {'source': 'BBC Sport', 'title': 'Arsenal win again', 'link': 'https://example.com/1',
+         'published': '2026-10-19T12:00:00', 'published_raw': ''},
+        {'source': 'Twitter - FabrizioRomano', 'title': 'Here we go! Saka extends', 'link': 'https://x.com/f/1',
+         'published': '2026-10-19T11:00:00', 'published_raw': '', 'like_count': 5000},
+    ]
+
+
+def fake_translation(news_items, priority_flush=None, **kwargs):
+    for item in news_items:
+        item['is_transfer'] = ffn.is_transfer_title(item['title'])
+        item['title_cn'] = f"译 {item['title']}"
+    if priority_flush is not None:
+        priority_flush([item for item in news_items if ffn.is_priority_news(item)])
+    return news_items
+
+
+def test_priority_flush_keeps_news_json_and_hash_in_sync(pipeline):
+    workdir = pipeline(news=fetched()[:1], tweets=fetched()[1:], translate=fake_translation)
+
+    ffn.main(use_priority=True, use_ranking=True)
+    first = (workdir / 'public' / 'news.json').read_text(encoding='utf-8')
+
+    # 第二轮内容不变：优先通道中途写入的（不带排序字段的）news.json 不能留在磁盘上
+    ffn.main(use_priority=True, use_ranking=True)
+    published = json.loads((workdir / 'public' / 'news.json').read_text(encoding='utf-8'))
+    assert json.loads(first) == published
+    assert all('rank' in item for item in published)
+    stored_hash = (workdir / 'public' / 'news.hash').read_text(encoding='utf-8').strip()
+    assert stored_hash == ffn.compute_content_hash(published)
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+import fetch_football_news as ffn
+
+
+NEWS = [{'source': 'BBC Sport', 'title': 'Arsenal win again', 'link': 'https://example.com/1',
+         'published': '2026-10-19T12:00:00', 'published_raw': ''}]
+
+
+def fake_translation(news_items, **kwargs):
+    for item in news_items:
+        item['title_cn'] = f"译 {item['title']}"
+    return news_items
+
+
+@pytest.fixture
+def site(pipeline):
+    return pipeline(news=NEWS, translate=fake_translation)
+
+
+def run(workdir, monkeypatch, **kwargs):
+    output = workdir / 'github_output'
+    output.write_text('', encoding='utf-8')
+    monkeypatch.setenv('GITHUB_OUTPUT', str(output))
+    ffn.main(**kwargs)
+    return 'changed=true' in output.read_text(encoding='utf-8')
+
+
+def test_unchanged_content_skips_publish(site, monkeypatch):
+    assert run(site, monkeypatch)
+    assert not run(site, monkeypatch)
+
+
+def test_missing_news_json_is_restored_when_hash_is_unchanged(site, monkeypatch):
+    assert run(site, monkeypatch)
+    news_file = site / 'public' / 'news.json'
+    published = json.loads(news_file.read_text(encoding='utf-8'))
+    news_file.unlink()
+
+    assert run(site, monkeypatch)
+    assert json.loads(news_file.read_text(encoding='utf-8')) == published
+
+
+def test_missing_derived_outputs_are_written_when_hash_is_unchanged(site, monkeypatch):
+    assert run(site, monkeypatch, use_ranking=True)
+    (site / 'public' / 'news-top.json').unlink()
+
+    assert run(site, monkeypatch, use_ranking=True, static_outputs=True)
+    assert (site / 'public' / 'news-top.json').exists()
+    assert (site / 'public' / 'news-manifest.json').exists()
+    assert ffn.missing_outputs('public', top_news=[], static_outputs=True) == []
+
+
+def test_tweet_without_date_gets_stable_published_time():
+    tweet = {'id': '1847000000000000000', 'text': 'Here we go!'}
+    first = ffn.rapidapi_tweet(tweet, 'FabrizioRomano')
+    second = ffn.rapidapi_tweet(dict(tweet), 'FabrizioRomano')
+
+    assert first == second
+    assert first['published'].startswith('2024-10-')
+    assert ffn.rapidapi_tweet({'text': 'no id'}, 'user')['published'] == ''
+
+
+def test_engagement_changes_do_not_change_content_hash():
+    item = {'source': 'Twitter - FabrizioRomano', 'title': 'Here we go!', 'link': 'https://x.com/f/1',
+            'title_cn': '官宣！', 'like_count': 100, 'retweet_count': 10, 'score': 1.5, 'rank': 1}
+    busier = dict(item, like_count=5000, retweet_count=900, score=3.2, rank=2)
+
+    assert ffn.compute_content_hash([item]) == ffn.compute_content_hash([busier])
+    assert ffn.compute_content_hash([item]) != ffn.compute_content_hash([dict(item, title_cn='重磅！')])
@@ -0,0 +1,28 @@
+import fetch_football_news as ffn
+
+
+def rss(link, published):
+    return {'source': 'BBC Sport', 'title': link, 'link': link, 'published': published}
+
+
+def stale_tweet():
+    # RapidAPI 推文保留 Twitter 格式的时间，按字符串比较会排在所有 ISO 时间之前
+    return {'source': 'Twitter - FabrizioRomano', 'title': 'old', 'link': 'https://x.com/f/1',
+            'published': 'Wed Oct 01 10:00:00 +0000 2025'}
+
+
+def test_merge_news_items_sorts_mixed_date_formats_by_time():
+    fresh = [rss('https://example.com/1', '2026-10-19T12:00:00'),
+             rss('https://example.com/2', '2026-10-19T11:00:00'),
+             rss('https://example.com/3', 'Mon, 19 Oct 2026 10:00:00 GMT')]
+
+    merged = ffn.merge_news_items([stale_tweet()], fresh, max_items=2)
+
+    assert [item['link'] for item in merged] == ['https://example.com/1', 'https://example.com/2']
+
+
+def test_undated_items_sort_last():
+    items = [rss('https://example.com/undated', ''), stale_tweet(), rss('https://example.com/1', '2026-10-19T12:00:00')]
+    items.sort(key=ffn.published_sort_key, reverse=True)
+    assert [item['link'] for item in items] == ['https://example.com/1', 'https://x.com/f/1',
+                                                'https://example.com/undated']
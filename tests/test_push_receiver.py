@@ -0,0 +1,127 @@
+import json
+import sys
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+
+import pytest
+import requests
+
+import fetch_football_news as ffn
+import mock_providers
+import push_receiver
+
+
+def test_webhook_keeps_only_whitelisted_fields():
+    items = push_receiver.parse_webhook_json({
+        'source': 'Fabrizio Romano',
+        'items': [
+            {'title': 'Here we go!', 'link': 'https://x.com/1', 'title_cn': '伪造的译文', 'rank': 1,
+             'like_count': 10},
+            {'title': 'missing link'},
+        ],
+    })
+
+    assert len(items) == 1
+    assert items[0]['source'] == 'Fabrizio Romano'
+    assert items[0]['like_count'] == 10
+    assert 'title_cn' not in items[0] and 'rank' not in items[0]
+
+
+def test_pushed_items_publish_all_outputs(workdir, monkeypatch):
+    def fake_translation(news_items, target_languages=None, **kwargs):
+        for item in news_items:
+            for code in target_languages:
+                item[ffn.LANGUAGES[code]['field']] = f"[{code}] {item['title']}"
+        return news_items
+
+    monkeypatch.setattr(push_receiver, 'process_news_with_translation', fake_translation)
+    monkeypatch.setattr(push_receiver, 'load_translation_cache', lambda: {})
+    monkeypatch.setenv('TARGET_LANGUAGES', 'zh-CN,ja')
+    monkeypatch.setenv('RANK_NEWS', 'true')
+    (workdir / 'public' / 'news.json').write_text(json.dumps([
+        {'source': 'BBC Sport', 'title': 'Old story', 'link': 'https://example.com/old',
+         'published': '2026-10-19T08:00:00', 'published_raw': ''},
+    ]), encoding='utf-8')
+
+    total = push_receiver.process_pushed_items([
+        {'source': 'Webhook', 'title': 'Arsenal sign striker', 'link': 'https://example.com/new',
+         'published': '2026-10-19T12:00:00', 'published_raw': ''},
+    ], str(workdir / 'public'))
+
+    public = workdir / 'public'
+    published = json.loads((public / 'news.json').read_text(encoding='utf-8'))
+    assert total == len(published) == 2
+    assert (public / 'news.hash').read_text(encoding='utf-8').strip() == ffn.compute_content_hash(published)
+    assert json.loads((public / 'news.ja.json').read_text(encoding='utf-8'))[0]['title_ja'].startswith('[ja]')
+    assert (public / 'news.zh-CN.json').exists()
+    assert len(json.loads((public / 'news-top.json').read_text(encoding='utf-8'))) == 2
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    """启动模拟 Hub 和推送接收服务（随机端口）"""
+    monkeypatch.setattr(mock_providers, 'MOCK_LATENCY_MS', 0)
+    monkeypatch.setattr(mock_providers, 'MOCK_JITTER_MS', 0)
+    monkeypatch.setattr(push_receiver, 'PUSH_SECRET', 'secret')
+    started = []
+    for handler in (mock_providers.MockHandler, push_receiver.PushHandler):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        started.append(server)
+    yield [f"http://127.0.0.1:{server.server_address[1]}" for server in started]
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def test_websub_subscribe_and_push_through_mock_hub(servers):
+    hub_base, receiver_base = servers
+    topic = 'https://feeds.example.com/football/rss'
+    callback = f"{receiver_base}/websub?source=Mock Feed"
+
+    assert push_receiver.subscribe(f"{hub_base}/hub", topic, callback, 'secret')
+
+    response = requests.post(f"{hub_base}/hub", data={'hub.mode': 'publish', 'hub.url': topic}, timeout=10)
+    assert response.json() == {'delivered': 1}
+
+    news_items = push_receiver.push_queue.get(timeout=5)
+    assert len(news_items) == mock_providers.MOCK_ITEMS
+    assert {item['source'] for item in news_items} == {'Mock Feed'}
+
+
+def test_websub_push_with_wrong_signature_is_rejected(servers, monkeypatch):
+    hub_base, receiver_base = servers
+    topic = 'https://feeds.example.com/other/rss'
+    assert push_receiver.subscribe(f"{hub_base}/hub", topic, f"{receiver_base}/websub", 'wrong')
+
+    response = requests.post(f"{hub_base}/hub", data={'hub.mode': 'publish', 'hub.url': topic}, timeout=10)
+    assert response.json() == {'delivered': 0}
+
+
+def test_undated_webhook_item_is_stamped_in_utc():
+    items = push_receiver.parse_webhook_json({'title': 'Here we go!', 'link': 'https://x.com/1'})
+    published = ffn.parse_published(items[0]['published'])
+    assert abs((published - datetime.utcnow()).total_seconds()) < 60
+
+
+def test_public_listener_requires_secret(monkeypatch):
+    monkeypatch.setattr(push_receiver, 'PUSH_SECRET', None)
+    monkeypatch.setattr(push_receiver, 'PUSH_HOST', '0.0.0.0')
+    monkeypatch.setattr(sys, 'argv', ['push_receiver.py'])
+    with pytest.raises(SystemExit):
+        push_receiver.main()
+    assert push_receiver.is_loopback('127.0.0.1') and not push_receiver.is_loopback('0.0.0.0')
+
+
+def test_polling_keeps_pushed_items_from_unpolled_sources(pipeline):
+    workdir = pipeline(news=[{'source': 'BBC Sport', 'title': 'Arsenal win again', 'link': 'https://example.com/1',
+                              'published': datetime.utcnow().isoformat(), 'published_raw': ''}])
+    pushed = {'source': 'Webhook', 'title': 'Arsenal sign striker', 'link': 'https://example.com/pushed',
+              'published': datetime.utcnow().isoformat(), 'published_raw': '', 'title_cn': '阿森纳签下前锋'}
+    (workdir / 'public' / 'news.json').write_text(json.dumps([pushed]), encoding='utf-8')
+
+    ffn.main()
+
+    published = json.loads((workdir / 'public' / 'news.json').read_text(encoding='utf-8'))
+    assert {item['link'] for item in published} == {'https://example.com/1', 'https://example.com/pushed'}
@@ -0,0 +1,47 @@
+import fetch_football_news as ffn
+
+
+def titles(*values):
+    return [{'title': value, 'source': f'Source {i}', 'published': '2026-10-19T12:00:00'}
+            for i, value in enumerate(values)]
+
+
+def test_same_template_different_fixtures_are_not_merged():
+    items = titles('Arsenal vs Chelsea: team news', 'Arsenal vs Tottenham: team news')
+    assert ffn.cluster_news(items) == [[0], [1]]
+
+
+def test_same_template_different_players_are_not_merged():
+    items = titles('Arsenal agree deal to sign Saka after medical',
+                   'Arsenal agree deal to sign Rice after medical')
+    assert ffn.cluster_news(items) == [[0], [1]]
+
+
+def test_same_story_from_different_sources_is_merged():
+    items = titles('Saka signs new Arsenal contract until 2030',
+                   'Arsenal: Saka signs new contract until 2030',
+                   'Haaland scores twice as Man City win')
+    assert ffn.cluster_news(items) == [[0, 1], [2]]
+
+
+def test_items_must_match_every_cluster_member():
+    # 第三条与第二条相似，但与第一条不相似，不能通过第二条“串”进同一组
+    items = titles('Arsenal confirm Saka injury ahead of Chelsea clash',
+                   'Saka injury: Arsenal confirm winger misses Chelsea clash',
+                   'Arsenal winger misses Chelsea clash with knock')
+    clusters = ffn.cluster_news(items)
+    assert [0, 1] in clusters and [2] in clusters
+
+
+def test_rank_news_ranks_one_item_per_story():
+    items = titles('Saka signs new Arsenal contract until 2030',
+                   'Arsenal: Saka signs new contract until 2030',
+                   'Haaland scores twice as Man City win')
+    items[2]['like_count'] = 50000
+
+    top = ffn.rank_news(items)
+
+    assert [item['title'] for item in top] == ['Haaland scores twice as Man City win',
+                                               'Saka signs new Arsenal contract until 2030']
+    assert [item.get('rank') for item in items] == [2, None, 1]
+    assert items[0]['cluster_size'] == items[1]['cluster_size'] == 2
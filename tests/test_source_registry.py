@@ -0,0 +1,123 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import fetch_football_news as ffn
+
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Arsenal sign striker</title><link>https://example.com/1</link><pubDate>Mon, 19 Oct 2026 12:00:00 GMT</pubDate></item>
+<item><title>Chelsea lose again</title><link>https://example.com/2</link><pubDate>Mon, 19 Oct 2026 11:00:00 GMT</pubDate></item>
+<item><title>Gunners injury update</title><link>https://example.com/3</link><pubDate>Mon, 19 Oct 2026 10:00:00 GMT</pubDate></item>
+<item><title>Arsenal women win</title><link>https://example.com/4</link><pubDate>Mon, 19 Oct 2026 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def write_sources(tmp_path, config):
+    path = tmp_path / 'sources.json'
+    path.write_text(json.dumps(config), encoding='utf-8')
+    return str(path)
+
+
+def test_registry_fills_defaults_and_sorts_by_priority(tmp_path):
+    registry = ffn.load_source_registry(write_sources(tmp_path, {
+        'feeds': [
+            {'name': 'Low', 'url': 'https://example.com/low'},
+            {'name': 'High', 'url': 'https://example.com/high', 'priority': 2},
+            {'url': 'https://example.com/unnamed'},
+        ],
+        'journalists': [{'name': 'Fabrizio Romano', 'username': 'FabrizioRomano', 'max_items': 10}],
+    }))
+
+    assert [source['name'] for source in registry['feeds']] == ['High', 'Low']
+    assert registry['feeds'][1]['timeout'] == 15 and registry['feeds'][1]['enabled'] is True
+    assert registry['journalists'][0]['max_items'] == 10
+
+
+def test_registry_converts_and_validates_settings(tmp_path):
+    registry = ffn.load_source_registry(write_sources(tmp_path, {
+        'feeds': [
+            {'name': 'Null priority', 'url': 'https://example.com/a', 'priority': None},
+            {'name': 'Strings', 'url': 'https://example.com/b', 'priority': '1', 'timeout': '20',
+             'max_items': '5', 'enabled': 'false', 'clubs': 'arsenal'},
+            {'name': 'Invalid', 'url': 'https://example.com/c', 'weight': 'heavy', 'clubs': 3},
+        ],
+    }))
+
+    sources = {source['name']: source for source in registry['feeds']}
+    assert sources['Null priority']['priority'] == 0
+    assert sources['Strings'] == dict(sources['Strings'], priority=1.0, timeout=20.0, max_items=5,
+                                      enabled=False, clubs=['arsenal'])
+    assert sources['Invalid']['weight'] == 1.0 and sources['Invalid']['clubs'] == []
+
+
+def test_registry_without_file_uses_builtin_sources(tmp_path):
+    registry = ffn.load_source_registry(str(tmp_path / 'missing.json'))
+    assert [source['name'] for source in registry['feeds']] == list(ffn.RSS_FEEDS)
+    assert len(registry['journalists']) == len(ffn.JOURNALISTS)
+
+
+def test_registry_with_invalid_json_raises(tmp_path):
+    path = tmp_path / 'sources.json'
+    path.write_text('{not json', encoding='utf-8')
+    with pytest.raises(ValueError):
+        ffn.load_source_registry(str(path))
+
+
+def test_is_source_due():
+    now = datetime(2026, 10, 19, 12, 0)
+    source = {'name': 'BBC Sport', 'poll_interval': 30}
+    fetched_at = lambda minutes: {'BBC Sport': {'last_fetched': (now - timedelta(minutes=minutes)).isoformat()}}
+
+    assert ffn.is_source_due({'name': 'BBC Sport', 'poll_interval': 0}, fetched_at(1), now)
+    assert ffn.is_source_due(source, {}, now)
+    assert not ffn.is_source_due(source, fetched_at(10), now)
+    assert ffn.is_source_due(source, fetched_at(30), now)
+    assert ffn.is_source_due(source, {'BBC Sport': {'last_fetched': 'yesterday'}}, now)
+
+
+def test_feed_settings_limit_clubs_and_items(tmp_path, monkeypatch):
+    monkeypatch.setattr(ffn, 'fetch_feed_bytes', lambda url, timeout: RSS)
+    registry = ffn.load_source_registry(write_sources(tmp_path, {
+        'feeds': [{'name': 'Arsenal only', 'url': 'https://example.com/rss', 'clubs': ['arsenal'], 'max_items': 2}],
+    }))
+
+    news = ffn.fetch_all_news(sources=registry['feeds'])
+    assert [item['link'] for item in news] == ['https://example.com/1', 'https://example.com/3']
+
+
+def test_journalist_settings_limit_clubs_and_items(monkeypatch):
+    limits = []
+
+    def fake_fetch(username, api_key, limit, timeout=15, cutoff=None):
+        limits.append(limit)
+        titles = ['Arsenal agree deal', 'Chelsea bid rejected', 'Arsenal medical booked']
+        return [{'source': f'Twitter - {username}', 'title': title, 'link': f'https://x.com/{i}',
+                 'published': '2026-10-19T12:00:00'} for i, title in enumerate(titles[:limit])]
+
+    monkeypatch.setattr(ffn, 'shared_cache', lambda namespace, ttl=None: None)
+    monkeypatch.setattr(ffn, 'fetch_tweets_with_rapidapi', fake_fetch)
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+
+    tweets = ffn.fetch_journalist_tweets({'Fabrizio Romano': 'FabrizioRomano'}, limit_per_journalist=5,
+                                         use_rapidapi=True, rapidapi_key='key',
+                                         source_settings={'Fabrizio Romano': {'max_items': 3, 'clubs': ['arsenal']}})
+
+    assert limits == [3]
+    assert [tweet['title'] for tweet in tweets] == ['Arsenal agree deal', 'Arsenal medical booked']
+
+
+@pytest.mark.parametrize('include_summary', [False, True])
+def test_serial_and_process_pool_fetch_publish_the_same_items(tmp_path, monkeypatch, include_summary):
+    monkeypatch.setattr(ffn, 'fetch_feed_bytes', lambda url, timeout: RSS)
+    sources = ffn.load_source_registry(write_sources(tmp_path, {
+        'feeds': [{'name': 'Test', 'url': 'https://example.com/rss'}],
+    }))['feeds']
+
+    serial = ffn.fetch_all_news(sources=sources, include_summary=include_summary)
+    parallel = ffn.fetch_all_news(sources=sources, include_summary=include_summary, parse_workers=1)
+
+    assert serial == parallel
+    assert [item['is_transfer'] for item in serial] == [True, False, False, False]
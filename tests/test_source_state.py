@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+import fetch_football_news as ffn
+
+
+def news(source, published, title='Arsenal win'):
+    return {'source': source, 'title': title, 'link': f'https://example.com/{source}/{published}',
+            'published': published, 'published_raw': published}
+
+
+def test_update_since_marks_only_moves_forward():
+    state = {'BBC Sport': {'since': '2026-10-19T12:00:00'}}
+    sources = [{'name': 'BBC Sport'}, {'name': 'Fabrizio Romano', 'username': 'FabrizioRomano'}]
+    ffn.update_since_marks(state, sources, [
+        news('BBC Sport', '2026-10-19T11:00:00'),
+        news('Twitter - FabrizioRomano', 'Mon Oct 19 13:40:00 +0000 2026'),
+    ])
+
+    assert state['BBC Sport']['since'] == '2026-10-19T12:00:00'
+    assert state['Fabrizio Romano']['since'] == '2026-10-19T13:40:00'
+
+
+@pytest.fixture
+def fake_pipeline(pipeline):
+    return pipeline(news=[news('BBC Sport', '2026-10-19T12:00:00')])
+
+
+def test_source_state_saved_after_publish(fake_pipeline):
+    ffn.main()
+
+    state = json.loads((fake_pipeline / 'source_state.json').read_text(encoding='utf-8'))
+    assert state['BBC Sport']['since'] == '2026-10-19T12:00:00'
+    assert 'last_fetched' in state['BBC Sport']
+    assert (fake_pipeline / 'public' / 'news.json').exists()
+
+
+def test_source_state_not_saved_when_run_fails_before_publish(fake_pipeline, monkeypatch):
+    def crash(*args, **kwargs):
+        raise RuntimeError('中途退出')
+
+    monkeypatch.setattr(ffn, 'save_to_json', crash)
+    with pytest.raises(RuntimeError):
+        ffn.main()
+
+    assert not (fake_pipeline / 'source_state.json').exists()
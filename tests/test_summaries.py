@@ -0,0 +1,26 @@
+import fetch_football_news as ffn
+
+
+def test_clean_summary_strips_html_and_entities():
+    raw = '<p>Arsenal &amp; Chelsea <b>draw</b></p><script>track()</script>\n\n<style>p {}</style> at&nbsp;home'
+    assert ffn.clean_summary(raw) == 'Arsenal & Chelsea draw at home'
+    assert ffn.clean_summary('') == ''
+    assert ffn.clean_summary(None) == ''
+
+
+def test_clean_summary_truncates_at_word_boundary():
+    text = ffn.clean_summary('Arsenal beat Chelsea, in a thrilling derby', max_length=22)
+    assert text == 'Arsenal beat Chelsea…'
+    assert ffn.clean_summary('Supercalifragilistic', max_length=5) == 'Super…'
+
+
+def test_split_text_chunks_keeps_sentences_together():
+    text = 'First sentence. Second one! Third?'
+    assert ffn.split_text_chunks(text, max_chars=20) == ['First sentence.', 'Second one! Third?']
+    assert ffn.split_text_chunks(text) == [text]
+
+
+def test_split_text_chunks_hard_splits_long_sentences():
+    chunks = ffn.split_text_chunks('Short. ' + 'x' * 25, max_chars=10)
+    assert chunks == ['Short.', 'x' * 10, 'x' * 10, 'x' * 5]
+    assert all(len(chunk) <= 10 for chunk in chunks)
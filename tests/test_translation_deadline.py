@@ -0,0 +1,53 @@
+import time
+
+import fetch_football_news as ffn
+
+
+class SlowCache(dict):
+    """每次读取都稍慢的缓存（模拟共享缓存的网络往返），让任务在线程池里排队"""
+
+    def get(self, key, default=None):
+        time.sleep(0.01)
+        return super().get(key, default)
+
+
+def test_expired_stage_uses_cached_translations_for_queued_tasks(monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.setattr(ffn, 'FREE_TRANSLATOR_AVAILABLE', True)
+
+    def no_requests(*args, **kwargs):
+        raise AssertionError('截止时间之后不应再发起翻译请求')
+
+    monkeypatch.setattr(ffn, 'translate_title_free', no_requests)
+
+    items = [{'title': f'Arsenal news {i}', 'source': 'BBC Sport'} for i in range(30)]
+    cache = SlowCache({ffn.translation_cache_key(item['title'], 'zh-CN', 'google'): f"译文 {i}"
+                       for i, item in enumerate(items)})
+
+    stage = ffn.start_stage({'stages': {}}, 'translate', 0.01)
+    time.sleep(0.05)
+    ffn.process_news_with_translation(items, use_free_translator=True, translator_type='google',
+                                      cache=cache, max_workers=1, stage=stage)
+
+    assert [item['title_cn'] for item in items] == [f"译文 {i}" for i in range(30)]
+    assert not stage.get('untranslated')
+
+
+def test_items_carried_from_cut_sources_are_not_duplicated(pipeline):
+    import json
+
+    tweet = {'source': 'Twitter - FabrizioRomano', 'title': 'Here we go!', 'link': 'https://x.com/f/1',
+             'published': '2026-10-19T11:00:00', 'published_raw': ''}
+
+    def cut_short(stage=None, **kwargs):
+        # "Romano Fabrizio" 别名超时被跳过，与已抓取的 FabrizioRomano 同名
+        stage.update(cut_short=True, skipped=['Twitter - FabrizioRomano'])
+        return [dict(tweet)]
+
+    workdir = pipeline(tweets=cut_short)
+    (workdir / 'public' / 'news.json').write_text(json.dumps([dict(tweet, title_cn='旧译文')]), encoding='utf-8')
+
+    ffn.main()
+
+    published = json.loads((workdir / 'public' / 'news.json').read_text(encoding='utf-8'))
+    assert [item['link'] for item in published] == ['https://x.com/f/1']
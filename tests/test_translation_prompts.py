@@ -0,0 +1,20 @@
+import pytest
+
+import fetch_football_news as ffn
+
+
+@pytest.mark.parametrize('lang', ['ja', 'ko', 'es'])
+def test_transfer_prompt_uses_target_language_examples(lang, fake_openai):
+    client = fake_openai()
+    result = ffn.translate_title_with_ai('Here we go! Arsenal sign striker', client, lang)
+
+    prompt = client.prompts[0]
+    assert result[ffn.LANGUAGES[lang]['field']] == '译文 1'
+    assert ffn.LANGUAGES[lang]['transfer_phrases'] in prompt
+    assert '重磅' not in prompt and '官宣' not in prompt
+
+
+def test_chinese_transfer_prompt_keeps_chinese_examples(fake_openai):
+    client = fake_openai()
+    ffn.translate_title_with_ai('Here we go! Arsenal sign striker', client, 'zh-CN')
+    assert '"重磅！"、"官宣！"' in client.prompts[0]
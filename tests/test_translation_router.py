@@ -0,0 +1,89 @@
+import pytest
+
+import fetch_football_news as ffn
+
+
+@pytest.fixture
+def router(monkeypatch, fake_openai):
+    """开启路由翻译：OpenAI 使用 FakeOpenAI，免费翻译返回 "free <标题>"，返回运行函数"""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setattr(ffn, 'FREE_TRANSLATOR_AVAILABLE', True)
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+    monkeypatch.setattr(ffn, 'translate_title_free',
+                        lambda text, is_transfer, backend, lang, link=None: {'title_cn': f"free {text}"})
+
+    def run(items, fail=False, budget=None):
+        client = fake_openai(fail=fail)
+        monkeypatch.setattr(ffn, 'OpenAI', lambda **kwargs: client)
+        ffn.process_news_with_translation(items, translator_type='google', cache={},
+                                          use_router=True, budget=budget)
+        return client
+
+    return run
+
+
+def news():
+    return [
+        {'source': 'BBC Sport', 'title': 'Arsenal complete signing of striker'},
+        {'source': 'BBC Sport', 'title': 'Arsenal win again'},
+        {'source': 'Twitter - David_Ornstein', 'title': 'Team news update', 'like_count': 900,
+         'retweet_count': 200},
+    ]
+
+
+def test_needs_premium_translation():
+    assert ffn.needs_premium_translation({'is_transfer': True})
+    assert ffn.needs_premium_translation({'like_count': 800, 'retweet_count': 200}, engagement_threshold=1000)
+    assert not ffn.needs_premium_translation({'like_count': 999}, engagement_threshold=1000)
+    assert not ffn.needs_premium_translation({'like_count': None, 'retweet_count': None})
+
+
+def test_router_sends_transfers_and_popular_tweets_to_openai(router):
+    items = news()
+    client = router(items)
+
+    assert len(client.prompts) == 2
+    assert [item['translated_by']['title_cn'] for item in items] == ['openai', 'google', 'openai']
+    assert items[1]['title_cn'] == 'free Arsenal win again'
+
+
+def test_router_falls_back_when_openai_fails(router):
+    items = news()
+    router(items, fail=True)
+
+    assert [item['title_cn'] for item in items] == [f"free {item['title']}" for item in items]
+    assert all(item['translated_by']['title_cn'] == 'google' for item in items)
+
+
+def test_router_falls_back_when_budget_is_used_up(router):
+    items = news()
+    budget = ffn.create_openai_budget(max_requests=1)
+    client = router(items, budget=budget)
+
+    assert len(client.prompts) == 1 and budget['requests'] == 1
+    assert [item['translated_by']['title_cn'] for item in items] == ['openai', 'google', 'google']
+
+
+def test_summary_chunks_each_reserve_a_request(fake_openai):
+    summary = ' '.join(['A' * 1000 + '.'] * 3)
+    assert len(ffn.split_text_chunks(summary)) == 3
+
+    # 调用方已预占第一片；预算只够两次请求时第三片失败，整段返回原文
+    budget = ffn.create_openai_budget(max_requests=2)
+    assert ffn.reserve_openai_request(budget)
+    client = fake_openai()
+    assert ffn.translate_summary_with_ai(summary, client, 'zh-CN', budget) == summary
+    assert budget['requests'] == 2 and len(client.prompts) == 2
+
+    budget = ffn.create_openai_budget(max_requests=3)
+    assert ffn.reserve_openai_request(budget)
+    assert ffn.translate_summary_with_ai(summary, fake_openai(), 'zh-CN', budget) == '译文 1 译文 2 译文 3'
+    assert budget['requests'] == 3 and budget['prompt_tokens'] == 30
+
+
+def test_token_budget_stops_requests():
+    budget = ffn.create_openai_budget(max_tokens=100)
+    assert ffn.reserve_openai_request(budget)
+    budget['prompt_tokens'] = 100
+    assert not ffn.reserve_openai_request(budget)
+    assert ffn.reserve_openai_request(None)
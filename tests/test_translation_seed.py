@@ -0,0 +1,43 @@
+import fetch_football_news as ffn
+
+
+def test_seed_uses_recorded_backend_only():
+    previous = [{'title': 'Arsenal sign striker', 'title_cn': '阿森纳签下前锋',
+                 'translated_by': {'title_cn': 'google'}}]
+    cache = {}
+
+    assert ffn.seed_translation_cache(cache, previous, ['openai', 'google']) == 1
+    assert cache == {ffn.translation_cache_key('Arsenal sign striker', 'zh-CN', 'google'): '阿森纳签下前锋'}
+
+
+def test_seed_falls_back_to_given_backends_for_untagged_items():
+    previous = [{'title': 'Arsenal sign striker', 'title_cn': '阿森纳签下前锋'}]
+    cache = {}
+
+    ffn.seed_translation_cache(cache, previous, ['google'])
+    assert list(cache) == [ffn.translation_cache_key('Arsenal sign striker', 'zh-CN', 'google')]
+
+
+def test_translation_records_producing_backend(monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.setattr(ffn, 'FREE_TRANSLATOR_AVAILABLE', True)
+    monkeypatch.setattr(ffn, 'pause', lambda seconds: None)
+    monkeypatch.setattr(ffn, 'translate_title_free',
+                        lambda text, is_transfer, backend, lang, link=None: {'title_cn': f"译 {text}"})
+
+    items = [{'title': 'Arsenal win again', 'source': 'BBC Sport'}]
+    ffn.process_news_with_translation(items, use_free_translator=True, translator_type='google', cache={})
+
+    assert items[0]['title_cn'] == '译 Arsenal win again'
+    assert items[0]['translated_by'] == {'title_cn': 'google'}
+
+
+def test_language_editions_keep_only_their_backend_records(tmp_path):
+    items = [{'title': 'Arsenal win', 'title_cn': '阿森纳获胜', 'title_ja': 'アーセナル勝利',
+              'translated_by': {'title_cn': 'openai', 'title_ja': 'google'}}]
+    ffn.save_language_editions(items, ['ja'], str(tmp_path))
+
+    import json
+    edition = json.loads((tmp_path / 'news.ja.json').read_text(encoding='utf-8'))
+    assert edition[0]['translated_by'] == {'title_ja': 'google'}
+    assert 'title_cn' not in edition[0]